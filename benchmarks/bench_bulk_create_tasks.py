@@ -0,0 +1,85 @@
+"""Task import throughput: one CreateTask per task vs one BulkCreateTask per batch.
+
+Runs both use cases against the Django repositories on a throwaway test database
+(created and dropped by the script, using the usual POSTGRES_* variables) and
+reports tasks/s and the number of SQL statements for each path.
+
+    python benchmarks/bench_bulk_create_tasks.py --tasks 2000 --batch 500
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+
+def measure(operation, batches) -> dict:
+    from django.db import connection
+
+    queries = 0
+
+    def count(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count):
+        started = time.perf_counter()
+        tasks = sum(operation(batch) for batch in batches)
+        elapsed = time.perf_counter() - started
+    return {"tasks/s": tasks / elapsed, "queries": queries}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    import django
+    django.setup()
+    from django.db import connection
+
+    from src.core.tasks.application.use_cases.bulk_create_task import BulkCreateTask
+    from src.core.tasks.application.use_cases.create_task import CreateTask
+    from src.django_project.task_app.repository import DjangoOrmTaskRepository
+    from src.django_project.user_app.models import User as DjangoUserModel
+    from src.django_project.user_app.repository import DjangoORMUserRepository
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        user = DjangoUserModel.objects.create(username="bench-bulk", email="bench-bulk@gmail.com", password="x")
+        create = CreateTask(repository=DjangoOrmTaskRepository(), user_repository=DjangoORMUserRepository())
+        bulk = BulkCreateTask(
+            repository=DjangoOrmTaskRepository(),
+            user_repository=DjangoORMUserRepository(),
+            max_tasks=args.batch,
+        )
+        items = [
+            CreateTask.CreateTaskRequest(title=f"task {index:06d}", user_ids={user.id})
+            for index in range(args.tasks)
+        ]
+        batches = [items[start:start + args.batch] for start in range(0, len(items), args.batch)]
+
+        def one_by_one(batch):
+            for item in batch:
+                create.execute(item)
+            return len(batch)
+
+        def in_bulk(batch):
+            return bulk.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=batch)).created
+
+        for name, operation in (("CreateTask x N", one_by_one), ("BulkCreateTask", in_bulk)):
+            result = measure(operation, batches)
+            print(f"{name:>15}: tasks/s={result['tasks/s']:.0f}, queries={result['queries']}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
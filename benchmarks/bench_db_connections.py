@@ -0,0 +1,113 @@
+"""Latency of an authenticated GET /api/tasks/{id}/ with each way of handling connections.
+
+Calls the project's WSGI application in-process, so the request_started/finished
+signals open and close database connections exactly as they do behind a server.
+On a throwaway test database (created and dropped by the script, using the usual
+POSTGRES_* variables) it reports p50/p99 for `--requests` GETs with:
+
+- a new connection per request (POSTGRES_CONN_MAX_AGE=0),
+- persistent connections with health checks (the default),
+- psycopg's connection pool (POSTGRES_POOL=true; skipped unless psycopg 3 with the
+  "pool" extra is installed).
+
+The gap grows with the cost of a connection: run it against a remote or TLS-only
+server, or through PgBouncer, for figures closer to production.
+
+    python benchmarks/bench_db_connections.py --requests 2000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+
+def call(application, request_factory, method, path, body=None, token=None):
+    extra = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+    if body is None:
+        request = getattr(request_factory, method)(path, **extra)
+    else:
+        request = getattr(request_factory, method)(path, data=json.dumps(body), content_type="application/json", **extra)
+    status = []
+    chunks = application(request.environ, lambda code, headers, *args: status.append(code))
+    try:
+        content = b"".join(chunks)
+    finally:
+        # Closing the response fires request_finished, which closes expired connections.
+        getattr(chunks, "close", lambda: None)()
+    return status[0], content
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    import django
+    django.setup()
+    from django.core.wsgi import get_wsgi_application
+    from django.db import connection, connections
+    from django.test import RequestFactory
+
+    try:
+        import psycopg_pool  # noqa: F401
+        pooling = True
+    except ImportError:
+        pooling = False
+
+    application = get_wsgi_application()
+    request_factory = RequestFactory(SERVER_NAME="localhost")
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        user = {"username": "bench-conn", "password": "securepassword123", "email": "bench-conn@gmail.com"}
+        call(application, request_factory, "post", "/api/users/", user)
+        _, content = call(application, request_factory, "post", "/auth/login/", user)
+        token = json.loads(content)["token"]
+        _, content = call(application, request_factory, "post", "/api/tasks/", {"title": "Bench"}, token)
+        path = f"/api/tasks/{json.loads(content)['id']}/"
+
+        modes = [
+            ("new connection per request", {"CONN_MAX_AGE": 0}),
+            ("persistent + health checks", {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True}),
+        ]
+        if pooling:
+            modes.append(("psycopg pool", {
+                "CONN_MAX_AGE": 0,
+                "OPTIONS": {"pool": {"min_size": 2, "max_size": 4, "timeout": 10}},
+            }))
+        else:
+            print("psycopg pool: skipped, install psycopg[binary,pool] to measure it")
+
+        for name, overrides in modes:
+            connections.close_all()
+            connection.settings_dict.update(overrides)
+            for _ in range(50):
+                call(application, request_factory, "get", path, token=token)
+
+            latencies = []
+            for _ in range(args.requests):
+                started = time.perf_counter()
+                status, _ = call(application, request_factory, "get", path, token=token)
+                latencies.append((time.perf_counter() - started) * 1000)
+                assert status.startswith("200"), status
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(f"{name:>27}: p50={quantiles[49]:.2f}ms, p99={quantiles[98]:.2f}ms")
+
+            connections.close_all()
+            if "OPTIONS" in overrides:
+                connection.close_pool()
+                connection.settings_dict["OPTIONS"] = {}
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
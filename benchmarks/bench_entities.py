@@ -0,0 +1,82 @@
+"""Cost of hydrating Task entities the way the repositories do.
+
+Builds `--tasks` Task entities from row-like values (id, title, description, status,
+timestamps and one assigned user) and reports construction time and traced memory
+per task, plus the size of the entity object itself and what hangs off it (instance
+dict, Notification and its error list, when present). Row values are created up
+front, so only what hydration allocates is measured.
+
+    python benchmarks/bench_entities.py --tasks 1000000
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def own_size(task) -> int:
+    """Bytes of the entity and of the per-entity objects it owns, not of the field values."""
+    size = sys.getsizeof(task)
+    if hasattr(task, "__dict__"):
+        size += sys.getsizeof(task.__dict__)
+    notification = getattr(task, "_notification", None) or getattr(task, "__dict__", {}).get("notification")
+    if notification is not None:
+        size += sys.getsizeof(notification) + sys.getsizeof(notification.errors)
+        if hasattr(notification, "__dict__"):
+            size += sys.getsizeof(notification.__dict__)
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from src.core.tasks.domain.tasks import Task, TaskStatus
+
+    now = datetime.now()
+    owner = uuid.uuid4()
+    rows = [(uuid.uuid4(), f"task {index:07d}") for index in range(args.tasks)]
+
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    tasks = [
+        Task(
+            id=task_id, title=title, description="", status=TaskStatus.PENDING,
+            created_at=now, updated_at=now, users={owner},
+        )
+        for task_id, title in rows
+    ]
+    elapsed = time.perf_counter() - started
+    gc.enable()
+    del tasks
+
+    gc.collect()
+    tracemalloc.start()
+    tasks = [
+        Task(
+            id=task_id, title=title, description="", status=TaskStatus.PENDING,
+            created_at=now, updated_at=now, users={owner},
+        )
+        for task_id, title in rows
+    ]
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{args.tasks} tasks: {elapsed / args.tasks * 1e6:.2f}us/task ({elapsed:.2f}s), "
+        f"traced={traced / args.tasks:.0f}B/task ({traced / 1024 / 1024:.0f}MiB), "
+        f"entity+owned={own_size(tasks[0])}B, __dict__={hasattr(tasks[0], '__dict__')}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""InMemoryTaskRepository operation latency as the store grows to 1M tasks.
+
+Fills the repository with SIZE tasks spread over USERS users (with and without
+the sorted `title` index), then times each operation on random tasks and users.
+Flat numbers across sizes mean the operation does not scan the store. With
+`--users 1` every task shares one sorted index, the worst case for `update` and
+`delete`, which shift the keys of that index.
+
+    python benchmarks/bench_in_memory_task_repository.py --sizes 10000,100000,1000000 --users 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.tasks.domain.tasks import Task  # noqa: E402
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository  # noqa: E402
+
+
+def timed(operation, arguments) -> float:
+    """Mean microseconds per call of `operation` over `arguments`."""
+    started = time.perf_counter()
+    for argument in arguments:
+        operation(argument)
+    return (time.perf_counter() - started) / len(arguments) * 1_000_000
+
+
+def run(size: int, users: int, sorted_fields, samples: int) -> dict:
+    rng = random.Random(size)
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    tasks = [
+        Task(title=f"task {rng.randrange(size):08d}", description="", users={rng.choice(user_ids)})
+        for _ in range(size)
+    ]
+
+    started = time.perf_counter()
+    repository = InMemoryTaskRepository(tasks, sorted_fields=sorted_fields)
+    load_s = time.perf_counter() - started
+
+    picked_tasks = rng.sample(tasks, samples)
+    picked_users = [rng.choice(user_ids) for _ in range(samples)]
+
+    def update(task):
+        task.title = f"task {rng.randrange(size):08d}"
+        repository.update(task)
+
+    result = {
+        "load s": load_s,
+        "get_by_id us": timed(lambda task: repository.get_by_id(task.id), picked_tasks),
+        "update us": timed(update, picked_tasks),
+        "list(user) us": timed(repository.list, picked_users),
+        "list_page us": timed(lambda user_id: repository.list_page(user_id, "title", 40, 20), picked_users),
+        "list_after us": timed(
+            lambda user_id: repository.list_after(user_id, "title", ("task 00500000", uuid.UUID(int=0)), 20),
+            picked_users,
+        ),
+        "delete us": timed(lambda task: repository.delete(task.id), picked_tasks),
+    }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--samples", type=int, default=1000)
+    args = parser.parse_args()
+
+    for size in (int(size) for size in args.sizes.split(",")):
+        for sorted_fields in ((), ("title",)):
+            result = run(size, args.users, sorted_fields, args.samples)
+            label = f"{size:>8} tasks, sorted={','.join(sorted_fields) or '-':<5}"
+            print(f"{label}: " + ", ".join(f"{key}={value:.1f}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
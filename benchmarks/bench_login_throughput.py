@@ -0,0 +1,79 @@
+"""Login throughput under concurrent load, inline bcrypt vs the bounded hashing pool.
+
+Simulates a threaded worker (CLIENTS concurrent requests) running AuthenticateUser
+against an in-memory repository, first hashing inline in each request thread and
+then through PooledPasswordHasher. Reports logins/s, latency percentiles and how
+many requests were shed with HasherBusy (answered as 503 by the views).
+
+    python benchmarks/bench_login_throughput.py --clients 32 --requests 256
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher  # noqa: E402
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy, PooledPasswordHasher  # noqa: E402
+from src.adapters.jwt.jwt_adapter import JWTAdapter  # noqa: E402
+from src.core.user.application.use_cases.authenticate_user import AuthenticateUser  # noqa: E402
+from src.core.user.domain.user import User  # noqa: E402
+from src.core.user.infra.in_memory_user_repository import InMemoryUserRepository  # noqa: E402
+
+
+def run(hasher, repository, clients: int, requests: int) -> dict:
+    use_case = AuthenticateUser(
+        repository=repository,
+        jwt_adapter=JWTAdapter(secret_key="benchmark-secret-key-of-at-least-32-bytes"),
+        hash_adapter=hasher,
+    )
+    request = AuthenticateUser.AuthenticateUserRequest(username="bench", password="securepassword123")
+
+    def login(_):
+        started = time.perf_counter()
+        try:
+            use_case.execute(request)
+            return time.perf_counter() - started, True
+        except HasherBusy:
+            return time.perf_counter() - started, False
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results = list(pool.map(login, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, ok in results if ok)
+    served = len(latencies)
+    return {
+        "served": served,
+        "shed": requests - served,
+        "logins/s": served / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99 ms": latencies[int(served * 0.99) - 1] * 1000 if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--pending", type=int, default=32)
+    args = parser.parse_args()
+
+    inline = BcryptPasswordHasher()
+    repository = InMemoryUserRepository()
+    repository.save(User(username="bench", email="bench@gmail.com", password=inline.hash("securepassword123")))
+
+    pooled = PooledPasswordHasher(inline, max_workers=args.workers, max_pending=args.pending)
+    for name, hasher in (("inline", inline), (f"pooled({args.workers}+{args.pending})", pooled)):
+        result = run(hasher, repository, args.clients, args.requests)
+        print(f"{name:>20}: " + ", ".join(f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}" for key, value in result.items()))
+    pooled.shutdown()
+
+
+if __name__ == "__main__":
+    main()
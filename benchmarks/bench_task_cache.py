@@ -0,0 +1,115 @@
+"""GetTask and ListTask on the Django repository vs the cached repository.
+
+On a throwaway test database (created and dropped by the script, using the usual
+POSTGRES_* variables) it reports, for `--reads` sequential GetTask calls on one task
+and as many ListTask calls for the same page of a user's `--tasks` tasks, calls/s and
+SQL statements with and without CachedTaskRepository (task and list caches). Then `--threads`
+threads ask for the same cold task at once to show how many database fetches the
+single-flight guard lets through.
+
+    python benchmarks/bench_task_cache.py --reads 2000 --tasks 500 --threads 32
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=32)
+    args = parser.parse_args()
+
+    import django
+    django.setup()
+    from django.db import connection, connections
+
+    from src.adapters.cache.lru_cache_adapter import LRUCacheAdapter
+    from src.core.tasks.application.use_cases.get_task import GetTask
+    from src.core.tasks.application.use_cases.list_task import ListTask
+    from src.core.tasks.domain.tasks import Task
+    from src.core.tasks.infra.cached_task_repository import CachedTaskRepository
+    from src.django_project.task_app.repository import DjangoOrmTaskRepository
+    from src.django_project.user_app.models import User as DjangoUserModel
+
+    class SlowRepository(DjangoOrmTaskRepository):
+        """Adds a fixed delay to each fetch so concurrent misses overlap like a loaded database."""
+
+        fetches = 0
+
+        def get_by_id(self, task_id):
+            SlowRepository.fetches += 1
+            time.sleep(0.05)
+            try:
+                return super().get_by_id(task_id)
+            finally:
+                connections.close_all()
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        user = DjangoUserModel.objects.create(username="bench-cache", email="bench-cache@gmail.com", password="x")
+        task = DjangoOrmTaskRepository().save(Task(title="Hot task", description="", users={user.id}))
+        DjangoOrmTaskRepository().save_many([
+            Task(title=f"task {index:05d}", description="", users={user.id}) for index in range(args.tasks - 1)
+        ])
+
+        for name, repository, use_case, request in (
+            (name, repository, use_case(repository=repository), request)
+            for use_case, request in (
+                (GetTask, GetTask.GetTaskRequest(task_id=task.id)),
+                (ListTask, ListTask.ListTaskRequest(user_id=user.id, order_by="created_at", page=3, size=20)),
+            )
+            for name, repository in (
+                ("DjangoOrmTaskRepository", DjangoOrmTaskRepository()),
+                ("CachedTaskRepository", CachedTaskRepository(
+                    DjangoOrmTaskRepository(), LRUCacheAdapter(), LRUCacheAdapter()
+                )),
+            )
+        ):
+            queries = 0
+
+            def count(execute, sql, params, many, context):
+                nonlocal queries
+                queries += 1
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(count):
+                started = time.perf_counter()
+                for _ in range(args.reads):
+                    use_case.execute(request)
+                elapsed = time.perf_counter() - started
+            print(f"{type(use_case).__name__:>8} {name:>24}: calls/s={args.reads / elapsed:.0f}, queries={queries}")
+
+        for name, repository in (
+            ("no cache", SlowRepository()),
+            ("cache + single-flight", CachedTaskRepository(SlowRepository(), LRUCacheAdapter())),
+        ):
+            SlowRepository.fetches = 0
+            barrier = threading.Barrier(args.threads)
+
+            def read():
+                barrier.wait()
+                repository.get_by_id(task.id)
+
+            threads = [threading.Thread(target=read) for _ in range(args.threads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            print(f"{args.threads} concurrent cold reads, {name:>21}: database fetches={SlowRepository.fetches}")
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Streaming export of a user's tasks: time to first byte and peak memory vs task count.
+
+Seeds SIZES tasks for one user on a throwaway test database (created and dropped by
+the script, using the usual POSTGRES_* variables), then consumes the NDJSON export
+stream built by the view (ExportTasks + stream_tasks_ndjson). Constant peak memory
+(`--trace-memory`) and first-byte latency across sizes mean the export does not
+materialise the tasks.
+
+    python benchmarks/bench_task_export.py --sizes 1000,10000,100000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--trace-memory", action="store_true", help="report peak memory (tracemalloc, much slower)")
+    args = parser.parse_args()
+
+    import django
+    django.setup()
+    from django.db import connection
+
+    from src.core.tasks.application.use_cases.bulk_create_task import BulkCreateTask
+    from src.core.tasks.application.use_cases.create_task import CreateTask
+    from src.core.tasks.application.use_cases.export_tasks import ExportTasks
+    from src.django_project.task_app.renderers import stream_tasks_ndjson
+    from src.django_project.task_app.repository import DjangoOrmTaskRepository
+    from src.django_project.user_app.models import User as DjangoUserModel
+    from src.django_project.user_app.repository import DjangoORMUserRepository
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        user = DjangoUserModel.objects.create(username="bench-export", email="bench-export@gmail.com", password="x")
+        bulk = BulkCreateTask(repository=DjangoOrmTaskRepository(), user_repository=DjangoORMUserRepository())
+        export = ExportTasks(repository=DjangoOrmTaskRepository())
+        seeded = 0
+        for size in (int(size) for size in args.sizes.split(",")):
+            while seeded < size:
+                batch = min(500, size - seeded)
+                bulk.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=[
+                    CreateTask.CreateTaskRequest(title=f"task {seeded + index:07d}", user_ids={user.id})
+                    for index in range(batch)
+                ]))
+                seeded += batch
+
+            if args.trace_memory:
+                tracemalloc.start()
+            started = time.perf_counter()
+            stream = stream_tasks_ndjson(export.execute(
+                ExportTasks.ExportTasksRequest(user_id=user.id, chunk_size=args.chunk_size)
+            ).tasks)
+            sent = len(next(stream))
+            first_byte = time.perf_counter() - started
+            sent += sum(len(chunk) for chunk in stream)
+            total = time.perf_counter() - started
+            memory = ""
+            if args.trace_memory:
+                memory = f", peak={tracemalloc.get_traced_memory()[1] / 1024 / 1024:.1f}MiB"
+                tracemalloc.stop()
+            print(
+                f"{size:>8} tasks: first byte={first_byte * 1000:.1f}ms, total={total:.2f}s, "
+                f"rows/s={size / total:.0f}, body={sent / 1024 / 1024:.1f}MiB{memory}"
+            )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Cost of the per-task HATEOAS links of GET /api/tasks, per `links` mode.
+
+Lists one page through ListTask against an in-memory repository and reports the
+time to build the response, the time to JSON encode it and the bytes allocated
+while building it (tracemalloc), for `links=full`, `minimal` and `none`.
+
+    python benchmarks/bench_task_links.py --size 100 --rounds 200
+"""
+import argparse
+import dataclasses
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.tasks.application.use_cases.list_task import ListTask  # noqa: E402
+from src.core.tasks.domain.tasks import Task  # noqa: E402
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository  # noqa: E402
+
+
+def measure(use_case, request, rounds: int) -> dict:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        response = use_case.execute(request)
+    build = (time.perf_counter() - started) / rounds
+
+    payload = dataclasses.asdict(response)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        body = json.dumps(payload, default=str)
+    encode = (time.perf_counter() - started) / rounds
+
+    tracemalloc.start()
+    use_case.execute(request)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "build ms": build * 1000,
+        "encode ms": encode * 1000,
+        "peak KiB": peak / 1024,
+        "body KiB": len(body) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    user_id = uuid.uuid4()
+    repository = InMemoryTaskRepository(
+        [Task(title=f"task {index:04d}", description="bench", users={user_id}) for index in range(args.size)]
+    )
+    use_case = ListTask(repository)
+    for mode in ("full", "minimal", "none"):
+        request = ListTask.ListTaskRequest(size=args.size, user_id=user_id, links=mode)
+        result = measure(use_case, request, args.rounds)
+        print(f"links={mode:>7}: " + ", ".join(f"{key}={value:.2f}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Rendering a GET /api/tasks page: DRF serializers vs the fast-path renderer.
+
+Builds a ListTask response over an in-memory repository and times
+`JSONRenderer().render(TaskListResponseSerializer(response).data)` against
+`render_task_list(response)`, checking both produce the same bytes.
+
+    python benchmarks/bench_task_list_render.py --size 100 --rounds 200
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from src.core.tasks.application.use_cases.list_task import ListTask  # noqa: E402
+from src.core.tasks.domain.tasks import Task  # noqa: E402
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository  # noqa: E402
+from src.django_project.task_app.renderers import render_task_list  # noqa: E402
+from src.django_project.task_app.serializers import TaskListResponseSerializer  # noqa: E402
+
+
+def timed(render, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        render()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    user_id = uuid.uuid4()
+    repository = InMemoryTaskRepository(
+        [Task(title=f"task {index:04d}", description="bench", users={user_id}) for index in range(args.size)]
+    )
+    for links in ("full", "none"):
+        response = ListTask(repository).execute(ListTask.ListTaskRequest(size=args.size, user_id=user_id, links=links))
+
+        def serializer():
+            return JSONRenderer().render(TaskListResponseSerializer(instance=response).data)
+
+        def fast():
+            return render_task_list(response)
+
+        assert serializer() == fast()
+        slow_ms, fast_ms = timed(serializer, args.rounds), timed(fast, args.rounds)
+        print(f"links={links:>4}: serializer={slow_ms:.2f} ms, fast={fast_ms:.2f} ms, speedup={slow_ms / fast_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Task search latency vs task count: search indexes vs scanning the tasks.
+
+Seeds SIZES tasks with random words for one user and times the same one-word and
+two-word queries with:
+
+- PostgresTaskSearchIndex (GIN on the generated tsvector) vs an `icontains` scan,
+  on a throwaway test database (created and dropped by the script, using the usual
+  POSTGRES_* variables);
+- InMemoryTaskSearchIndex vs a linear scan of InMemoryTaskRepository.
+
+    python benchmarks/bench_task_search.py --sizes 1000,10000,50000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+VOCABULARY = [f"word{index}" for index in range(2000)]
+QUERIES = ["word7", "word7 word11"]
+
+
+def median_ms(operation, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, k=words))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--skip-db", action="store_true", help="only run the in-memory comparison")
+    args = parser.parse_args()
+
+    import django
+    django.setup()
+    from django.db import connection
+    from django.db.models import Q
+
+    from src.core.tasks.domain.tasks import Task
+    from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
+    from src.core.tasks.infra.in_memory_task_search_index import InMemoryTaskSearchIndex, tokenize
+    from src.django_project.task_app.models import Task as DjangoTaskModel
+    from src.django_project.task_app.repository import DjangoOrmTaskRepository
+    from src.django_project.task_app.search_index import PostgresTaskSearchIndex
+    from src.django_project.user_app.models import User as DjangoUserModel
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    def in_memory_scan(repository, user_id, query):
+        words = set(tokenize(query))
+        return [
+            task for task in repository.list(user_id)
+            if words <= set(tokenize(f"{task.title} {task.description}"))
+        ][:10]
+
+    rng = random.Random(42)
+    user_id = uuid.uuid4()
+    repository = InMemoryTaskRepository(search_index=InMemoryTaskSearchIndex())
+    for size in sizes:
+        while len(repository.tasks_by_id) < size:
+            repository.save(Task(title=random_text(rng, 3), description=random_text(rng, 12), users={user_id}))
+        for query in QUERIES:
+            indexed = median_ms(lambda: repository.search_index.search(user_id, query, 0, 10), args.repeat)
+            scanned = median_ms(lambda: in_memory_scan(repository, user_id, query), max(1, args.repeat // 5))
+            print(f"in-memory {size:>7} tasks {query!r:>15}: index={indexed:.2f}ms scan={scanned:.2f}ms")
+
+    if args.skip_db:
+        return
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        rng = random.Random(42)
+        user = DjangoUserModel.objects.create(username="bench-search", email="bench-search@gmail.com", password="x")
+        repository = DjangoOrmTaskRepository()
+        search_index = PostgresTaskSearchIndex()
+        seeded = 0
+        for size in sizes:
+            while seeded < size:
+                batch = min(1000, size - seeded)
+                repository.save_many([
+                    Task(title=random_text(rng, 3), description=random_text(rng, 12), users={user.id})
+                    for _ in range(batch)
+                ])
+                seeded += batch
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE "Task", "Task_users"')
+            for query in QUERIES:
+                def scan():
+                    queryset = DjangoTaskModel.objects.filter(users__id=user.id)
+                    for word in query.split():
+                        queryset = queryset.filter(Q(title__icontains=word) | Q(description__icontains=word))
+                    return list(queryset.order_by("id")[:10]), queryset.count()
+
+                indexed = median_ms(lambda: search_index.search(user.id, query, 0, 10), args.repeat)
+                scanned = median_ms(scan, max(1, args.repeat // 5))
+                print(f"postgres  {size:>7} tasks {query!r:>15}: index={indexed:.2f}ms icontains={scanned:.2f}ms")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
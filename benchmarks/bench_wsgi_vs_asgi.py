@@ -0,0 +1,150 @@
+"""WSGI vs ASGI throughput for the task list endpoint at the same CPU budget.
+
+Starts the project twice on the same set of CPUs: gunicorn sync workers serving
+the DRF `/api/tasks/` view, then uvicorn workers serving the async
+`/api/async/tasks/` view. Each server is loaded with CLIENTS concurrent
+keep-alive connections. Reports requests/s and latency percentiles. Requires
+gunicorn and uvicorn (not project dependencies) and the database configured
+through the usual POSTGRES_* variables.
+
+    python benchmarks/bench_wsgi_vs_asgi.py --cpus 0,1 --workers 2 --clients 64 --requests 4000
+"""
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+
+def seed(tasks: int) -> str:
+    """Create the benchmark user with `tasks` tasks and return a bearer token for it."""
+    import django
+    django.setup()
+
+    import jwt
+    from django.conf import settings
+    from src.django_project.task_app.models import Task as DjangoTaskModel
+    from src.django_project.user_app.models import User as DjangoUserModel
+
+    user, _ = DjangoUserModel.objects.get_or_create(
+        username="bench-asgi", defaults={"email": "bench-asgi@gmail.com", "password": "x"}
+    )
+    missing = tasks - DjangoTaskModel.objects.filter(users=user).count()
+    for index in range(max(missing, 0)):
+        task = DjangoTaskModel.objects.create(title=f"task {index:06d}", description="")
+        task.users.add(user)
+
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    return jwt.encode(
+        {"user_id": str(user.id), "exp": int(expires_at.timestamp())},
+        settings.SECRET_KEY,
+        algorithm="HS256",
+    )
+
+
+def start_server(command, cpus):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([ROOT, os.path.join(ROOT, "src")])}
+    return subprocess.Popen(
+        command,
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        preexec_fn=(lambda: os.sched_setaffinity(0, cpus)) if cpus else None,
+    )
+
+
+def wait_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/api/tasks/")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def load(port: int, path: str, token: str, clients: int, requests: int) -> dict:
+    per_client = requests // clients
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def client(_):
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        latencies, errors = [], 0
+        for _ in range(per_client):
+            started = time.perf_counter()
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - started)
+            errors += response.status != 200
+        connection.close()
+        return latencies, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results = list(pool.map(client, range(clients)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for client_latencies, _ in results for latency in client_latencies)
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors for _, errors in results),
+        "req/s": len(latencies) / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p99 ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cpus", default="", help="comma separated CPU ids both servers are pinned to")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    cpus = {int(cpu) for cpu in args.cpus.split(",") if cpu}
+    token = seed(args.tasks)
+    servers = (
+        (
+            f"wsgi gunicorn x{args.workers}",
+            ["gunicorn", "django_project.wsgi:application", "--workers", str(args.workers),
+             "--bind", f"127.0.0.1:{args.port}"],
+            "/api/tasks/?size=20",
+        ),
+        (
+            f"asgi uvicorn x{args.workers}",
+            ["uvicorn", "django_project.asgi:application", "--workers", str(args.workers),
+             "--port", str(args.port), "--no-access-log"],
+            "/api/async/tasks/?size=20",
+        ),
+    )
+    for name, command, path in servers:
+        server = start_server(command, cpus)
+        try:
+            wait_ready(args.port)
+            load(args.port, path, token, args.clients, args.clients * 4)
+            result = load(args.port, path, token, args.clients, args.requests)
+        finally:
+            server.terminate()
+            server.wait()
+        print(f"{name:>22}: " + ", ".join(f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
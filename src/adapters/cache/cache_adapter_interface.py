@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+class CacheAdapterInterface(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """
+        Returns the value stored under a key.
+        
+        :param key: The cache key.
+        :return: The cached value, or None when the key is missing or expired.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value under a key.
+        
+        :param key: The cache key.
+        :param value: The value to store. None cannot be told apart from a miss.
+        :param ttl: Time to live in seconds, or None to use the adapter default.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes a key from the cache, if present.
+        
+        :param key: The cache key.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every key from the cache."""
+        raise NotImplementedError("This method should be overridden by subclasses.")
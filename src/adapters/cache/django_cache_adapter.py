@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+from django.core.cache import caches
+
+from src.adapters.cache.cache_adapter_interface import CacheAdapterInterface
+
+class DjangoCacheAdapter(CacheAdapterInterface):
+    """Cache backed by one of Django's configured caches, so it can be shared between processes."""
+
+    def __init__(self, alias: str = 'default', key_prefix: str = '', ttl: float = 300):
+        self.alias = alias
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key: str) -> Any:
+        return self.cache.get(self.key_prefix + key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.cache.set(self.key_prefix + key, value, timeout=self.ttl if ttl is None else ttl)
+
+    def delete(self, key: str) -> None:
+        self.cache.delete(self.key_prefix + key)
+
+    def clear(self) -> None:
+        """Clears the whole underlying Django cache, not only the keys under this prefix."""
+        self.cache.clear()
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+class CursorAdapterInterface(ABC):
+    @abstractmethod
+    def encode(self, payload: dict) -> str:
+        """
+        Encodes a pagination position into an opaque cursor.
+        
+        :param payload: JSON serializable data describing the last seen row.
+        :return: An opaque, URL safe cursor as a string.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    @abstractmethod
+    def decode(self, cursor: str) -> dict:
+        """
+        Decodes a cursor back into its payload.
+        
+        :param cursor: The cursor to decode.
+        :return: The decoded payload as a dictionary.
+        :raises ValueError: If the cursor is malformed or was tampered with.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
@@ -0,0 +1,42 @@
+import base64
+import hashlib
+import hmac
+import json
+
+from src.adapters.cursor.cursor_adapter_interface import CursorAdapterInterface
+
+class SignedCursorAdapter(CursorAdapterInterface):
+    def __init__(self, secret_key: str, salt: str = 'pagination-cursor'):
+        self.key = hashlib.sha256(f"{salt}:{secret_key}".encode()).digest()
+
+    def encode(self, payload: dict) -> str:
+        data = json.dumps(payload, separators=(',', ':'), sort_keys=True).encode()
+        return f"{self._b64encode(data)}.{self._b64encode(self._sign(data))}"
+
+    def decode(self, cursor: str) -> dict:
+        try:
+            data_part, signature_part = cursor.split('.')
+            data = self._b64decode(data_part)
+            signature = self._b64decode(signature_part)
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+        if not hmac.compare_digest(signature, self._sign(data)):
+            raise ValueError("Invalid cursor")
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            raise ValueError("Invalid cursor")
+        if not isinstance(payload, dict):
+            raise ValueError("Invalid cursor")
+        return payload
+
+    def _sign(self, data: bytes) -> bytes:
+        return hmac.new(self.key, data, hashlib.sha256).digest()
+
+    @staticmethod
+    def _b64encode(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+    @staticmethod
+    def _b64decode(data: str) -> bytes:
+        return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
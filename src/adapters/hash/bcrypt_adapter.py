@@ -3,8 +3,21 @@ from src.adapters.hash.hash_adapter_interface import PasswordHasherInterface
 
 
 class BcryptPasswordHasher(PasswordHasherInterface):
+    def __init__(self, rounds: int = 12) -> None:
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        self.rounds = rounds
+
     def hash(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=self.rounds)).decode()
     
     def verify(self, password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """A hash needs rehashing when it was made with another cost than `rounds`."""
+        try:
+            _, _, cost, _ = hashed_password.split("$", 3)
+            return int(cost) != self.rounds
+        except ValueError:
+            return False
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -9,3 +10,15 @@ class PasswordHasherInterface(ABC):
     @abstractmethod
     def verify(self, password: str, hashed_password: str) -> bool:
         pass
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a hash was made with outdated parameters and should be replaced."""
+        return False
+
+    async def ahash(self, password: str) -> str:
+        """Hash without blocking the event loop."""
+        return await asyncio.to_thread(self.hash, password)
+
+    async def averify(self, password: str, hashed_password: str) -> bool:
+        """Verify without blocking the event loop."""
+        return await asyncio.to_thread(self.verify, password, hashed_password)
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.adapters.hash.hash_adapter_interface import PasswordHasherInterface
+
+
+class HasherBusy(Exception):
+    """Raised when the hashing queue is full and the caller should back off."""
+
+
+class PooledPasswordHasher(PasswordHasherInterface):
+    """Runs another hasher on a bounded worker pool.
+
+    At most `max_workers` hashes run at the same time and at most
+    `max_pending` more wait for a worker; anything beyond that fails
+    fast with `HasherBusy` instead of queueing forever.
+    """
+
+    def __init__(
+        self,
+        hasher: PasswordHasherInterface,
+        max_workers: int = 2,
+        max_pending: int = 16,
+        use_processes: bool = False,
+    ) -> None:
+        if max_workers < 1 or max_pending < 0:
+            raise ValueError("max_workers must be positive and max_pending non negative")
+        self.hasher = hasher
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if use_processes
+            else ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def hash(self, password: str) -> str:
+        return self._submit(self.hasher.hash, password).result()
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._submit(self.hasher.verify, password, hashed_password).result()
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self.hasher.needs_rehash(hashed_password)
+
+    async def ahash(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit(self.hasher.hash, password))
+
+    async def averify(self, password: str, hashed_password: str) -> bool:
+        return await asyncio.wrap_future(
+            self._submit(self.hasher.verify, password, hashed_password)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy("Password hashing queue is full, try again later.")
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
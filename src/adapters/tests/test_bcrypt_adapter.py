@@ -0,0 +1,28 @@
+import pytest
+
+from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher
+
+
+class TestBcryptPasswordHasher:
+    def test_hash_uses_configured_rounds(self):
+        hasher = BcryptPasswordHasher(rounds=4)
+
+        hashed = hasher.hash("secret")
+
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify("secret", hashed)
+
+    def test_rejects_rounds_out_of_range(self):
+        with pytest.raises(ValueError):
+            BcryptPasswordHasher(rounds=3)
+        with pytest.raises(ValueError):
+            BcryptPasswordHasher(rounds=32)
+
+    def test_needs_rehash_when_cost_differs(self):
+        old_hash = BcryptPasswordHasher(rounds=4).hash("secret")
+
+        assert BcryptPasswordHasher(rounds=5).needs_rehash(old_hash)
+        assert not BcryptPasswordHasher(rounds=4).needs_rehash(old_hash)
+
+    def test_needs_rehash_ignores_unknown_format(self):
+        assert not BcryptPasswordHasher(rounds=4).needs_rehash("not-a-bcrypt-hash")
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher
+from src.adapters.hash.hash_adapter_interface import PasswordHasherInterface
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy, PooledPasswordHasher
+
+
+class BlockingHasher(PasswordHasherInterface):
+    """Hasher that holds its worker until released, to fill the pool on purpose."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.release.wait(timeout=5)
+        return f"hashed:{password}"
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return hashed_password == f"hashed:{password}"
+
+
+class TestPooledPasswordHasher:
+    def test_hash_and_verify_run_on_the_pool(self):
+        hasher = PooledPasswordHasher(BcryptPasswordHasher(), max_workers=2, max_pending=2)
+
+        hashed = hasher.hash("securepassword123")
+
+        assert hasher.verify("securepassword123", hashed)
+        assert not hasher.verify("wrongpassword123", hashed)
+        hasher.shutdown()
+
+    def test_full_queue_fails_fast(self):
+        inner = BlockingHasher()
+        hasher = PooledPasswordHasher(inner, max_workers=1, max_pending=1)
+        running = [hasher._submit(inner.hash, "one"), hasher._submit(inner.hash, "two")]
+
+        with pytest.raises(HasherBusy):
+            hasher.hash("three")
+
+        inner.release.set()
+        assert [future.result() for future in running] == ["hashed:one", "hashed:two"]
+        assert hasher.hash("four") == "hashed:four"
+        hasher.shutdown()
+
+    def test_async_variants_can_be_awaited(self):
+        hasher = PooledPasswordHasher(BcryptPasswordHasher(), max_workers=1, max_pending=0)
+
+        async def login():
+            hashed = await hasher.ahash("securepassword123")
+            return await hasher.averify("securepassword123", hashed)
+
+        assert asyncio.run(login())
+        hasher.shutdown()
@@ -1,17 +1,32 @@
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from typing import Optional
 from uuid import UUID
 
 from src.core._shared.notification import Notification
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Entity(ABC):
-    """Base class for all entities in the domain model."""
+    """Base class for all entities in the domain model.
+
+    Entities are slotted (subclasses must pass `slots=True` to `@dataclass` too) and
+    only get a Notification once an error is added, since most are valid.
+    """
 
     id: UUID = field(default_factory=uuid.uuid4)
-    notification: Notification = field(default_factory=Notification)
+    _notification: Optional[Notification] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def notification(self) -> Notification:
+        if self._notification is None:
+            self._notification = Notification()
+        return self._notification
+
+    def has_errors(self) -> bool:
+        """Whether validation added errors, without creating the Notification."""
+        return self._notification is not None and self._notification.has_errors()
 
     def __eq__(self, value):
         if not isinstance(value, self.__class__):
@@ -0,0 +1,92 @@
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+LINKS_NONE = "none"
+LINKS_MINIMAL = "minimal"
+LINKS_FULL = "full"
+LINKS_MODES = (LINKS_NONE, LINKS_MINIMAL, LINKS_FULL)
+
+
+class InvalidLinksMode(Exception):
+    pass
+
+
+class LinkBuilder:
+    """Renders the HATEOAS links of one kind of resource from precomputed templates.
+
+    Templates are given once, as the links of a resource with `{id}` in place of its
+    id. Strings without `{id}` and nested dicts (request bodies, query params) are
+    shared by every rendered link, so they must be treated as read-only. Rendering
+    only concatenates the id into the hrefs.
+
+    Modes: `full` renders every link, `minimal` only `self`, `none` nothing.
+    """
+
+    def __init__(self, templates: Mapping[str, Any]) -> None:
+        self._full = self._compile(dict(templates))
+        self._self = self._compile(templates["self"]) if "self" in templates else None
+
+    @staticmethod
+    def validate_mode(mode: Optional[str]) -> str:
+        if mode is None:
+            return LINKS_FULL
+        if mode not in LINKS_MODES:
+            raise InvalidLinksMode(f"links must be one of: {', '.join(LINKS_MODES)}")
+        return mode
+
+    def render(self, resource_id: Any, mode: str = LINKS_FULL) -> Dict[str, Any]:
+        if mode == LINKS_NONE:
+            return {}
+        resource_id = str(resource_id)
+        if mode == LINKS_MINIMAL:
+            return {"self": self._fill(self._self, resource_id)} if self._self is not None else {}
+        return self._fill(self._full, resource_id)
+
+    @classmethod
+    def _compile(cls, template: Any) -> Any:
+        """Split `{id}` strings into prefix/suffix; keep id-free values and dicts as shared constants."""
+        if isinstance(template, str) and "{id}" in template:
+            prefix, _, suffix = template.partition("{id}")
+            return _Href(prefix, suffix)
+        if isinstance(template, dict):
+            dynamic = tuple(
+                (key, compiled) for key, compiled in
+                ((key, cls._compile(value)) for key, value in template.items())
+                if isinstance(compiled, (_Href, _Dict))
+            )
+            if dynamic:
+                return _Dict(template, dynamic)
+        return template
+
+    @staticmethod
+    def _fill(template: Any, resource_id: str) -> Any:
+        if isinstance(template, _Href):
+            return template.prefix + resource_id + template.suffix
+        if isinstance(template, _Dict):
+            return template.fill(resource_id)
+        return template
+
+
+class _Href:
+    __slots__ = ("prefix", "suffix")
+
+    def __init__(self, prefix: str, suffix: str) -> None:
+        self.prefix = prefix
+        self.suffix = suffix
+
+
+class _Dict:
+    """A dict template: copied as a whole, then only the id dependent keys are replaced."""
+    __slots__ = ("template", "dynamic")
+
+    def __init__(self, template: Dict[str, Any], dynamic: Tuple[Tuple[str, Any], ...]) -> None:
+        self.template = template
+        self.dynamic = dynamic
+
+    def fill(self, resource_id: str) -> Dict[str, Any]:
+        rendered = self.template.copy()
+        for key, value in self.dynamic:
+            if isinstance(value, _Href):
+                rendered[key] = value.prefix + resource_id + value.suffix
+            else:
+                rendered[key] = value.fill(resource_id)
+        return rendered
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 
 @dataclass
 class Notification:
+    __slots__ = ("errors",)
+
     def __init__(self):
         self.errors: list[dict] = []
 
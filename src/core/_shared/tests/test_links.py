@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+
+from src.core._shared.links import LinkBuilder, InvalidLinksMode
+
+BODY = {"title": "string"}
+
+BUILDER = LinkBuilder({
+    "self": "/api/things/{id}",
+    "update": {"method": "PUT", "href": "/api/things/{id}/edit", "body": BODY},
+    "list": {"method": "GET", "href": "/api/things"},
+})
+
+
+class TestLinkBuilder:
+    def test_full_renders_every_template_with_the_id(self):
+        thing_id = uuid.uuid4()
+
+        assert BUILDER.render(thing_id) == {
+            "self": f"/api/things/{thing_id}",
+            "update": {"method": "PUT", "href": f"/api/things/{thing_id}/edit", "body": {"title": "string"}},
+            "list": {"method": "GET", "href": "/api/things"},
+        }
+
+    def test_id_free_parts_are_shared_between_renders(self):
+        first = BUILDER.render(uuid.uuid4())
+        second = BUILDER.render(uuid.uuid4())
+
+        assert first["update"] is not second["update"]
+        assert first["update"]["body"] is BODY
+        assert first["list"] is second["list"]
+
+    def test_minimal_renders_only_self(self):
+        thing_id = uuid.uuid4()
+
+        assert BUILDER.render(thing_id, "minimal") == {"self": f"/api/things/{thing_id}"}
+
+    def test_none_renders_nothing(self):
+        assert BUILDER.render(uuid.uuid4(), "none") == {}
+
+    def test_validate_mode(self):
+        assert LinkBuilder.validate_mode(None) == "full"
+        assert LinkBuilder.validate_mode("minimal") == "minimal"
+        with pytest.raises(InvalidLinksMode):
+            LinkBuilder.validate_mode("some")
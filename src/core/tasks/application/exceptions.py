@@ -8,4 +8,7 @@ class InvalidTaskBy(Exception):
     pass
 
 class TaskNotFound(Exception):
+    pass
+
+class InvalidCursor(Exception):
     pass
\ No newline at end of file
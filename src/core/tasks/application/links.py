@@ -0,0 +1,78 @@
+from src.core._shared.links import LinkBuilder
+
+UPDATE_TASK_BODY = {
+    "title": "string",
+    "description": "string (optional)",
+    "users": "[UUID] (optional, default is yourself)"
+}
+
+PATCH_TASK_BODY = {
+    "title": "string (optional)",
+    "description": "string (optional)",
+    "users": "[UUID] (optional, default is yourself)"
+}
+
+LIST_TASKS_LINK = {
+    "method": "GET",
+    "href": "/api/tasks",
+    "description": "List all tasks with pagination and sorting options."
+}
+
+_DELETE = {"method": "DELETE", "href": "/api/tasks/{id}", "description": "Delete the task."}
+_UPDATE = {"method": "PUT", "href": "/api/tasks/{id}", "description": "Update the task.", "body": UPDATE_TASK_BODY}
+_PATCH = {"method": "PATCH", "href": "/api/tasks/{id}", "description": "Partially update the task.", "body": PATCH_TASK_BODY}
+_GET = {"method": "GET", "href": "/api/tasks/{id}", "description": "Get task details."}
+
+# Links of every task in a listing.
+TASK_ITEM_LINKS = LinkBuilder({
+    "self": "/api/tasks/{id}",
+    "delete": _DELETE,
+    "update": _UPDATE,
+    "get": _GET,
+    "patch": _PATCH,
+})
+
+# Links of a single task returned by GET /api/tasks/{id}.
+TASK_DETAIL_LINKS = LinkBuilder({
+    "self": "/api/tasks/{id}",
+    "create": {
+        "methods": ["POST", "OPTIONS", "HEAD"],
+        "href": "/api/tasks",
+        "description": (
+            "Create a new task. "
+            "POST expects: title (string), description (string, optional), users ([UUID], optional). "
+            "OPTIONS returns allowed methods and metadata. "
+            "HEAD returns headers only."
+        ),
+        "body": UPDATE_TASK_BODY
+    },
+    "delete": _DELETE,
+    "update": _UPDATE,
+    "patch": _PATCH,
+})
+
+# Top level links of GET /api/tasks/{id}.
+TASK_DETAIL_RESPONSE_LINKS = LinkBuilder({
+    "self": "/api/tasks/{id}",
+    "update": "/api/tasks/{id}/update",
+    "delete": "/api/tasks/{id}/delete",
+    "list": "/api/tasks",
+})
+
+# Links returned after creating a task.
+TASK_CREATED_LINKS = LinkBuilder({
+    "list": {
+        "method": "GET",
+        "href": "/api/tasks",
+        "query_params": {
+            "order_by": "title or created_at",
+            "page": 1,
+            "size": 10
+        },
+        "description": "List all tasks with pagination and sorting options."
+    },
+    "delete": _DELETE,
+    "update": _UPDATE,
+    "patch": _PATCH,
+    "get": _GET,
+})
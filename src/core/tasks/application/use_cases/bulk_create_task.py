@@ -0,0 +1,84 @@
+from uuid import UUID
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.core.tasks.application.exceptions import InvalidTaskData
+from src.core.tasks.application.links import TASK_CREATED_LINKS
+from src.core.tasks.application.use_cases.create_task import CreateTask
+from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.domain.tasks import Task
+from src.core.user.domain.user_repository_interface import UserRepositoryInterface
+
+MAX_BULK_TASKS = 500
+
+
+class BulkCreateTask:
+    """Create many tasks in one pass, reporting the outcome of each one.
+
+    Every referenced user id is checked with a single `find_missing_ids` call and
+    the valid tasks are inserted with a single `save_many`. Invalid tasks do not
+    stop the others; their result carries the error instead of an id.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepositoryInterface,
+        user_repository: UserRepositoryInterface,
+        max_tasks: int = MAX_BULK_TASKS,
+    ) -> None:
+        self.repository = repository
+        self.user_repository = user_repository
+        self.max_tasks = max_tasks
+
+    @dataclass
+    class BulkCreateTaskRequest:
+        tasks: List[CreateTask.CreateTaskRequest]
+
+    @dataclass
+    class BulkCreateTaskResult:
+        index: int
+        id: Optional[UUID] = None
+        error: Optional[str] = None
+        links: dict = field(default_factory=dict)
+
+    @dataclass
+    class BulkCreateTaskResponse:
+        results: List['BulkCreateTask.BulkCreateTaskResult']
+        created: int
+        failed: int
+
+    def execute(self, request: BulkCreateTaskRequest) -> 'BulkCreateTask.BulkCreateTaskResponse':
+        if not request.tasks:
+            raise InvalidTaskData("At least one task is required.")
+        if len(request.tasks) > self.max_tasks:
+            raise InvalidTaskData(f"At most {self.max_tasks} tasks can be created at once.")
+
+        missing_user_ids = self.user_repository.find_missing_ids(
+            set().union(*(item.user_ids for item in request.tasks))
+        )
+
+        tasks: List[Task] = []
+        results: List[BulkCreateTask.BulkCreateTaskResult] = []
+        for index, item in enumerate(request.tasks):
+            if missing_user_ids & set(item.user_ids):
+                results.append(self.BulkCreateTaskResult(
+                    index=index, error="One or more users do not exist in the system."
+                ))
+                continue
+            try:
+                task = Task(title=item.title, description=item.description, users=set(item.user_ids))
+            except ValueError as err:
+                results.append(self.BulkCreateTaskResult(index=index, error=f"Invalid task data: {err}"))
+                continue
+            tasks.append(task)
+            results.append(self.BulkCreateTaskResult(
+                index=index, id=task.id, links=TASK_CREATED_LINKS.render(task.id)
+            ))
+
+        if tasks:
+            self.repository.save_many(tasks)
+        return self.BulkCreateTaskResponse(
+            results=results,
+            created=len(tasks),
+            failed=len(results) - len(tasks),
+        )
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from src.core.tasks.application.use_cases.bulk_update_task_status import validate_bulk_filter
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+
+
+class BulkDeleteTask:
+    """Delete many tasks of a user with set-based deletes."""
+
+    def __init__(self, repository: TaskRepositoryInterface) -> None:
+        self.repository = repository
+
+    @dataclass
+    class BulkDeleteTaskRequest:
+        task_filter: TaskFilter
+
+    @dataclass
+    class BulkDeleteTaskResponse:
+        deleted: int
+
+    def execute(self, request: BulkDeleteTaskRequest) -> 'BulkDeleteTask.BulkDeleteTaskResponse':
+        validate_bulk_filter(request.task_filter)
+        return self.BulkDeleteTaskResponse(deleted=self.repository.delete_many(request.task_filter))
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+
+from src.core.tasks.application.exceptions import InvalidTaskData
+from src.core.tasks.application.use_cases.bulk_create_task import MAX_BULK_TASKS
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.domain.tasks import TaskStatus
+
+
+def validate_bulk_filter(task_filter: TaskFilter) -> None:
+    """Refuse selections that would touch every task of the user or too many ids."""
+    if task_filter.is_unbounded():
+        raise InvalidTaskData("Select the tasks by ids or by a filter.")
+    if task_filter.ids is not None and len(task_filter.ids) > MAX_BULK_TASKS:
+        raise InvalidTaskData(f"At most {MAX_BULK_TASKS} ids can be given at once.")
+
+
+class BulkUpdateTaskStatus:
+    """Set the status of many tasks of a user with one set-based update."""
+
+    def __init__(self, repository: TaskRepositoryInterface) -> None:
+        self.repository = repository
+
+    @dataclass
+    class BulkUpdateTaskStatusRequest:
+        task_filter: TaskFilter
+        status: TaskStatus
+
+    @dataclass
+    class BulkUpdateTaskStatusResponse:
+        updated: int
+
+    def execute(self, request: BulkUpdateTaskStatusRequest) -> 'BulkUpdateTaskStatus.BulkUpdateTaskStatusResponse':
+        validate_bulk_filter(request.task_filter)
+        return self.BulkUpdateTaskStatusResponse(
+            updated=self.repository.update_status_many(request.task_filter, TaskStatus(request.status))
+        )
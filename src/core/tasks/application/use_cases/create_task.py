@@ -2,6 +2,7 @@ from uuid import UUID
 from dataclasses import dataclass, field
 
 from src.core.tasks.application.exceptions import RelatedUserNotFound, InvalidTaskData
+from src.core.tasks.application.links import TASK_CREATED_LINKS
 from src.core.tasks.domain.tasks import Task
 
 class CreateTask:
@@ -21,9 +22,7 @@ class CreateTask:
         links: dict = field(default_factory=dict)
 
     def execute(self, request: CreateTaskRequest) -> 'CreateTask.CreateTaskResponse':
-        user_ids = {user.id for user in self.user_repository.list()}
-
-        if not request.user_ids.issubset(user_ids):
+        if self.user_repository.find_missing_ids(request.user_ids):
             raise RelatedUserNotFound("One or more users do not exist in the system.")
 
         try:
@@ -38,46 +37,5 @@ class CreateTask:
         self.repository.save(task)
         return self.CreateTaskResponse(
             id=task.id,
-            links={
-                "list": {
-                    "method": "GET",
-                    "href": "/api/tasks",
-                    "query_params": {
-                        "order_by": "title or created_at",
-                        "page": 1,
-                        "size": 10
-                    },
-                    "description": "List all tasks with pagination and sorting options."
-                },
-                "delete": {
-                    "method": "DELETE",
-                    "href": f"/api/tasks/{task.id}",
-                    "description": "Delete the task."
-                },
-                "update": {
-                    "method": "PUT",
-                    "href": f"/api/tasks/{task.id}",
-                    "description": "Update the task.",
-                    "body": {
-                        "title": "string",
-                        "description": "string (optional)",
-                        "users": "[UUID] (optional, default is yourself)"
-                    }
-                },
-                "patch": {
-                    "method": "PATCH",
-                    "href": f"/api/tasks/{task.id}",
-                    "description": "Partially update the task.",
-                    "body": {
-                        "title": "string (optional)",
-                        "description": "string (optional)",
-                        "users": "[UUID] (optional, default is yourself)"
-                    }
-                },
-                "get": {
-                    "method": "GET",
-                    "href": f"/api/tasks/{task.id}",
-                    "description": "Get task details."
-                }
-            }
+            links=TASK_CREATED_LINKS.render(task.id)
         )
\ No newline at end of file
@@ -17,4 +17,11 @@ class DeleteTask:
         if not task:
             raise TaskNotFound(f"Task with ID {request.id} not found.")
         
-        self.repository.delete(str(request.id))
\ No newline at end of file
+        self.repository.delete(str(request.id))
+
+    async def aexecute(self, request: DeleteTaskRequest) -> None:
+        task = await self.repository.aget_by_id(str(request.id))
+        if not task:
+            raise TaskNotFound(f"Task with ID {request.id} not found.")
+
+        await self.repository.adelete(str(request.id))
@@ -0,0 +1,46 @@
+from uuid import UUID
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core.tasks.application.use_cases.list_task import TaskOutput
+from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.domain.tasks import Task
+
+EXPORT_CHUNK_SIZE = 1000
+
+
+class ExportTasks:
+    """Stream every task of a user, without links, for a full export.
+
+    The tasks are produced lazily from `repository.iterate`, so memory stays bounded
+    by the chunk size whatever the number of tasks.
+    """
+
+    def __init__(self, repository: TaskRepositoryInterface) -> None:
+        self.repository = repository
+
+    @dataclass
+    class ExportTasksRequest:
+        user_id: UUID
+        chunk_size: int = EXPORT_CHUNK_SIZE
+
+    @dataclass
+    class ExportTasksResponse:
+        tasks: Iterator[TaskOutput]
+
+    def execute(self, request: ExportTasksRequest) -> 'ExportTasks.ExportTasksResponse':
+        tasks = self.repository.iterate(request.user_id, request.chunk_size)
+        return self.ExportTasksResponse(tasks=(self._output(task) for task in tasks))
+
+    @staticmethod
+    def _output(task: Task) -> TaskOutput:
+        return TaskOutput(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            status=task.status,
+            created_at=task.created_at.isoformat(),
+            updated_at=task.updated_at.isoformat(),
+            users=set(task.users),
+            links={},
+        )
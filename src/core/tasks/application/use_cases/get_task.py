@@ -1,9 +1,13 @@
 from uuid import UUID
 from dataclasses import dataclass, field
-from typing import Dict, Any, Set
+from datetime import datetime
+from typing import Dict, Any, Optional, Set
 
+from src.core._shared.links import LINKS_FULL, LinkBuilder
 from src.core.tasks.application.exceptions import TaskNotFound
+from src.core.tasks.application.links import TASK_DETAIL_LINKS, TASK_DETAIL_RESPONSE_LINKS
 from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.domain.tasks import Task
 
 @dataclass
 class TaskOutput:
@@ -20,6 +24,7 @@ class GetTask:
     @dataclass
     class GetTaskRequest:
         task_id: UUID
+        links: str = LINKS_FULL
 
     @dataclass
     class GetTaskResponse:
@@ -30,10 +35,24 @@ class GetTask:
         self.repository = repository
 
     def execute(self, request: GetTaskRequest) -> GetTaskResponse:
+        LinkBuilder.validate_mode(request.links)
         task = self.repository.get_by_id(request.task_id)
         if not task:
             raise TaskNotFound(f"Task with ID {request.task_id} not found.")
+        return self._response(task, request.links)
 
+    def version(self, request: GetTaskRequest) -> Optional[datetime]:
+        """Last change of the requested task, for conditional requests; None when it does not exist."""
+        return self.repository.get_version(request.task_id)
+
+    async def aexecute(self, request: GetTaskRequest) -> GetTaskResponse:
+        LinkBuilder.validate_mode(request.links)
+        task = await self.repository.aget_by_id(request.task_id)
+        if not task:
+            raise TaskNotFound(f"Task with ID {request.task_id} not found.")
+        return self._response(task, request.links)
+
+    def _response(self, task: Task, links: str) -> GetTaskResponse:
         task_output = TaskOutput(
             id=task.id,
             title=task.title,
@@ -42,57 +61,10 @@ class GetTask:
             created_at=task.created_at.isoformat(),
             updated_at=task.updated_at.isoformat(),
             users=set(task.users),
-            links={
-                "self": f"/api/tasks/{task.id}",
-                "create": {
-                    "methods": ["POST", "OPTIONS", "HEAD"],
-                    "href": "/api/tasks",
-                    "description": (
-                        "Create a new task. "
-                        "POST expects: title (string), description (string, optional), users ([UUID], optional). "
-                        "OPTIONS returns allowed methods and metadata. "
-                        "HEAD returns headers only."
-                    ),
-                    "body": {
-                        "title": "string",
-                        "description": "string (optional)",
-                        "users": "[UUID] (optional, default is yourself)"
-                    }
-                },
-                "delete": {
-                    "method": "DELETE",
-                    "href": f"/api/tasks/{task.id}",
-                    "description": "Delete the task."
-                },
-                "update": {
-                    "method": "PUT",
-                    "href": f"/api/tasks/{task.id}",
-                    "description": "Update the task.",
-                    "body": {
-                        "title": "string",
-                        "description": "string (optional)",
-                        "users": "[UUID] (optional, default is yourself)"
-                    }
-                },
-                "patch": {
-                    "method": "PATCH",
-                    "href": f"/api/tasks/{task.id}",
-                    "description": "Partially update the task.",
-                    "body": {
-                        "title": "string (optional)",
-                        "description": "string (optional)",
-                        "users": "[UUID] (optional, default is yourself)"
-                    }
-                }
-            }
+            links=TASK_DETAIL_LINKS.render(task.id, links)
         )
 
         return self.GetTaskResponse(
             data=task_output,
-            links={
-                "self": f"/api/tasks/{task.id}",
-                "update": f"/api/tasks/{task.id}/update",
-                "delete": f"/api/tasks/{task.id}/delete",
-                "list": "/api/tasks"
-            }
-        )
\ No newline at end of file
+            links=TASK_DETAIL_RESPONSE_LINKS.render(task.id, links)
+        )
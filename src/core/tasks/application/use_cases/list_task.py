@@ -1,9 +1,16 @@
 from uuid import UUID
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlencode
 
+from src.adapters.cursor.cursor_adapter_interface import CursorAdapterInterface
+from src.core._shared.links import LINKS_FULL, LinkBuilder
+from src.core.tasks.application.links import LIST_TASKS_LINK, TASK_ITEM_LINKS
 from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
-from src.core.tasks.application.exceptions import InvalidTaskBy
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task, TaskStatus
+from src.core.tasks.application.exceptions import InvalidTaskBy, InvalidTaskData, InvalidCursor
 
 @dataclass
 class TaskOutput:
@@ -24,8 +31,13 @@ class MetaOutput:
     query_params: dict[str, Any] = field(default_factory=dict)
 
 class ListTask:
-    def __init__(self, repository: TaskRepositoryInterface) -> None:
+    def __init__(
+        self,
+        repository: TaskRepositoryInterface,
+        cursor_adapter: Optional[CursorAdapterInterface] = None
+    ) -> None:
         self.repository = repository
+        self.cursor_adapter = cursor_adapter
 
     @dataclass
     class ListTaskRequest:
@@ -33,6 +45,26 @@ class ListTask:
         page: int = 1
         size: int = 10
         user_id: UUID = None
+        cursor: Optional[str] = None
+        links: str = LINKS_FULL
+        status: Optional[TaskStatus] = None
+        created_after: Optional[datetime] = None
+        created_before: Optional[datetime] = None
+        updated_after: Optional[datetime] = None
+        updated_before: Optional[datetime] = None
+        assignee_id: Optional[UUID] = None
+        title_prefix: Optional[str] = None
+
+    # Query parameter of each filter of ListTaskRequest.
+    FILTER_PARAMS = {
+        "status": "status",
+        "created_after": "created_after",
+        "created_before": "created_before",
+        "updated_after": "updated_after",
+        "updated_before": "updated_before",
+        "assignee": "assignee_id",
+        "title_prefix": "title_prefix",
+    }
 
     @dataclass
     class ListTaskResponse:
@@ -41,23 +73,117 @@ class ListTask:
         links: Dict[str, Any] = field(default_factory=dict)
 
     def execute(self, request: ListTaskRequest) -> ListTaskResponse:
-        if not request.user_id:
-            raise ValueError("User ID must be provided in the request.")
+        self._validate(request)
+
+        if request.cursor is not None:
+            tasks, total_tasks = self.repository.list_after(
+                user_id=request.user_id,
+                order_by=request.order_by,
+                after=self._cursor_after(request),
+                limit=request.size + 1,
+                **self._filter_argument(request)
+            )
+            return self._cursor_response(request, tasks, total_tasks)
 
-        tasks = self.repository.list(
-            user_id=request.user_id
+        tasks, total_tasks = self.repository.list_page(
+            user_id=request.user_id,
+            order_by=request.order_by,
+            offset=(request.page - 1) * request.size,
+            limit=request.size,
+            **self._filter_argument(request)
         )
+        return self._offset_response(request, tasks, total_tasks)
+
+    def version(self, request: ListTaskRequest) -> Tuple[Optional[datetime], int]:
+        """`(last change, count)` of the tasks the request lists, for conditional requests."""
+        self._validate(request)
+        return self.repository.collection_version(request.user_id, **self._filter_argument(request))
+
+    async def aexecute(self, request: ListTaskRequest) -> ListTaskResponse:
+        """Same as `execute`, against an `AsyncTaskRepositoryInterface`."""
+        self._validate(request)
+
+        if request.cursor is not None:
+            tasks, total_tasks = await self.repository.alist_after(
+                user_id=request.user_id,
+                order_by=request.order_by,
+                after=self._cursor_after(request),
+                limit=request.size + 1,
+                **self._filter_argument(request)
+            )
+            return self._cursor_response(request, tasks, total_tasks)
+
+        tasks, total_tasks = await self.repository.alist_page(
+            user_id=request.user_id,
+            order_by=request.order_by,
+            offset=(request.page - 1) * request.size,
+            limit=request.size,
+            **self._filter_argument(request)
+        )
+        return self._offset_response(request, tasks, total_tasks)
+
+    def _validate(self, request: ListTaskRequest) -> None:
+        if not request.user_id:
+            raise ValueError("User ID must be provided in the request.")
 
         if request.order_by not in ['title', 'status', 'created_at', 'updated_at']:
             raise InvalidTaskBy(f"Invalid order_by field: {request.order_by}")
 
-        sorted_tasks = sorted(
-            [task for task in tasks if hasattr(task, request.order_by)],
-            key=lambda x: getattr(x, request.order_by)
+        if request.page < 1 or request.size < 1:
+            raise InvalidTaskData("Page and size must be positive integers.")
+
+        if request.cursor is not None and self.cursor_adapter is None:
+            raise InvalidCursor("Cursor pagination is not available.")
+
+        LinkBuilder.validate_mode(request.links)
+
+        if request.status is not None:
+            try:
+                TaskStatus(request.status)
+            except ValueError:
+                raise InvalidTaskData(f"Invalid status: {request.status}")
+        for after, before in (
+            (request.created_after, request.created_before),
+            (request.updated_after, request.updated_before),
+        ):
+            if after is not None and before is not None and after >= before:
+                raise InvalidTaskData("Date ranges must start before they end.")
+
+    @staticmethod
+    def _filter_argument(request: ListTaskRequest) -> Dict[str, TaskFilter]:
+        """`task_filter` keyword for the repository, left out when no filter is set."""
+        task_filter = TaskFilter(
+            user_id=request.user_id,
+            status=None if request.status is None else TaskStatus(request.status),
+            created_after=request.created_after,
+            created_before=request.created_before,
+            updated_after=request.updated_after,
+            updated_before=request.updated_before,
+            assignee_id=request.assignee_id,
+            title_prefix=request.title_prefix or None,
         )
-        page_offset = (request.page - 1) * request.size
-        paginated_tasks = sorted_tasks[page_offset:page_offset + request.size]
+        return {} if task_filter.is_unbounded() else {"task_filter": task_filter}
 
+    @classmethod
+    def _filter_params(cls, request: ListTaskRequest) -> Dict[str, str]:
+        params = {}
+        for param, attribute in cls.FILTER_PARAMS.items():
+            value = getattr(request, attribute)
+            if value is None or value == "":
+                continue
+            if isinstance(value, datetime):
+                params[param] = value.isoformat()
+            else:
+                params[param] = str(getattr(value, "value", value))
+        return params
+
+    def _response(
+        self,
+        request: ListTaskRequest,
+        paginated_tasks: List[Task],
+        total_tasks: int,
+        links: Dict[str, Any]
+    ) -> ListTaskResponse:
         task_outputs = [
             TaskOutput(
                 id=task.id,
@@ -67,65 +193,95 @@ class ListTask:
                 created_at=task.created_at.isoformat(),
                 updated_at=task.updated_at.isoformat(),
                 users=set(task.users),
-                links={
-                    "self": f"/api/tasks/{task.id}",
-                    "delete": {
-                        "method": "DELETE",
-                        "href": f"/api/tasks/{task.id}",
-                        "description": "Delete the task."
-                    },
-                    "update": {
-                        "method": "PUT",
-                        "href": f"/api/tasks/{task.id}",
-                        "description": "Update the task.",
-                        "body": {
-                            "title": "string",
-                            "description": "string (optional)",
-                            "users": "[UUID] (optional, default is yourself)"
-                        }
-                    },
-                    "get": {
-                        "method": "GET",
-                        "href": f"/api/tasks/{task.id}",
-                        "description": "Get task details."
-                    },
-                    "patch": {
-                        "method": "PATCH",
-                        "href": f"/api/tasks/{task.id}",
-                        "description": "Partially update the task.",
-                        "body": {
-                            "title": "string (optional)",
-                            "description": "string (optional)",
-                            "users": "[UUID] (optional, default is yourself)"
-                        }
-                    }
-                }
+                links=TASK_ITEM_LINKS.render(task.id, request.links)
             )
             for task in paginated_tasks
         ]
 
+        query_params = {
+            "order_by": request.order_by,
+            "page": request.page,
+            "size": request.size
+        }
+        if request.cursor is not None:
+            query_params["cursor"] = request.cursor
+        if request.links != LINKS_FULL:
+            query_params["links"] = request.links
+        query_params.update(self._filter_params(request))
+
         return self.ListTaskResponse(
             data=task_outputs,
             meta=MetaOutput(
-                total_tasks=len(sorted_tasks),
+                total_tasks=total_tasks,
                 current_page=request.page,
                 page_size=request.size,
-                query_params={
-                    "order_by": request.order_by,
-                    "page": request.page,
-                    "size": request.size
-                }
+                query_params=query_params
             ),
             links={
-                "list": {
-                    "method": "GET",
-                    "href": "/api/tasks",
-                    "description": "List all tasks with pagination and sorting options."
-                },
-                "self": f"/api/tasks?page={request.page}&size={request.size}&order_by={request.order_by}",
-                "next": f"/api/tasks?page={request.page + 1}&size={request.size}&order_by={request.order_by}" if len(sorted_tasks) > page_offset + request.size else None,
-                "prev": f"/api/tasks?page={request.page - 1}&size={request.size}&order_by={request.order_by}" if request.page > 1 else None,
-                "first": f"/api/tasks?page=1&size={request.size}&order_by={request.order_by}",
-                "last": f"/api/tasks?page={((len(sorted_tasks) - 1) // request.size) + 1}&size={request.size}&order_by={request.order_by}",
+                "list": LIST_TASKS_LINK,
+                **links
             }
-        )
\ No newline at end of file
+        )
+
+    def _offset_response(
+        self, request: ListTaskRequest, paginated_tasks: List[Task], total_tasks: int
+    ) -> ListTaskResponse:
+        page_offset = (request.page - 1) * request.size
+        extra = self._links_param(request)
+        links = {
+            "self": f"/api/tasks?page={request.page}&size={request.size}&order_by={request.order_by}{extra}",
+            "next": f"/api/tasks?page={request.page + 1}&size={request.size}&order_by={request.order_by}{extra}" if total_tasks > page_offset + request.size else None,
+            "prev": f"/api/tasks?page={request.page - 1}&size={request.size}&order_by={request.order_by}{extra}" if request.page > 1 else None,
+            "first": f"/api/tasks?page=1&size={request.size}&order_by={request.order_by}{extra}",
+            "last": f"/api/tasks?page={((total_tasks - 1) // request.size) + 1}&size={request.size}&order_by={request.order_by}{extra}",
+        }
+        return self._response(request, paginated_tasks, total_tasks, links)
+
+    @classmethod
+    def _links_param(cls, request: ListTaskRequest) -> str:
+        """Keep a non default `links` mode and the filters in the pagination links."""
+        params = {} if request.links == LINKS_FULL else {"links": request.links}
+        params.update(cls._filter_params(request))
+        return f"&{urlencode(params)}" if params else ""
+
+    def _cursor_after(self, request: ListTaskRequest) -> Optional[Tuple[Any, UUID]]:
+        return self._decode_cursor(request.cursor, request.order_by) if request.cursor else None
+
+    def _cursor_response(
+        self, request: ListTaskRequest, tasks: List[Task], total_tasks: int
+    ) -> ListTaskResponse:
+        """Build the page from `size + 1` fetched tasks; the extra one only signals a next page."""
+        paginated_tasks = tasks[:request.size]
+        next_cursor = (
+            self._encode_cursor(paginated_tasks[-1], request.order_by)
+            if len(tasks) > request.size else None
+        )
+        extra = self._links_param(request)
+        links = {
+            "self": f"/api/tasks?cursor={request.cursor}&size={request.size}&order_by={request.order_by}{extra}",
+            "next": f"/api/tasks?cursor={next_cursor}&size={request.size}&order_by={request.order_by}{extra}" if next_cursor else None,
+            "prev": None,
+            "first": f"/api/tasks?cursor=&size={request.size}&order_by={request.order_by}{extra}",
+            "last": None,
+        }
+        return self._response(request, paginated_tasks, total_tasks, links)
+
+    def _encode_cursor(self, task: Task, order_by: str) -> str:
+        value = getattr(task, order_by)
+        return self.cursor_adapter.encode({
+            "order_by": order_by,
+            "value": value.isoformat() if isinstance(value, datetime) else str(value),
+            "id": str(task.id),
+        })
+
+    def _decode_cursor(self, cursor: str, order_by: str) -> Tuple[Any, UUID]:
+        try:
+            payload = self.cursor_adapter.decode(cursor)
+            if payload["order_by"] != order_by:
+                raise ValueError("Cursor was issued for another ordering.")
+            value = payload["value"]
+            if order_by in ['created_at', 'updated_at']:
+                value = datetime.fromisoformat(value)
+            return value, UUID(payload["id"])
+        except (ValueError, KeyError, TypeError) as err:
+            raise InvalidCursor(f"Invalid cursor: {err}")
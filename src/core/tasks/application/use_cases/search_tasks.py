@@ -0,0 +1,85 @@
+from uuid import UUID
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+from urllib.parse import urlencode
+
+from src.core._shared.links import LINKS_FULL, LinkBuilder
+from src.core.tasks.application.exceptions import InvalidTaskData
+from src.core.tasks.application.links import LIST_TASKS_LINK, TASK_ITEM_LINKS
+from src.core.tasks.application.use_cases.list_task import MetaOutput, TaskOutput
+from src.core.tasks.domain.task_search_index_interface import TaskSearchIndexInterface
+
+MAX_QUERY_LENGTH = 200
+
+
+class SearchTasks:
+    """Rank a user's tasks by the words of a query and return one page of them."""
+
+    def __init__(self, search_index: TaskSearchIndexInterface) -> None:
+        self.search_index = search_index
+
+    @dataclass
+    class SearchTasksRequest:
+        user_id: UUID
+        query: str
+        page: int = 1
+        size: int = 10
+        links: str = LINKS_FULL
+
+    @dataclass
+    class SearchTasksResponse:
+        data: List[TaskOutput]
+        meta: MetaOutput
+        links: Dict[str, Any] = field(default_factory=dict)
+
+    def execute(self, request: SearchTasksRequest) -> 'SearchTasks.SearchTasksResponse':
+        query = (request.query or "").strip()
+        if not query:
+            raise InvalidTaskData("Search query cannot be empty.")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise InvalidTaskData(f"Search query must have at most {MAX_QUERY_LENGTH} characters.")
+        if request.page < 1 or request.size < 1:
+            raise InvalidTaskData("Page and size must be positive integers.")
+        LinkBuilder.validate_mode(request.links)
+
+        tasks, total_tasks = self.search_index.search(
+            user_id=request.user_id,
+            query=query,
+            offset=(request.page - 1) * request.size,
+            limit=request.size,
+        )
+
+        query_params = {"q": query, "page": request.page, "size": request.size}
+        if request.links != LINKS_FULL:
+            query_params["links"] = request.links
+        return self.SearchTasksResponse(
+            data=[
+                TaskOutput(
+                    id=task.id,
+                    title=task.title,
+                    description=task.description,
+                    status=task.status,
+                    created_at=task.created_at.isoformat(),
+                    updated_at=task.updated_at.isoformat(),
+                    users=set(task.users),
+                    links=TASK_ITEM_LINKS.render(task.id, request.links),
+                )
+                for task in tasks
+            ],
+            meta=MetaOutput(
+                total_tasks=total_tasks,
+                current_page=request.page,
+                page_size=request.size,
+                query_params=query_params,
+            ),
+            links={
+                "list": LIST_TASKS_LINK,
+                "self": self._href(query_params, request.page),
+                "next": self._href(query_params, request.page + 1) if total_tasks > request.page * request.size else None,
+                "prev": self._href(query_params, request.page - 1) if request.page > 1 else None,
+            },
+        )
+
+    @staticmethod
+    def _href(query_params: Dict[str, Any], page: int) -> str:
+        return f"/api/tasks/search?{urlencode({**query_params, 'page': page})}"
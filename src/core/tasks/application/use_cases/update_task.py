@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 from typing import Optional
 from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
@@ -27,5 +28,6 @@ class UpdateTask:
             task.description = request.description
         if request.status is not None:
             task.status = request.status
+        task.updated_at = datetime.now()
 
         self.repository.save(task)
\ No newline at end of file
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+from typing import Any, Optional, List, Tuple
+
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task
+
+class AsyncTaskRepositoryInterface(ABC):
+    """Coroutine counterpart of `TaskRepositoryInterface`, used by the ASGI views."""
+
+    @abstractmethod
+    async def aget_by_id(self, task_id: UUID) -> Optional[Task]:
+        """Retrieve a task by its ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def adelete(self, task_id: UUID) -> None:
+        """Delete a task by its ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        """See `TaskRepositoryInterface.list_page`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        """See `TaskRepositoryInterface.list_after`."""
+        raise NotImplementedError
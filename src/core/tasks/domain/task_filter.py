@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import FrozenSet, Optional
+from uuid import UUID
+
+from src.core.tasks.domain.tasks import Task, TaskStatus
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """Selects tasks of one user; every criterion that is set must match.
+
+    Ranges are half open: `*_after` is inclusive, `*_before` exclusive.
+    `assignee_id` keeps the tasks that user is also assigned to.
+    """
+    user_id: UUID
+    ids: Optional[FrozenSet[UUID]] = None
+    status: Optional[TaskStatus] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
+    assignee_id: Optional[UUID] = None
+    title_prefix: Optional[str] = None
+
+    def is_unbounded(self) -> bool:
+        """True when nothing but the owner narrows the selection."""
+        return all(
+            getattr(self, criterion) is None
+            for criterion in (
+                "ids", "status", "created_after", "created_before",
+                "updated_after", "updated_before", "assignee_id", "title_prefix",
+            )
+        )
+
+    def matches(self, task: Task) -> bool:
+        return (
+            self.user_id in task.users
+            and (self.ids is None or task.id in self.ids)
+            and (self.status is None or task.status == self.status)
+            and (self.created_after is None or task.created_at >= self.created_after)
+            and (self.created_before is None or task.created_at < self.created_before)
+            and (self.updated_after is None or task.updated_at >= self.updated_after)
+            and (self.updated_before is None or task.updated_at < self.updated_before)
+            and (self.assignee_id is None or self.assignee_id in task.users)
+            and (self.title_prefix is None or task.title.startswith(self.title_prefix))
+        )
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Any, Iterator, Optional, List, Set, Tuple
 
-from src.core.tasks.domain.tasks import Task
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task, TaskStatus
 
 class TaskRepositoryInterface(ABC):
     @abstractmethod
@@ -10,6 +12,16 @@ class TaskRepositoryInterface(ABC):
         """Save a task to the repository."""
         raise NotImplementedError
     
+    @abstractmethod
+    def upsert(self, task: Task) -> Tuple[Task, Set[UUID]]:
+        """`save` that also returns the users the task was assigned to before, none when it is new."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, tasks: List[Task]) -> None:
+        """Insert new tasks in one batch."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, task_id: UUID) -> Optional[Task]:
         """Retrieve a task by its ID."""
@@ -26,6 +38,74 @@ class TaskRepositoryInterface(ABC):
         raise NotImplementedError
     
     @abstractmethod
-    def list(self, user_id: UUID) -> list[Task]:
-        """List all tasks."""
-        raise NotImplementedError
\ No newline at end of file
+    def update_status_many(self, task_filter: TaskFilter, status: TaskStatus) -> int:
+        """Set the status of every task the filter selects; returns how many were updated."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_many(self, task_filter: TaskFilter) -> int:
+        """Delete every task the filter selects; returns how many were deleted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def assignments(self, task_filter: TaskFilter) -> List[Tuple[UUID, UUID]]:
+        """`(task id, user id)` of every user assigned to the tasks the filter selects, without loading them."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_version(self, task_id: UUID) -> Optional[datetime]:
+        """The `updated_at` of a task, or None when it does not exist, without loading the task."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def collection_version(
+        self, user_id: UUID, task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """`(max updated_at, count)` of a user's tasks, or of those `task_filter` selects.
+
+        Any create, update or delete of those tasks changes at least one of the two,
+        so it identifies a version of the listing without loading it.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list(self, user_id: UUID, task_filter: Optional[TaskFilter] = None) -> list[Task]:
+        """List all tasks, or only those `task_filter` selects."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iterate(self, user_id: UUID, chunk_size: int) -> Iterator[Task]:
+        """Yield every task of a user ordered by id, holding about `chunk_size` of them at a time."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        """List one page of a user's tasks ordered by `order_by` (ties broken by id).
+
+        `task_filter`, for the same user, narrows the tasks listed and counted.
+        Returns the tasks of the page and the total number of tasks of the user.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        """List a user's tasks that come after the `(order_by value, id)` position.
+
+        Keyset counterpart of `list_page`: the position is a seek, not an offset.
+        Returns up to `limit` tasks and the total number of tasks of the user.
+        """
+        raise NotImplementedError
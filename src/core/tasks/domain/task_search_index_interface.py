@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+from typing import List, Tuple
+
+from src.core.tasks.domain.tasks import Task
+
+
+class TaskSearchIndexInterface(ABC):
+    """Full-text search over the title and description of tasks.
+
+    Implementations keep themselves in sync with the task repository they index,
+    so a task is searchable as soon as it is saved and gone once it is deleted.
+    """
+
+    @abstractmethod
+    def search(self, user_id: UUID, query: str, offset: int, limit: int) -> Tuple[List[Task], int]:
+        """One page of a user's tasks containing every word of `query`, best ranked first.
+
+        Matches in the title rank above matches in the description; ties are broken by id.
+        Returns the tasks of the page and the total number of matches.
+        """
+        raise NotImplementedError
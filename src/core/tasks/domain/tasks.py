@@ -9,7 +9,7 @@ class TaskStatus(StrEnum):
     COMPLETED = "completed"
     PENDING = "pending"
 
-@dataclass
+@dataclass(slots=True)
 class Task(Entity):
     title: str
     description: str
@@ -38,7 +38,7 @@ class Task(Entity):
             self.notification.add_error("Title cannot exceed 30 characters.")
         if len(self.description) > 255:
             self.notification.add_error("Description cannot exceed 255 characters.")
-        if self.notification.has_errors():
+        if self.has_errors():
             raise ValueError("Task validation failed: " + ", ".join(self.notification.get_errors()))
 
     def __str__(self):
@@ -0,0 +1,417 @@
+import asyncio
+import copy
+import hashlib
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID, uuid4
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.adapters.cache.cache_adapter_interface import CacheAdapterInterface
+from src.core.tasks.domain.async_task_repository_interface import AsyncTaskRepositoryInterface
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.domain.tasks import Task, TaskStatus
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Lookups that waited for another caller's fetch of the same task instead of fetching it.
+    coalesced: int = 0
+    evictions: int = 0
+    list_hits: int = 0
+    list_misses: int = 0
+
+
+class _Flight:
+    """One in-progress fetch of a task that concurrent lookups of the same id wait for."""
+
+    def __init__(self, future: Optional[asyncio.Future] = None) -> None:
+        self.done = threading.Event()
+        # Set by async fetches, so async lookups of the same task can await them.
+        self.future = future
+        self.result: Optional[Task] = None
+        self.error: Optional[BaseException] = None
+        # Set when the task is written during the fetch; the result is then not cached.
+        self.stale = False
+
+
+class CachedTaskRepository(TaskRepositoryInterface, AsyncTaskRepositoryInterface):
+    """Read-through cache of `get_by_id` in front of another task repository.
+
+    Writes go to the wrapped repository and then drop the cached copy of every task
+    they touch. Only one caller per process, thread or coroutine, fetches a missing
+    task; the others wait for its result. Callers get their own copy of a cached task, so mutating it
+    before `update` cannot leak into the cache. Missing tasks are not cached.
+    The async methods need a wrapped repository that implements them too.
+
+    With a `list_cache`, pages (`list_page`, `list_after`) and `collection_version`
+    are cached as well, under keys that hold a version token of the listing user.
+    A write replaces the token of every user the tasks it touches are, or were,
+    assigned to, so their old pages are never looked up again and age out of the
+    cache instead of being searched for and deleted.
+
+    Every fetch whose result gets cached runs inside `fill_scope()`, which can, for
+    example, keep it off a lagging read replica.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepositoryInterface,
+        cache: CacheAdapterInterface,
+        list_cache: Optional[CacheAdapterInterface] = None,
+        fill_scope: Callable[[], AbstractContextManager] = nullcontext
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.list_cache = list_cache
+        self.fill_scope = fill_scope
+        self._stats = CacheStats()
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters since creation; evictions come from the caches when they report them."""
+        caches = [self.cache] if self.list_cache in (None, self.cache) else [self.cache, self.list_cache]
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                coalesced=self._stats.coalesced,
+                evictions=sum(getattr(cache, "evictions", 0) for cache in caches),
+                list_hits=self._stats.list_hits,
+                list_misses=self._stats.list_misses,
+            )
+
+    def get_by_id(self, task_id: UUID) -> Optional[Task]:
+        key = self._key(task_id)
+        task = self.cache.get(key)
+        with self._lock:
+            if task is not None:
+                self._stats.hits += 1
+                return self._detached(task)
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats.misses += 1
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._detached(flight.result)
+
+        try:
+            with self.fill_scope():
+                flight.result = self.repository.get_by_id(task_id)
+            self._fill(key, flight)
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            self._land(key, flight)
+        return self._detached(flight.result)
+
+    def save(self, task: Task) -> Any:
+        return self.upsert(task)[0]
+
+    def upsert(self, task: Task) -> Tuple[Task, Set[UUID]]:
+        # The wrapped repository reads the previous users as part of the write; no lookup of our own.
+        user_ids = self._cached_users(task.id) | task.users
+        try:
+            saved, previous_users = self.repository.upsert(task)
+            user_ids |= previous_users
+            return saved, previous_users
+        finally:
+            self._invalidate([task.id], user_ids)
+
+    def save_many(self, tasks: List[Task]) -> None:
+        try:
+            self.repository.save_many(tasks)
+        finally:
+            self._invalidate((task.id for task in tasks), {user_id for task in tasks for user_id in task.users})
+
+    def update(self, task: Task) -> Any:
+        user_ids = self._stored_users(task.id) | task.users
+        try:
+            return self.repository.update(task)
+        finally:
+            self._invalidate([task.id], user_ids)
+
+    def delete(self, task_id: UUID) -> None:
+        user_ids = self._stored_users(task_id)
+        try:
+            self.repository.delete(task_id)
+        finally:
+            self._invalidate([task_id], user_ids)
+
+    def update_status_many(self, task_filter: TaskFilter, status: TaskStatus) -> int:
+        task_ids, user_ids = self._selected(task_filter)
+        try:
+            return self.repository.update_status_many(task_filter, status)
+        finally:
+            self._invalidate(task_ids, user_ids)
+
+    def delete_many(self, task_filter: TaskFilter) -> int:
+        task_ids, user_ids = self._selected(task_filter)
+        try:
+            return self.repository.delete_many(task_filter)
+        finally:
+            self._invalidate(task_ids, user_ids)
+
+    def assignments(self, task_filter: TaskFilter) -> List[Tuple[UUID, UUID]]:
+        return self.repository.assignments(task_filter)
+
+    def get_version(self, task_id: UUID) -> Optional[datetime]:
+        return self.repository.get_version(task_id)
+
+    def collection_version(
+        self, user_id: UUID, task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[Optional[datetime], int]:
+        return self._cached_list(
+            user_id, ("version", task_filter), lambda: self.repository.collection_version(user_id, task_filter)
+        )
+
+    def list(self, user_id: UUID, task_filter: Optional[TaskFilter] = None) -> List[Task]:
+        return self.repository.list(user_id, task_filter)
+
+    def iterate(self, user_id: UUID, chunk_size: int) -> Iterator[Task]:
+        return self.repository.iterate(user_id, chunk_size)
+
+    def list_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        tasks, total = self._cached_list(
+            user_id,
+            ("page", order_by, offset, limit, task_filter),
+            lambda: self.repository.list_page(user_id, order_by, offset, limit, task_filter),
+        )
+        return [self._detached(task) for task in tasks], total
+
+    def list_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        tasks, total = self._cached_list(
+            user_id,
+            ("after", order_by, after, limit, task_filter),
+            lambda: self.repository.list_after(user_id, order_by, after, limit, task_filter),
+        )
+        return [self._detached(task) for task in tasks], total
+
+    async def aget_by_id(self, task_id: UUID) -> Optional[Task]:
+        key = self._key(task_id)
+        task = self.cache.get(key)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if task is not None:
+                self._stats.hits += 1
+                return self._detached(task)
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(loop.create_future())
+                self._stats.misses += 1
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            if flight.future is not None and flight.future.get_loop() is loop:
+                await asyncio.shield(flight.future)
+            else:
+                # Fetched by a thread, or by a coroutine of another event loop.
+                await loop.run_in_executor(None, flight.done.wait)
+            if flight.error is not None:
+                raise flight.error
+            return self._detached(flight.result)
+
+        try:
+            with self.fill_scope():
+                flight.result = await self.repository.aget_by_id(task_id)
+            self._fill(key, flight)
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            self._land(key, flight)
+        return self._detached(flight.result)
+
+    async def adelete(self, task_id: UUID) -> None:
+        user_ids = await self._astored_users(task_id)
+        try:
+            await self.repository.adelete(task_id)
+        finally:
+            self._invalidate([task_id], user_ids)
+
+    async def alist_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        tasks, total = await self._acached_list(
+            user_id,
+            ("page", order_by, offset, limit, task_filter),
+            lambda: self.repository.alist_page(user_id, order_by, offset, limit, task_filter),
+        )
+        return [self._detached(task) for task in tasks], total
+
+    async def alist_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        tasks, total = await self._acached_list(
+            user_id,
+            ("after", order_by, after, limit, task_filter),
+            lambda: self.repository.alist_after(user_id, order_by, after, limit, task_filter),
+        )
+        return [self._detached(task) for task in tasks], total
+
+    def _cached_list(self, user_id: UUID, query: Tuple, fetch: Callable[[], Any]) -> Any:
+        if self.list_cache is None:
+            return fetch()
+        key = self._list_key(user_id, query)
+        result = self.list_cache.get(key)
+        if self._count_list_lookup(result):
+            return result
+        with self.fill_scope():
+            result = fetch()
+        self.list_cache.set(key, result)
+        return result
+
+    async def _acached_list(self, user_id: UUID, query: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        if self.list_cache is None:
+            return await fetch()
+        key = self._list_key(user_id, query)
+        result = self.list_cache.get(key)
+        if self._count_list_lookup(result):
+            return result
+        with self.fill_scope():
+            result = await fetch()
+        self.list_cache.set(key, result)
+        return result
+
+    def _count_list_lookup(self, result: Any) -> bool:
+        with self._lock:
+            if result is None:
+                self._stats.list_misses += 1
+                return False
+            self._stats.list_hits += 1
+            return True
+
+    def _list_key(self, user_id: UUID, query: Tuple) -> str:
+        """Key of one listing under the user's current version; a bumped version orphans the old keys."""
+        version_key = self._version_key(user_id)
+        version = self.list_cache.get(version_key)
+        if version is None:
+            # A random token, not a counter: a version lost to eviction must not be reissued.
+            version = uuid4().hex
+            self.list_cache.set(version_key, version)
+        digest = hashlib.sha256(repr(query).encode()).hexdigest()[:32]
+        return f"list:{self._normalized(user_id)}:{version}:{digest}"
+
+    def _fill(self, key: str, flight: _Flight) -> None:
+        """Cache the result of a fetch, unless a write of the task overtook it."""
+        with self._lock:
+            if flight.result is not None and not flight.stale:
+                self.cache.set(key, self._detached(flight.result))
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        """End a fetch and wake up the lookups waiting for it."""
+        with self._lock:
+            del self._flights[key]
+        flight.done.set()
+        if flight.future is not None and not flight.future.done():
+            flight.future.set_result(None)
+
+    def _cached_users(self, task_id: UUID) -> Set[UUID]:
+        """Users of the cached copy of the task, if there is one; never reads the repository."""
+        if self.list_cache is None:
+            return set()
+        task = self.cache.get(self._key(task_id))
+        return set() if task is None else set(task.users)
+
+    def _stored_users(self, task_id: UUID) -> Set[UUID]:
+        """Users assigned to the stored task, whose listings a write of it changes."""
+        if self.list_cache is None:
+            return set()
+        task = self.cache.get(self._key(task_id))
+        if task is None:
+            # From the primary: users missed on a lagging replica would keep their stale pages.
+            with self.fill_scope():
+                task = self.repository.get_by_id(task_id)
+        return set() if task is None else set(task.users)
+
+    async def _astored_users(self, task_id: UUID) -> Set[UUID]:
+        if self.list_cache is None:
+            return set()
+        task = self.cache.get(self._key(task_id))
+        if task is None:
+            with self.fill_scope():
+                task = await self.repository.aget_by_id(task_id)
+        return set() if task is None else set(task.users)
+
+    def _selected(self, task_filter: TaskFilter) -> Tuple[List[UUID], Set[UUID]]:
+        """Ids a bulk write will touch and their users; read before the write, since a delete loses them."""
+        if task_filter.ids is not None and self.list_cache is None:
+            return list(task_filter.ids), set()
+        assignments = self.repository.assignments(task_filter)
+        return list({task_id: None for task_id, _ in assignments}), {user_id for _, user_id in assignments}
+
+    def _invalidate(self, task_ids: Iterable[UUID], user_ids: Iterable[UUID] = ()) -> None:
+        for task_id in task_ids:
+            key = self._key(task_id)
+            with self._lock:
+                flight = self._flights.get(key)
+                if flight is not None:
+                    flight.stale = True
+            self.cache.delete(key)
+        if self.list_cache is not None:
+            for user_id in set(map(self._normalized, user_ids)):
+                self.list_cache.set(self._version_key(user_id), uuid4().hex)
+
+    @classmethod
+    def _key(cls, task_id: UUID) -> str:
+        return f"task:{cls._normalized(task_id)}"
+
+    @classmethod
+    def _version_key(cls, user_id: UUID) -> str:
+        return f"list-version:{cls._normalized(user_id)}"
+
+    @staticmethod
+    def _normalized(value: UUID) -> str:
+        """Ids arrive as UUIDs or strings in any case; they must share one key."""
+        try:
+            return str(UUID(str(value)))
+        except ValueError:
+            return str(value)
+
+    @staticmethod
+    def _detached(task: Optional[Task]) -> Optional[Task]:
+        if task is None:
+            return None
+        clone = copy.copy(task)
+        clone.users = set(task.users)
+        return clone
@@ -1,36 +1,257 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
 from uuid import UUID
-from typing import Optional, List
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Set, Tuple
 
+from src.core.tasks.domain.async_task_repository_interface import AsyncTaskRepositoryInterface
 from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
-from src.core.tasks.domain.tasks import Task
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.infra.in_memory_task_search_index import InMemoryTaskSearchIndex
+from src.core.tasks.domain.tasks import Task, TaskStatus
 
-class InMemoryTaskRepository(TaskRepositoryInterface):
-    """In-memory implementation of the TaskRepositoryInterface."""
+class InMemoryTaskRepository(TaskRepositoryInterface, AsyncTaskRepositoryInterface):
+    """In-memory implementation of the TaskRepositoryInterface.
 
-    def __init__(self, tasks: Optional[List[Task]] = None) -> None:
-        self.tasks = tasks or []
+    Tasks are stored in a dict keyed by id, with a `user_id -> task ids` index.
+    For every field in `sorted_fields`, each user also gets a list of
+    `(value, task id)` keys kept sorted, so `list_page`/`list_after` on that
+    field slice or bisect instead of sorting the user's tasks. An optional
+    `search_index` is updated on every save and delete.
+
+    The sorted keys are plain lists: finding a position is O(log n), but inserting
+    or removing a key shifts the keys after it, so each write costs O(n) per sorted
+    field in the number of tasks of each of its users. It is a memmove, cheap until
+    users own hundreds of thousands of tasks: with one user and a sorted `title`,
+    an update took about 15us at 10k tasks, 50us at 100k and 425us at 1M (against
+    7-10us unsorted; `bench_in_memory_task_repository.py --users 1`).
+    """
+
+    def __init__(
+        self,
+        tasks: Optional[List[Task]] = None,
+        sorted_fields: Iterable[str] = (),
+        search_index: Optional[InMemoryTaskSearchIndex] = None
+    ) -> None:
+        self.tasks_by_id: Dict[UUID, Task] = {}
+        # Dicts with None values are used as insertion ordered sets.
+        self.task_ids_by_user: Dict[UUID, Dict[UUID, None]] = {}
+        self.sorted_fields = tuple(sorted_fields)
+        self._sorted_keys: Dict[Tuple[str, UUID], List[Tuple[Any, UUID]]] = {}
+        # Users and sorted values each task is indexed under; tasks are mutable,
+        # so this is what has to be removed when it is updated or deleted.
+        self._indexed: Dict[UUID, Tuple[Tuple[UUID, ...], Tuple[Any, ...]]] = {}
+        self.search_index = search_index
+        for task in tasks or []:
+            self.save(task)
+
+    @property
+    def tasks(self) -> List[Task]:
+        return list(self.tasks_by_id.values())
 
     def save(self, task: Task) -> None:
-        """Save a task to the in-memory repository."""
-        self.tasks.append(task)
+        """Save a task to the in-memory repository, replacing a task with the same id."""
+        if task.id in self.tasks_by_id:
+            self._unindex(task.id)
+        self.tasks_by_id[task.id] = task
+        self._index(task)
+
+    def upsert(self, task: Task) -> Tuple[Task, Set[UUID]]:
+        stored = self.tasks_by_id.get(task.id)
+        previous_users = set() if stored is None else set(stored.users)
+        self.save(task)
+        return task, previous_users
+
+    def save_many(self, tasks: List[Task]) -> None:
+        """Save several tasks."""
+        for task in tasks:
+            self.save(task)
 
     def get_by_id(self, task_id: UUID) -> Optional[Task]:
         """Retrieve a task by its ID."""
-        return next((task for task in self.tasks if task.id == task_id), None)
+        return self.tasks_by_id.get(task_id)
 
     def delete(self, task_id: UUID) -> None:
         """Delete a task by its ID."""
-        self.tasks = [task for task in self.tasks if task.id != task_id]
+        if self.tasks_by_id.pop(task_id, None) is not None:
+            self._unindex(task_id)
 
     def update(self, task: Task) -> None:
         """Update an existing task."""
-        for i, existing_task in enumerate(self.tasks):
-            if existing_task.id == task.id:
-                self.tasks[i] = task
-                break
+        if task.id in self.tasks_by_id:
+            self.save(task)
+
+    def update_status_many(self, task_filter: TaskFilter, status: TaskStatus) -> int:
+        """Set the status of the filtered tasks of the user."""
+        tasks = self._filtered(task_filter)
+        now = datetime.now()
+        for task in tasks:
+            task.status = status
+            task.updated_at = now
+            self.save(task)
+        return len(tasks)
+
+    def delete_many(self, task_filter: TaskFilter) -> int:
+        """Delete the filtered tasks of the user."""
+        tasks = self._filtered(task_filter)
+        for task in tasks:
+            self.delete(task.id)
+        return len(tasks)
 
-    def list(self, user_id: UUID) -> List[Task]:
+    def list(self, user_id: UUID, task_filter: Optional[TaskFilter] = None) -> List[Task]:
         """List all tasks for a specific user."""
+        if task_filter is not None:
+            return self._filtered(task_filter)
         if user_id is None:
-            return list(self.tasks)
-        return [task for task in self.tasks if user_id in task.users]
\ No newline at end of file
+            return list(self.tasks_by_id.values())
+        return [self.tasks_by_id[task_id] for task_id in self.task_ids_by_user.get(user_id, ())]
+
+    def assignments(self, task_filter: TaskFilter) -> List[Tuple[UUID, UUID]]:
+        return [(task.id, user_id) for task in self._filtered(task_filter) for user_id in task.users]
+
+    def get_version(self, task_id: UUID) -> Optional[datetime]:
+        task = self.tasks_by_id.get(task_id)
+        return None if task is None else task.updated_at
+
+    def collection_version(
+        self, user_id: UUID, task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[Optional[datetime], int]:
+        tasks = self.list(user_id, task_filter)
+        return max((task.updated_at for task in tasks), default=None), len(tasks)
+
+    def iterate(self, user_id: UUID, chunk_size: int) -> Iterator[Task]:
+        """Yield a user's tasks ordered by id."""
+        for task_id in sorted(self.task_ids_by_user.get(user_id, ())):
+            yield self.tasks_by_id[task_id]
+
+    def list_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        """List one page of a user's tasks ordered by a field."""
+        if task_filter is not None and not task_filter.is_unbounded():
+            tasks = self._filtered_sorted(task_filter, order_by)
+            return tasks[offset:offset + limit], len(tasks)
+
+        if order_by in self.sorted_fields and user_id is not None:
+            keys = self._sorted_keys.get((order_by, user_id), [])
+            return self._tasks_of(keys[offset:offset + limit]), len(keys)
+
+        tasks = sorted(
+            self.list(user_id),
+            key=lambda task: (getattr(task, order_by), task.id)
+        )
+        return tasks[offset:offset + limit], len(tasks)
+
+    def list_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        """List a user's tasks positioned after a `(value, id)` key."""
+        def sort_key(task: Task) -> Tuple[Any, UUID]:
+            return getattr(task, order_by), task.id
+
+        if task_filter is not None and not task_filter.is_unbounded():
+            tasks = self._filtered_sorted(task_filter, order_by)
+            start = bisect_right(tasks, after, key=sort_key) if after is not None else 0
+            return tasks[start:start + limit], len(tasks)
+
+        if order_by in self.sorted_fields and user_id is not None:
+            keys = self._sorted_keys.get((order_by, user_id), [])
+            start = bisect_right(keys, after) if after is not None else 0
+            return self._tasks_of(keys[start:start + limit]), len(keys)
+
+        tasks = self.list(user_id)
+        remaining = [task for task in tasks if after is None or sort_key(task) > after]
+        return sorted(remaining, key=sort_key)[:limit], len(tasks)
+
+    def _filtered(self, task_filter: TaskFilter) -> List[Task]:
+        """Tasks the filter selects, starting from the narrowest index available."""
+        user_id = task_filter.user_id
+        if task_filter.ids is not None:
+            candidates = (self.tasks_by_id.get(task_id) for task_id in task_filter.ids)
+        elif task_filter.title_prefix is not None and "title" in self.sorted_fields:
+            keys = self._sorted_keys.get(("title", user_id), [])
+            candidates = self._tasks_of(self._prefix_range(keys, task_filter.title_prefix))
+        else:
+            task_ids = self.task_ids_by_user.get(user_id, {})
+            if task_filter.assignee_id is not None:
+                task_ids = min(task_ids, self.task_ids_by_user.get(task_filter.assignee_id, {}), key=len)
+            candidates = (self.tasks_by_id[task_id] for task_id in task_ids)
+        return [task for task in candidates if task is not None and task_filter.matches(task)]
+
+    def _filtered_sorted(self, task_filter: TaskFilter, order_by: str) -> List[Task]:
+        """Filtered tasks by `(order_by, id)`, walking the sorted index of `order_by` when there is one."""
+        keys = self._sorted_keys.get((order_by, task_filter.user_id)) if order_by in self.sorted_fields else None
+        if keys is None or task_filter.ids is not None or task_filter.assignee_id is not None:
+            return sorted(self._filtered(task_filter), key=lambda task: (getattr(task, order_by), task.id))
+        if order_by == "title" and task_filter.title_prefix is not None:
+            keys = self._prefix_range(keys, task_filter.title_prefix)
+        return [task for task in self._tasks_of(keys) if task_filter.matches(task)]
+
+    @staticmethod
+    def _prefix_range(keys: List[Tuple[Any, UUID]], prefix: str) -> List[Tuple[Any, UUID]]:
+        """The `(title, id)` keys whose title starts with `prefix`."""
+        return keys[bisect_left(keys, (prefix,)):bisect_left(keys, (prefix + "\U0010ffff",))]
+
+    def _tasks_of(self, keys: List[Tuple[Any, UUID]]) -> List[Task]:
+        return [self.tasks_by_id[task_id] for _, task_id in keys]
+
+    def _index(self, task: Task) -> None:
+        users = tuple(task.users)
+        values = tuple(getattr(task, order_by) for order_by in self.sorted_fields)
+        self._indexed[task.id] = (users, values)
+        if self.search_index is not None:
+            self.search_index.index(task)
+        for user_id in users:
+            self.task_ids_by_user.setdefault(user_id, {})[task.id] = None
+            for order_by, value in zip(self.sorted_fields, values):
+                insort(self._sorted_keys.setdefault((order_by, user_id), []), (value, task.id))
+
+    def _unindex(self, task_id: UUID) -> None:
+        users, values = self._indexed.pop(task_id)
+        if self.search_index is not None:
+            self.search_index.remove(task_id)
+        for user_id in users:
+            task_ids = self.task_ids_by_user[user_id]
+            del task_ids[task_id]
+            if not task_ids:
+                del self.task_ids_by_user[user_id]
+            for order_by, value in zip(self.sorted_fields, values):
+                keys = self._sorted_keys[(order_by, user_id)]
+                del keys[bisect_left(keys, (value, task_id))]
+                if not keys:
+                    del self._sorted_keys[(order_by, user_id)]
+
+    async def aget_by_id(self, task_id: UUID) -> Optional[Task]:
+        return self.get_by_id(task_id)
+
+    async def adelete(self, task_id: UUID) -> None:
+        self.delete(task_id)
+
+    async def alist_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        return self.list_page(user_id, order_by, offset, limit, task_filter)
+
+    async def alist_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        return self.list_after(user_id, order_by, after, limit, task_filter)
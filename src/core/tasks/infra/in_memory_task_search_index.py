@@ -0,0 +1,76 @@
+import re
+from heapq import nsmallest
+from uuid import UUID
+from typing import Dict, List, Tuple
+
+from src.core.tasks.domain.task_search_index_interface import TaskSearchIndexInterface
+from src.core.tasks.domain.tasks import Task
+
+# Weight of a word found in the title and in the description, as Postgres' A and B.
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words of `text`, like the 'simple' text search configuration."""
+    return _WORD.findall((text or "").lower())
+
+
+class InMemoryTaskSearchIndex(TaskSearchIndexInterface):
+    """Inverted index of task words, partitioned by user.
+
+    `postings[(user_id, word)]` maps the ids of the user's tasks containing the word
+    to its weighted number of occurrences, so a search only ever looks at the
+    postings of the searching user, starting from the rarest word of the query.
+    `InMemoryTaskRepository` keeps it in sync through `index` and `remove`.
+    """
+
+    def __init__(self) -> None:
+        self.tasks_by_id: Dict[UUID, Task] = {}
+        self.postings: Dict[Tuple[UUID, str], Dict[UUID, float]] = {}
+        # Users and words each task is indexed under, to remove it again.
+        self._indexed: Dict[UUID, Tuple[Tuple[UUID, ...], Tuple[str, ...]]] = {}
+
+    def index(self, task: Task) -> None:
+        """Add a task, or refresh it after its title, description or users changed."""
+        if task.id in self._indexed:
+            self.remove(task.id)
+        weights: Dict[str, float] = {}
+        for word in tokenize(task.title):
+            weights[word] = weights.get(word, 0.0) + TITLE_WEIGHT
+        for word in tokenize(task.description):
+            weights[word] = weights.get(word, 0.0) + DESCRIPTION_WEIGHT
+        users = tuple(task.users)
+        for user_id in users:
+            for word, weight in weights.items():
+                self.postings.setdefault((user_id, word), {})[task.id] = weight
+        self.tasks_by_id[task.id] = task
+        self._indexed[task.id] = (users, tuple(weights))
+
+    def remove(self, task_id: UUID) -> None:
+        indexed = self._indexed.pop(task_id, None)
+        if indexed is None:
+            return
+        users, words = indexed
+        for user_id in users:
+            for word in words:
+                postings = self.postings[(user_id, word)]
+                del postings[task_id]
+                if not postings:
+                    del self.postings[(user_id, word)]
+        del self.tasks_by_id[task_id]
+
+    def search(self, user_id: UUID, query: str, offset: int, limit: int) -> Tuple[List[Task], int]:
+        words = set(tokenize(query))
+        if not words:
+            return [], 0
+        postings = sorted((self.postings.get((user_id, word), {}) for word in words), key=len)
+        scores = {
+            task_id: sum(word_postings[task_id] for word_postings in postings)
+            for task_id in postings[0]
+            if all(task_id in word_postings for word_postings in postings[1:])
+        }
+        ranked = nsmallest(offset + limit, scores, key=lambda task_id: (-scores[task_id], task_id))
+        return [self.tasks_by_id[task_id] for task_id in ranked[offset:]], len(scores)
@@ -0,0 +1,94 @@
+import uuid
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core.tasks.application.exceptions import InvalidTaskData
+from src.core.tasks.application.use_cases.bulk_create_task import BulkCreateTask
+from src.core.tasks.application.use_cases.create_task import CreateTask
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
+from src.core.user.domain.user import User
+from src.core.user.domain.user_repository_interface import UserRepositoryInterface
+from src.core.user.infra.in_memory_user_repository import InMemoryUserRepository
+
+
+@pytest.fixture
+def user() -> User:
+    return User(username="User1", email="user1@gmail.com", password="securepassword123")
+
+
+@pytest.fixture
+def use_case(user) -> BulkCreateTask:
+    return BulkCreateTask(
+        repository=InMemoryTaskRepository(),
+        user_repository=InMemoryUserRepository([user]),
+    )
+
+
+class TestBulkCreateTask:
+    def test_creates_every_valid_task_with_one_save(self, user):
+        task_repository = create_autospec(InMemoryTaskRepository, instance=True)
+        use_case = BulkCreateTask(
+            repository=task_repository, user_repository=InMemoryUserRepository([user])
+        )
+
+        response = use_case.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=[
+            CreateTask.CreateTaskRequest(title=f"Task {index}", user_ids={user.id})
+            for index in range(3)
+        ]))
+
+        assert (response.created, response.failed) == (3, 0)
+        assert [result.index for result in response.results] == [0, 1, 2]
+        assert all(result.id and result.error is None for result in response.results)
+        assert response.results[0].links["get"]["href"] == f"/api/tasks/{response.results[0].id}"
+        task_repository.save_many.assert_called_once()
+        [saved] = task_repository.save_many.call_args.args
+        assert [task.id for task in saved] == [result.id for result in response.results]
+
+    def test_checks_all_user_ids_with_one_lookup(self, user):
+        user_repository = create_autospec(UserRepositoryInterface)
+        user_repository.find_missing_ids.return_value = set()
+        other_id = uuid.uuid4()
+        use_case = BulkCreateTask(repository=InMemoryTaskRepository(), user_repository=user_repository)
+
+        use_case.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=[
+            CreateTask.CreateTaskRequest(title="Task 1", user_ids={user.id}),
+            CreateTask.CreateTaskRequest(title="Task 2", user_ids={user.id, other_id}),
+        ]))
+
+        user_repository.find_missing_ids.assert_called_once_with({user.id, other_id})
+
+    def test_reports_failures_per_task_and_creates_the_rest(self, use_case, user):
+        response = use_case.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=[
+            CreateTask.CreateTaskRequest(title="Valid", user_ids={user.id}),
+            CreateTask.CreateTaskRequest(title="", user_ids={user.id}),
+            CreateTask.CreateTaskRequest(title="Unknown user", user_ids={uuid.uuid4()}),
+        ]))
+
+        assert (response.created, response.failed) == (1, 2)
+        valid, empty_title, unknown_user = response.results
+        assert valid.id is not None and valid.error is None
+        assert empty_title.id is None and "Title cannot be empty." in empty_title.error
+        assert unknown_user.id is None and "do not exist" in unknown_user.error
+        assert [task.id for task in use_case.repository.list(user.id)] == [valid.id]
+
+    def test_nothing_is_saved_when_every_task_fails(self, use_case, user):
+        response = use_case.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=[
+            CreateTask.CreateTaskRequest(title="", user_ids={user.id}),
+        ]))
+
+        assert (response.created, response.failed) == (0, 1)
+        assert use_case.repository.tasks == []
+
+    @pytest.mark.parametrize("count", [0, 4])
+    def test_rejects_empty_and_oversized_batches(self, user, count):
+        use_case = BulkCreateTask(
+            repository=InMemoryTaskRepository(),
+            user_repository=InMemoryUserRepository([user]),
+            max_tasks=3,
+        )
+
+        with pytest.raises(InvalidTaskData):
+            use_case.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=[
+                CreateTask.CreateTaskRequest(title="Task", user_ids={user.id}) for _ in range(count)
+            ]))
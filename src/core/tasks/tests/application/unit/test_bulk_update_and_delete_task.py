@@ -0,0 +1,54 @@
+import uuid
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core.tasks.application.exceptions import InvalidTaskData
+from src.core.tasks.application.use_cases.bulk_delete_task import BulkDeleteTask
+from src.core.tasks.application.use_cases.bulk_update_task_status import BulkUpdateTaskStatus
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.domain.tasks import TaskStatus
+
+
+@pytest.fixture
+def repository():
+    return create_autospec(TaskRepositoryInterface)
+
+
+class TestBulkUpdateTaskStatus:
+    def test_updates_the_selection_in_one_call(self, repository):
+        repository.update_status_many.return_value = 3
+        task_filter = TaskFilter(user_id=uuid.uuid4(), status=TaskStatus.PENDING)
+
+        response = BulkUpdateTaskStatus(repository).execute(
+            BulkUpdateTaskStatus.BulkUpdateTaskStatusRequest(task_filter=task_filter, status=TaskStatus.COMPLETED)
+        )
+
+        assert response.updated == 3
+        repository.update_status_many.assert_called_once_with(task_filter, TaskStatus.COMPLETED)
+
+    def test_rejects_a_selection_of_every_task(self, repository):
+        with pytest.raises(InvalidTaskData):
+            BulkUpdateTaskStatus(repository).execute(BulkUpdateTaskStatus.BulkUpdateTaskStatusRequest(
+                task_filter=TaskFilter(user_id=uuid.uuid4()), status=TaskStatus.COMPLETED
+            ))
+        repository.update_status_many.assert_not_called()
+
+
+class TestBulkDeleteTask:
+    def test_deletes_the_selection_in_one_call(self, repository):
+        repository.delete_many.return_value = 2
+        task_filter = TaskFilter(user_id=uuid.uuid4(), ids=frozenset({uuid.uuid4(), uuid.uuid4()}))
+
+        response = BulkDeleteTask(repository).execute(BulkDeleteTask.BulkDeleteTaskRequest(task_filter=task_filter))
+
+        assert response.deleted == 2
+        repository.delete_many.assert_called_once_with(task_filter)
+
+    def test_rejects_too_many_ids(self, repository):
+        task_filter = TaskFilter(user_id=uuid.uuid4(), ids=frozenset(uuid.uuid4() for _ in range(501)))
+
+        with pytest.raises(InvalidTaskData):
+            BulkDeleteTask(repository).execute(BulkDeleteTask.BulkDeleteTaskRequest(task_filter=task_filter))
+        repository.delete_many.assert_not_called()
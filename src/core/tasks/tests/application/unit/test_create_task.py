@@ -42,11 +42,13 @@ def mock_user_repository_with_users(mock_user_repository):
     user1 = User(id=uuid.uuid4(), username="User1", email="user1@gmail.com", password="securepassword123")
     user2 = User(id=uuid.uuid4(), username="User2", email="user2@gmail.com", password="securepassword123")
     mock_user_repository.list.return_value = [user1, user2]
+    mock_user_repository.find_missing_ids.side_effect = lambda ids: set(ids) - {user1.id, user2.id}
     return mock_user_repository
 
 @pytest.fixture
 def mock_empty_user_repository(mock_user_repository):
     mock_user_repository.list.return_value = []
+    mock_user_repository.find_missing_ids.side_effect = lambda ids: set(ids)
     return mock_user_repository
 
 class TestCreateTask:
@@ -116,4 +118,17 @@ class TestCreateTask:
 
         assert isinstance(response, CreateTask.CreateTaskResponse)
         assert isinstance(response.id, uuid.UUID)
-        mock_task_repository.save.assert_called_once()
\ No newline at end of file
+        mock_task_repository.save.assert_called_once()
+
+    def test_when_creating_task_then_only_referenced_users_are_checked(
+        self, mock_task_repository, mock_user_repository_with_users
+    ):
+        create_task = CreateTask(mock_task_repository, mock_user_repository_with_users)
+        user_id = mock_user_repository_with_users.list.return_value[0].id
+
+        create_task.execute(
+            CreateTask.CreateTaskRequest(title="Test Task", user_ids={user_id})
+        )
+
+        mock_user_repository_with_users.find_missing_ids.assert_called_once_with({user_id})
+        mock_user_repository_with_users.list.assert_not_called()
@@ -0,0 +1,27 @@
+import uuid
+
+from src.core.tasks.application.use_cases.export_tasks import ExportTasks
+from src.core.tasks.domain.tasks import Task
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
+
+
+class TestExportTasks:
+    def test_exports_every_task_of_the_user_ordered_by_id_without_links(self):
+        user_id = uuid.uuid4()
+        tasks = [Task(title=f"Task {i}", description="", users={user_id}) for i in range(5)]
+        repository = InMemoryTaskRepository(tasks + [Task(title="Other", description="", users={uuid.uuid4()})])
+
+        response = ExportTasks(repository).execute(ExportTasks.ExportTasksRequest(user_id=user_id))
+
+        outputs = list(response.tasks)
+        assert [output.id for output in outputs] == sorted(task.id for task in tasks)
+        assert all(output.links == {} for output in outputs)
+
+    def test_tasks_are_produced_lazily(self):
+        user_id = uuid.uuid4()
+        repository = InMemoryTaskRepository([Task(title="Task", description="", users={user_id})])
+
+        response = ExportTasks(repository).execute(ExportTasks.ExportTasksRequest(user_id=user_id))
+        repository.save(Task(title="Added after", description="", users={user_id}))
+
+        assert len(list(response.tasks)) == 2
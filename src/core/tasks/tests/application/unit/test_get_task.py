@@ -3,6 +3,8 @@ import pytest
 from datetime import datetime
 from src.core.tasks.application.use_cases.get_task import GetTask, TaskOutput
 from src.core.tasks.application.exceptions import TaskNotFound
+from src.core.tasks.domain.tasks import Task
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
 
 class FakeTask:
     def __init__(self, id, title, description, status, created_at, updated_at, users):
@@ -67,4 +69,12 @@ def test_get_task_links_structure():
     assert links["delete"]["href"] == f"/api/tasks/{task.id}"
     assert links["update"]["href"] == f"/api/tasks/{task.id}"
     assert links["patch"]["href"] == f"/api/tasks/{task.id}"
-    assert links["create"]["href"] == "/api/tasks"
\ No newline at end of file
+    assert links["create"]["href"] == "/api/tasks"
+
+
+def test_get_task_version_is_the_updated_at_of_the_task():
+    task = Task(title="Test Task", description="", updated_at=datetime(2024, 1, 2, 12, 0, 0))
+    use_case = GetTask(InMemoryTaskRepository([task]))
+
+    assert use_case.version(GetTask.GetTaskRequest(task_id=task.id)) == datetime(2024, 1, 2, 12, 0, 0)
+    assert use_case.version(GetTask.GetTaskRequest(task_id=uuid.uuid4())) is None
@@ -1,12 +1,20 @@
 import uuid
+import asyncio
+from datetime import datetime
 from unittest.mock import create_autospec
+from urllib.parse import parse_qs, urlparse
 import pytest
 
 from src.core.user.domain.user_repository_interface import UserRepositoryInterface
-from src.core.tasks.application.exceptions import RelatedUserNotFound, InvalidTaskData
+from src.adapters.cursor.signed_cursor_adapter import SignedCursorAdapter
+from src.core.tasks.application.exceptions import RelatedUserNotFound, InvalidTaskData, InvalidTaskBy, InvalidCursor
+from src.core._shared.links import InvalidLinksMode
 from src.core.tasks.application.use_cases.create_task import CreateTask
+from src.core.tasks.application.use_cases.list_task import ListTask
 from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
-from src.core.tasks.domain.tasks import Task
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task, TaskStatus
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
 from src.core.user.domain.user import User
 
 @pytest.fixture
@@ -22,11 +30,13 @@ def mock_user_repository_with_users(mock_user_repository):
     user1 = User(id=uuid.uuid4(), username="User1", email="user1@gmail.com", password="securepassword123")
     user2 = User(id=uuid.uuid4(), username="User2", email="user2@gmail.com", password="securepassword123")
     mock_user_repository.list.return_value = [user1, user2]
+    mock_user_repository.find_missing_ids.side_effect = lambda ids: set(ids) - {user1.id, user2.id}
     return mock_user_repository
 
 @pytest.fixture
 def mock_empty_user_repository(mock_user_repository):
     mock_user_repository.list.return_value = []
+    mock_user_repository.find_missing_ids.side_effect = lambda ids: set(ids)
     return mock_user_repository
 
 class TestCreateTask:
@@ -83,4 +93,210 @@ class TestCreateTask:
         response = create_task.execute(request)
         assert isinstance(response, CreateTask.CreateTaskResponse)
         assert isinstance(response.id, uuid.UUID)
-        mock_task_repository.save.assert_called_once()
\ No newline at end of file
+        mock_task_repository.save.assert_called_once()
+
+class TestListTask:
+    def test_when_listing_then_page_is_requested_from_repository(self, mock_task_repository):
+        user_id = uuid.uuid4()
+        task = Task(title="Task", description="A task", users={user_id})
+        mock_task_repository.list_page.return_value = ([task], 25)
+        list_task = ListTask(mock_task_repository)
+
+        response = list_task.execute(
+            ListTask.ListTaskRequest(order_by="created_at", page=2, size=10, user_id=user_id)
+        )
+
+        mock_task_repository.list_page.assert_called_once_with(
+            user_id=user_id, order_by="created_at", offset=10, limit=10
+        )
+        mock_task_repository.list.assert_not_called()
+        assert [output.id for output in response.data] == [task.id]
+        assert response.meta.total_tasks == 25
+        assert response.links["next"] == "/api/tasks?page=3&size=10&order_by=created_at"
+        assert response.links["last"] == "/api/tasks?page=3&size=10&order_by=created_at"
+
+    def test_when_on_last_page_then_there_is_no_next_link(self, mock_task_repository):
+        mock_task_repository.list_page.return_value = ([], 20)
+        list_task = ListTask(mock_task_repository)
+
+        response = list_task.execute(
+            ListTask.ListTaskRequest(page=2, size=10, user_id=uuid.uuid4())
+        )
+
+        assert response.links["next"] is None
+        assert response.links["prev"] == "/api/tasks?page=1&size=10&order_by=title"
+
+    def test_when_order_by_is_invalid_then_raise_invalid_task_by(self, mock_task_repository):
+        list_task = ListTask(mock_task_repository)
+
+        with pytest.raises(InvalidTaskBy):
+            list_task.execute(
+                ListTask.ListTaskRequest(order_by="abobora", user_id=uuid.uuid4())
+            )
+        mock_task_repository.list_page.assert_not_called()
+
+    def test_when_page_is_not_positive_then_raise_invalid_task_data(self, mock_task_repository):
+        list_task = ListTask(mock_task_repository)
+
+        with pytest.raises(InvalidTaskData):
+            list_task.execute(
+                ListTask.ListTaskRequest(page=0, user_id=uuid.uuid4())
+            )
+
+    def test_when_following_cursors_then_every_task_is_listed_once(self):
+        user_id = uuid.uuid4()
+        repository = InMemoryTaskRepository()
+        for title in ["E", "B", "D", "A", "C"]:
+            repository.save(Task(title=title, description="", users={user_id}))
+        list_task = ListTask(repository, cursor_adapter=SignedCursorAdapter(secret_key="secret"))
+
+        titles = []
+        cursor = ""
+        while cursor is not None:
+            response = list_task.execute(
+                ListTask.ListTaskRequest(size=2, user_id=user_id, cursor=cursor)
+            )
+            titles.extend(output.title for output in response.data)
+            next_link = response.links["next"]
+            cursor = parse_qs(urlparse(next_link).query)["cursor"][0] if next_link else None
+
+        assert titles == ["A", "B", "C", "D", "E"]
+        assert response.meta.total_tasks == 5
+
+    def test_when_cursor_is_tampered_then_raise_invalid_cursor(self, mock_task_repository):
+        adapter = SignedCursorAdapter(secret_key="secret")
+        cursor = adapter.encode({"order_by": "title", "value": "A", "id": str(uuid.uuid4())})
+        list_task = ListTask(mock_task_repository, cursor_adapter=adapter)
+
+        with pytest.raises(InvalidCursor):
+            list_task.execute(
+                ListTask.ListTaskRequest(user_id=uuid.uuid4(), cursor=cursor[:-2] + "xx")
+            )
+        mock_task_repository.list_after.assert_not_called()
+
+    def test_when_cursor_was_issued_for_another_ordering_then_raise_invalid_cursor(self, mock_task_repository):
+        adapter = SignedCursorAdapter(secret_key="secret")
+        cursor = adapter.encode({"order_by": "title", "value": "A", "id": str(uuid.uuid4())})
+        list_task = ListTask(mock_task_repository, cursor_adapter=adapter)
+
+        with pytest.raises(InvalidCursor):
+            list_task.execute(
+                ListTask.ListTaskRequest(order_by="created_at", user_id=uuid.uuid4(), cursor=cursor)
+            )
+
+    def test_when_listing_async_then_same_page_as_sync(self):
+        user_id = uuid.uuid4()
+        repository = InMemoryTaskRepository()
+        for title in ["C", "A", "B"]:
+            repository.save(Task(title=title, description="", users={user_id}))
+        list_task = ListTask(repository, cursor_adapter=SignedCursorAdapter(secret_key="secret"))
+
+        for cursor in [None, ""]:
+            request = ListTask.ListTaskRequest(size=2, user_id=user_id, cursor=cursor)
+            assert asyncio.run(list_task.aexecute(request)) == list_task.execute(request)
+
+    @pytest.mark.parametrize("links, expected_rels", [
+        ("full", ["self", "delete", "update", "get", "patch"]),
+        ("minimal", ["self"]),
+        ("none", []),
+    ])
+    def test_when_links_mode_is_given_then_item_links_follow_it(self, links, expected_rels):
+        user_id = uuid.uuid4()
+        repository = InMemoryTaskRepository([Task(title="A", description="", users={user_id})])
+
+        response = ListTask(repository).execute(
+            ListTask.ListTaskRequest(user_id=user_id, links=links)
+        )
+
+        assert list(response.data[0].links) == expected_rels
+        assert ("links=" in response.links["self"]) == (links != "full")
+
+    def test_when_links_mode_is_invalid_then_raise_invalid_links_mode(self, mock_task_repository):
+        with pytest.raises(InvalidLinksMode):
+            ListTask(mock_task_repository).execute(
+                ListTask.ListTaskRequest(user_id=uuid.uuid4(), links="all")
+            )
+
+    def test_when_filters_are_given_then_a_task_filter_is_passed(self, mock_task_repository):
+        user_id, assignee_id = uuid.uuid4(), uuid.uuid4()
+        mock_task_repository.list_page.return_value = ([], 0)
+
+        ListTask(mock_task_repository).execute(ListTask.ListTaskRequest(
+            user_id=user_id, status="completed", assignee_id=assignee_id,
+            updated_after=datetime(2025, 1, 1), title_prefix="Rel"
+        ))
+
+        assert mock_task_repository.list_page.call_args.kwargs["task_filter"] == TaskFilter(
+            user_id=user_id, status=TaskStatus.COMPLETED, assignee_id=assignee_id,
+            updated_after=datetime(2025, 1, 1), title_prefix="Rel"
+        )
+
+    def test_when_filtering_then_only_matching_tasks_are_listed_and_counted(self):
+        user_id, other_id = uuid.uuid4(), uuid.uuid4()
+        repository = InMemoryTaskRepository([
+            Task(title="Release 1", description="", users={user_id}, status=TaskStatus.COMPLETED),
+            Task(title="Release 2", description="", users={user_id, other_id}, status=TaskStatus.COMPLETED),
+            Task(title="Review", description="", users={user_id, other_id}),
+            Task(title="Release 3", description="", users={other_id}, status=TaskStatus.COMPLETED),
+        ])
+        list_task = ListTask(repository, cursor_adapter=SignedCursorAdapter(secret_key="secret"))
+
+        for cursor in (None, ""):
+            response = list_task.execute(ListTask.ListTaskRequest(
+                user_id=user_id, status="completed", title_prefix="Rel", cursor=cursor
+            ))
+            assert [output.title for output in response.data] == ["Release 1", "Release 2"]
+            assert response.meta.total_tasks == 2
+
+        response = list_task.execute(ListTask.ListTaskRequest(user_id=user_id, assignee_id=other_id))
+        assert [output.title for output in response.data] == ["Release 2", "Review"]
+
+    def test_when_filtering_then_pagination_links_keep_the_filters(self):
+        user_id = uuid.uuid4()
+        repository = InMemoryTaskRepository(
+            [Task(title=f"Task {i}", description="", users={user_id}) for i in range(3)]
+        )
+
+        response = ListTask(repository).execute(ListTask.ListTaskRequest(
+            user_id=user_id, size=1, status="pending", created_after=datetime(2025, 1, 1, 12, 30)
+        ))
+
+        query = parse_qs(urlparse(response.links["next"]).query)
+        assert query["status"] == ["pending"]
+        assert query["created_after"] == ["2025-01-01T12:30:00"]
+        assert query["page"] == ["2"]
+        assert response.meta.query_params["status"] == "pending"
+
+    @pytest.mark.parametrize("filters", [
+        {"status": "archived"},
+        {"created_after": datetime(2025, 1, 2), "created_before": datetime(2025, 1, 1)},
+        {"updated_after": datetime(2025, 1, 1), "updated_before": datetime(2025, 1, 1)},
+    ])
+    def test_when_filters_are_invalid_then_raise_invalid_task_data(self, mock_task_repository, filters):
+        with pytest.raises(InvalidTaskData):
+            ListTask(mock_task_repository).execute(ListTask.ListTaskRequest(user_id=uuid.uuid4(), **filters))
+        mock_task_repository.list_page.assert_not_called()
+
+    def test_when_versioning_then_the_filtered_collection_is_probed(self):
+        user_id = uuid.uuid4()
+        repository = InMemoryTaskRepository([
+            Task(title="Done", description="", users={user_id}, status=TaskStatus.COMPLETED,
+                 updated_at=datetime(2025, 1, 2)),
+            Task(title="Todo", description="", users={user_id}, updated_at=datetime(2025, 1, 3)),
+        ])
+        list_task = ListTask(repository)
+
+        assert list_task.version(ListTask.ListTaskRequest(user_id=user_id)) == (datetime(2025, 1, 3), 2)
+        assert list_task.version(ListTask.ListTaskRequest(user_id=user_id, status="completed")) == (
+            datetime(2025, 1, 2), 1
+        )
+        assert list_task.version(ListTask.ListTaskRequest(user_id=uuid.uuid4())) == (None, 0)
+
+    def test_when_versioning_then_nothing_is_listed(self, mock_task_repository):
+        mock_task_repository.collection_version.return_value = (None, 0)
+        user_id = uuid.uuid4()
+
+        ListTask(mock_task_repository).version(ListTask.ListTaskRequest(user_id=user_id))
+
+        mock_task_repository.collection_version.assert_called_once_with(user_id)
+        mock_task_repository.list_page.assert_not_called()
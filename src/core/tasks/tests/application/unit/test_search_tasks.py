@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+
+from src.core._shared.links import InvalidLinksMode
+from src.core.tasks.application.exceptions import InvalidTaskData
+from src.core.tasks.application.use_cases.search_tasks import SearchTasks
+from src.core.tasks.domain.tasks import Task
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
+from src.core.tasks.infra.in_memory_task_search_index import InMemoryTaskSearchIndex
+
+
+@pytest.fixture
+def user_id():
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def use_case(user_id):
+    repository = InMemoryTaskRepository(search_index=InMemoryTaskSearchIndex())
+    for index in range(3):
+        repository.save(Task(title=f"Report {index}", description="weekly", users={user_id}))
+    repository.save(Task(title="Groceries", description="", users={user_id}))
+    return SearchTasks(search_index=repository.search_index)
+
+
+class TestSearchTasks:
+    def test_returns_a_ranked_page_with_meta_and_links(self, use_case, user_id):
+        response = use_case.execute(SearchTasks.SearchTasksRequest(
+            user_id=user_id, query=" weekly report ", page=1, size=2
+        ))
+
+        assert len(response.data) == 2
+        assert all(task.title.startswith("Report") for task in response.data)
+        assert response.data[0].links["self"] == f"/api/tasks/{response.data[0].id}"
+        assert response.meta.total_tasks == 3
+        assert response.meta.query_params == {"q": "weekly report", "page": 1, "size": 2}
+        assert response.links["self"] == "/api/tasks/search?q=weekly+report&page=1&size=2"
+        assert response.links["next"] == "/api/tasks/search?q=weekly+report&page=2&size=2"
+        assert response.links["prev"] is None
+
+    def test_last_page(self, use_case, user_id):
+        response = use_case.execute(SearchTasks.SearchTasksRequest(
+            user_id=user_id, query="report", page=2, size=2, links="none"
+        ))
+
+        assert len(response.data) == 1
+        assert response.data[0].links == {}
+        assert response.links["next"] is None
+        assert response.links["prev"] == "/api/tasks/search?q=report&page=1&size=2&links=none"
+
+    @pytest.mark.parametrize("query, page, size", [
+        ("", 1, 10),
+        ("   ", 1, 10),
+        ("x" * 201, 1, 10),
+        ("report", 0, 10),
+        ("report", 1, 0),
+    ])
+    def test_rejects_invalid_requests(self, use_case, user_id, query, page, size):
+        with pytest.raises(InvalidTaskData):
+            use_case.execute(SearchTasks.SearchTasksRequest(user_id=user_id, query=query, page=page, size=size))
+
+    def test_rejects_unknown_links_mode(self, use_case, user_id):
+        with pytest.raises(InvalidLinksMode):
+            use_case.execute(SearchTasks.SearchTasksRequest(user_id=user_id, query="report", links="all"))
@@ -72,4 +72,14 @@ class TestUpdateTask:
         use_case.execute(request)
         assert existing_task.title == "Old Title"
         assert existing_task.description == "Only Description Updated"
-        mock_task_repository.save.assert_called_once_with(existing_task)
\ No newline at end of file
+        mock_task_repository.save.assert_called_once_with(existing_task)
+
+    def test_update_bumps_updated_at(self, mock_task_repository, existing_task):
+        mock_task_repository.get_by_id.return_value = existing_task
+        previous = existing_task.updated_at
+
+        UpdateTask(mock_task_repository).execute(
+            UpdateTask.UpdateTaskRequest(task_id=existing_task.id, status=TaskStatus.COMPLETED)
+        )
+
+        assert existing_task.updated_at > previous
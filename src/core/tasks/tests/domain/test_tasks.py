@@ -1,3 +1,5 @@
+import copy
+import pickle
 import uuid
 from uuid import UUID
 from datetime import datetime
@@ -55,4 +57,17 @@ class TestTask:
         task = Task(title="Task 1", description="desc")
         assert isinstance(task, Task)
         assert task.status == TaskStatus.PENDING
-        assert not task.completed
\ No newline at end of file
+        assert not task.completed
+
+    def test_valid_task_has_no_notification_nor_instance_dict(self):
+        task = Task(title="Task 1", description="desc")
+        assert task._notification is None
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown = True
+
+    def test_copies_keep_every_field(self):
+        task = Task(title="Task 1", description="desc", users={uuid.uuid4()})
+        clone = copy.copy(task)
+        assert (clone.id, clone.title, clone.users) == (task.id, task.title, task.users)
+        assert pickle.loads(pickle.dumps(task)) == task
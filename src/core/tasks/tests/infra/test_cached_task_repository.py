@@ -0,0 +1,369 @@
+import asyncio
+import threading
+import uuid
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from src.adapters.cache.lru_cache_adapter import LRUCacheAdapter
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task, TaskStatus
+from src.core.tasks.infra.cached_task_repository import CachedTaskRepository
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
+
+
+class CountingRepository(InMemoryTaskRepository):
+    """In-memory repository that counts `get_by_id` calls and can hold them until released."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.error = None
+        self.pages = 0
+
+    def list_page(self, *args, **kwargs):
+        self.pages += 1
+        return super().list_page(*args, **kwargs)
+
+    def get_by_id(self, task_id):
+        """Read the task, then wait: a write made meanwhile is not in the result."""
+        snapshot = self._snapshot(task_id)
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return snapshot
+
+    async def aget_by_id(self, task_id):
+        """`get_by_id` that waits without blocking the event loop."""
+        snapshot = self._snapshot(task_id)
+        while not self.release.is_set():
+            await asyncio.sleep(0.001)
+        if self.error is not None:
+            raise self.error
+        return snapshot
+
+    def _snapshot(self, task_id):
+        self.reads += 1
+        task = super().get_by_id(task_id)
+        self.started.set()
+        return None if task is None else Task(
+            id=task.id, title=task.title, description=task.description, status=task.status,
+            created_at=task.created_at, updated_at=task.updated_at, users=set(task.users),
+        )
+
+
+@pytest.fixture
+def user_id():
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def task(user_id):
+    return Task(title="Cached", description="", users={user_id})
+
+
+@pytest.fixture
+def inner(task):
+    return CountingRepository([task])
+
+
+@pytest.fixture
+def repo(inner):
+    return CachedTaskRepository(inner, LRUCacheAdapter(max_size=2, ttl=60))
+
+
+def test_second_read_is_served_from_the_cache(repo, inner, task):
+    assert repo.get_by_id(task.id).title == "Cached"
+    assert repo.get_by_id(str(task.id).upper()).title == "Cached"
+
+    assert inner.reads == 1
+    stats = repo.stats
+    assert (stats.hits, stats.misses, stats.coalesced) == (1, 1, 0)
+
+
+def test_callers_get_their_own_copy(repo, task):
+    first = repo.get_by_id(task.id)
+    first.title = "Mutated"
+    first.users.add(uuid.uuid4())
+
+    again = repo.get_by_id(task.id)
+    assert again.title == "Cached"
+    assert again.users == task.users
+
+
+def test_missing_tasks_are_not_cached(repo, inner):
+    missing = uuid.uuid4()
+    assert repo.get_by_id(missing) is None
+    assert repo.get_by_id(missing) is None
+    assert inner.reads == 2
+
+
+@pytest.mark.parametrize("write", [
+    lambda repo, task: repo.save(task),
+    lambda repo, task: repo.update(task),
+    lambda repo, task: repo.save_many([task]),
+    lambda repo, task: repo.update_status_many(
+        TaskFilter(user_id=next(iter(task.users)), title_prefix="Cac"), TaskStatus.COMPLETED
+    ),
+    lambda repo, task: repo.update_status_many(
+        TaskFilter(user_id=next(iter(task.users)), ids=frozenset({task.id})), TaskStatus.COMPLETED
+    ),
+])
+def test_writes_invalidate_the_task(repo, inner, task, write):
+    repo.get_by_id(task.id)
+    updated = repo.get_by_id(task.id)
+    updated.title = "Renamed"
+
+    write(repo, updated)
+
+    fresh, stored = repo.get_by_id(task.id), inner.tasks_by_id[task.id]
+    assert (fresh.title, fresh.status) == (stored.title, stored.status)
+    assert inner.reads == 2
+
+
+@pytest.mark.parametrize("delete", [
+    lambda repo, task: repo.delete(task.id),
+    lambda repo, task: repo.delete_many(TaskFilter(user_id=next(iter(task.users)), title_prefix="Cac")),
+    lambda repo, task: asyncio.run(repo.adelete(task.id)),
+])
+def test_deletes_invalidate_the_task(repo, task, delete):
+    repo.get_by_id(task.id)
+
+    delete(repo, task)
+
+    assert repo.get_by_id(task.id) is None
+
+
+def test_evictions_are_counted(user_id):
+    tasks = [Task(title=f"Task {i}", description="", users={user_id}) for i in range(3)]
+    repo = CachedTaskRepository(InMemoryTaskRepository(tasks), LRUCacheAdapter(max_size=2, ttl=60))
+
+    for task in tasks:
+        repo.get_by_id(task.id)
+
+    assert repo.stats.evictions == 1
+
+
+def test_concurrent_misses_fetch_once(repo, inner, task):
+    inner.release.clear()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(repo.get_by_id(task.id))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    assert inner.started.wait(timeout=5)
+    while repo.stats.coalesced < 7:
+        threading.Event().wait(0.001)
+    inner.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert inner.reads == 1
+    assert [result.title for result in results] == ["Cached"] * 8
+    assert len({id(result) for result in results}) == 8
+    assert (repo.stats.misses, repo.stats.coalesced) == (1, 7)
+
+
+def test_fetch_overtaken_by_a_write_is_not_cached(repo, inner, task):
+    inner.release.clear()
+    reader = threading.Thread(target=repo.get_by_id, args=(task.id,))
+    reader.start()
+    assert inner.started.wait(timeout=5)
+
+    repo.save(Task(id=task.id, title="Renamed", description="", users=set(task.users)))
+    inner.release.set()
+    reader.join(timeout=5)
+
+    assert repo.get_by_id(task.id).title == "Renamed"
+    assert inner.reads == 2
+
+
+def test_async_fetch_overtaken_by_a_write_is_not_cached(repo, inner, task):
+    async def read_across_a_write():
+        inner.release.clear()
+        reader = asyncio.create_task(repo.aget_by_id(task.id))
+        waiter = asyncio.create_task(repo.aget_by_id(task.id))
+        while not inner.started.is_set():
+            await asyncio.sleep(0.001)
+
+        repo.save(Task(id=task.id, title="Renamed", description="", users=set(task.users)))
+        inner.release.set()
+        before = [found.title for found in await asyncio.gather(reader, waiter)]
+        return before, (await repo.aget_by_id(task.id)).title
+
+    assert asyncio.run(read_across_a_write()) == (["Cached", "Cached"], "Renamed")
+    assert inner.reads == 2
+    assert repo.stats.coalesced == 1
+
+
+def test_fetch_errors_are_raised_and_not_cached(repo, inner, task):
+    inner.error = RuntimeError("database is down")
+    with pytest.raises(RuntimeError):
+        repo.get_by_id(task.id)
+
+    inner.error = None
+    assert repo.get_by_id(task.id).title == "Cached"
+
+
+def test_async_reads_use_the_cache(repo, inner, task):
+    async def read_twice():
+        await repo.aget_by_id(task.id)
+        return await repo.aget_by_id(task.id)
+
+    assert asyncio.run(read_twice()).title == "Cached"
+    assert repo.get_by_id(task.id).title == "Cached"
+    assert repo.stats.hits == 2
+
+
+@pytest.fixture
+def listed(inner):
+    return CachedTaskRepository(inner, LRUCacheAdapter(max_size=8, ttl=60), LRUCacheAdapter(max_size=8, ttl=60))
+
+
+def titles(page):
+    tasks, _ = page
+    return [task.title for task in tasks]
+
+
+def test_repeated_pages_are_served_from_the_list_cache(listed, inner, user_id):
+    first = listed.list_page(user_id, "title", 0, 10)
+    first[0][0].title = "Mutated"
+
+    assert titles(listed.list_page(user_id, "title", 0, 10)) == ["Cached"]
+    assert listed.collection_version(user_id) == listed.collection_version(user_id)
+    assert inner.pages == 1
+    assert (listed.stats.list_hits, listed.stats.list_misses) == (2, 2)
+
+
+def test_pages_are_keyed_by_their_parameters(listed, inner, user_id):
+    listed.list_page(user_id, "title", 0, 10)
+    listed.list_page(user_id, "title", 10, 10)
+    listed.list_page(user_id, "status", 0, 10)
+    listed.list_page(user_id, "title", 0, 10, TaskFilter(user_id=user_id, status=TaskStatus.COMPLETED))
+
+    assert inner.pages == 4
+
+
+def test_writes_bump_the_version_of_every_assigned_user(listed, task, user_id):
+    other = uuid.uuid4()
+    task.users.add(other)
+    for user in (user_id, other):
+        listed.list_page(user, "title", 0, 10)
+
+    listed.save(Task(id=task.id, title="Renamed", description="", users={user_id, other}))
+
+    for user in (user_id, other):
+        assert titles(listed.list_page(user, "title", 0, 10)) == ["Renamed"]
+
+
+def test_unassigned_users_see_the_task_leave_their_listing(listed, task, user_id):
+    other = uuid.uuid4()
+    task.users.add(other)
+    listed.list_page(other, "title", 0, 10)
+
+    listed.update(Task(id=task.id, title="Cached", description="", users={user_id}))
+
+    assert titles(listed.list_page(other, "title", 0, 10)) == []
+
+
+def test_saves_read_previous_users_through_the_write_not_a_lookup(listed, inner, task, user_id):
+    other = uuid.uuid4()
+    task.users.add(other)
+    listed.list_page(other, "title", 0, 10)
+
+    listed.save(Task(title="New", description="", users={user_id}))
+    listed.save(Task(id=task.id, title="Cached", description="", users={user_id}))
+
+    assert inner.reads == 0
+    assert titles(listed.list_page(other, "title", 0, 10)) == []
+
+
+def test_bulk_writes_read_assignments_not_tasks(listed, inner, task, user_id):
+    listed.list_page(user_id, "title", 0, 10)
+
+    with patch.object(inner, "list", side_effect=AssertionError("tasks were hydrated")):
+        listed.update_status_many(TaskFilter(user_id=user_id), TaskStatus.COMPLETED)
+
+    assert listed.list_page(user_id, "title", 0, 10)[0][0].status == TaskStatus.COMPLETED
+
+
+@pytest.mark.parametrize("delete", [
+    lambda repo, task: repo.delete(task.id),
+    lambda repo, task: repo.delete_many(TaskFilter(user_id=next(iter(task.users)), ids=frozenset({task.id}))),
+    lambda repo, task: asyncio.run(repo.adelete(task.id)),
+])
+def test_deletes_bump_the_version(listed, task, user_id, delete):
+    listed.list_page(user_id, "title", 0, 10)
+
+    delete(listed, task)
+
+    assert listed.list_page(user_id, "title", 0, 10) == ([], 0)
+
+
+def test_lost_versions_are_not_reissued(listed, inner, task, user_id):
+    listed.list_page(user_id, "title", 0, 10)
+    inner.update(Task(id=task.id, title="Renamed", description="", users={user_id}))
+
+    listed.list_cache.delete(f"list-version:{user_id}")
+
+    assert titles(listed.list_page(user_id, "title", 0, 10)) == ["Renamed"]
+
+
+def test_list_cache_is_bounded(inner, user_id):
+    listed = CachedTaskRepository(inner, LRUCacheAdapter(), LRUCacheAdapter(max_size=4, ttl=60))
+
+    for offset in range(8):
+        listed.list_page(user_id, "title", offset, 1)
+
+    assert len(listed.list_cache) == 4
+    assert listed.stats.evictions == 5
+
+
+def test_async_pages_use_the_list_cache(listed, user_id):
+    async def list_twice():
+        await listed.alist_page(user_id, "title", 0, 10)
+        return await listed.alist_page(user_id, "title", 0, 10)
+
+    assert titles(asyncio.run(list_twice())) == ["Cached"]
+    assert listed.stats.list_hits == 1
+
+
+def test_fetches_that_fill_a_cache_run_in_the_fill_scope(inner, task, user_id):
+    scopes = []
+
+    @contextmanager
+    def fill_scope():
+        scopes.append(inner.reads + inner.pages)
+        yield
+
+    repo = CachedTaskRepository(
+        inner, LRUCacheAdapter(max_size=8, ttl=60), LRUCacheAdapter(max_size=8, ttl=60), fill_scope=fill_scope
+    )
+    repo.get_by_id(task.id)
+    repo.get_by_id(task.id)
+    repo.list_page(user_id, "title", 0, 10)
+    repo.list_page(user_id, "title", 0, 10)
+    asyncio.run(repo.alist_page(user_id, "title", 0, 1))
+
+    assert scopes == [0, 1, 2]
+
+
+def test_previous_users_of_an_uncached_task_are_read_in_the_fill_scope(inner, task, user_id):
+    scopes = []
+
+    @contextmanager
+    def fill_scope():
+        scopes.append(inner.reads)
+        yield
+
+    repo = CachedTaskRepository(
+        inner, LRUCacheAdapter(max_size=8, ttl=60), LRUCacheAdapter(max_size=8, ttl=60), fill_scope=fill_scope
+    )
+    repo.update(Task(id=task.id, title="Renamed", description="", users={user_id}))
+    asyncio.run(repo.adelete(task.id))
+
+    assert scopes == [0, 1]
+    assert inner.reads == 2
@@ -2,6 +2,7 @@ import uuid
 import pytest
 from datetime import datetime
 
+from src.core.tasks.domain.task_filter import TaskFilter
 from src.core.tasks.domain.tasks import Task, TaskStatus
 from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
 
@@ -80,4 +81,160 @@ def test_user_cannot_see_task_if_not_in_users(repo, user_id, another_user_id):
     )
     repo.save(task)
     visible_tasks = repo.list(user_id)
-    assert len(visible_tasks) == 0
\ No newline at end of file
+    assert len(visible_tasks) == 0
+
+
+def test_list_page_orders_and_slices_user_tasks(repo, user_id, another_user_id):
+    for title in ["C", "A", "D", "B"]:
+        repo.save(Task(title=title, description="", users={user_id}))
+    repo.save(Task(title="0", description="", users={another_user_id}))
+
+    tasks, total = repo.list_page(user_id, order_by="title", offset=1, limit=2)
+
+    assert [task.title for task in tasks] == ["B", "C"]
+    assert total == 4
+
+
+def test_save_existing_task_replaces_it(repo, task, user_id):
+    repo.save(task)
+    repo.save(task)
+
+    assert len(repo.list(user_id)) == 1
+    assert repo.tasks == [task]
+
+
+def test_update_reindexes_users(repo, task, user_id, another_user_id):
+    repo.save(task)
+    task.users = {another_user_id}
+    repo.update(task)
+
+    assert repo.list(user_id) == []
+    assert repo.list(another_user_id) == [task]
+
+
+def test_update_of_unknown_task_is_ignored(repo, task, user_id):
+    repo.update(task)
+
+    assert repo.get_by_id(task.id) is None
+    assert repo.list(user_id) == []
+
+
+@pytest.mark.parametrize("sorted_fields", [(), ("title", "created_at")])
+def test_sorted_index_pages_like_a_full_sort(user_id, another_user_id, sorted_fields):
+    repo = InMemoryTaskRepository(sorted_fields=sorted_fields)
+    tasks = [Task(title=title, description="", users={user_id}) for title in ["C", "A", "E", "B", "D", "A"]]
+    for task in tasks:
+        repo.save(task)
+    repo.save(Task(title="0", description="", users={another_user_id}))
+    tasks[2].update_task(title="0")
+    repo.update(tasks[2])
+    repo.delete(tasks[4].id)
+
+    expected = sorted(
+        [task for task in tasks if task is not tasks[4]],
+        key=lambda task: (task.title, task.id)
+    )
+    page, total = repo.list_page(user_id, order_by="title", offset=1, limit=3)
+    assert page == expected[1:4]
+    assert total == 5
+
+    after = (expected[1].title, expected[1].id)
+    page, total = repo.list_after(user_id, order_by="title", after=after, limit=10)
+    assert page == expected[2:]
+    assert total == 5
+
+
+def test_update_status_many_only_touches_filtered_own_tasks(repo, user_id, another_user_id):
+    own = [Task(title=f"Own {i}", description="", users={user_id}) for i in range(3)]
+    other = Task(title="Other", description="", users={another_user_id})
+    for task in own + [other]:
+        repo.save(task)
+
+    updated = repo.update_status_many(
+        TaskFilter(user_id=user_id, ids=frozenset({own[0].id, own[1].id, other.id})),
+        TaskStatus.COMPLETED,
+    )
+
+    assert updated == 2
+    assert [task.status for task in own] == [TaskStatus.COMPLETED, TaskStatus.COMPLETED, TaskStatus.PENDING]
+    assert other.status == TaskStatus.PENDING
+
+
+def test_delete_many_by_status_and_creation_date(repo, user_id):
+    old_done = Task(title="Old done", description="", users={user_id}, status=TaskStatus.COMPLETED,
+                    created_at=datetime(2024, 1, 1))
+    new_done = Task(title="New done", description="", users={user_id}, status=TaskStatus.COMPLETED)
+    old_pending = Task(title="Old pending", description="", users={user_id}, created_at=datetime(2024, 1, 1))
+    for task in (old_done, new_done, old_pending):
+        repo.save(task)
+
+    deleted = repo.delete_many(
+        TaskFilter(user_id=user_id, status=TaskStatus.COMPLETED, created_before=datetime(2025, 1, 1))
+    )
+
+    assert deleted == 1
+    assert {task.id for task in repo.list(user_id)} == {new_done.id, old_pending.id}
+
+
+@pytest.mark.parametrize("sorted_fields", [(), ("title", "status")])
+@pytest.mark.parametrize("order_by", ["title", "status"])
+def test_filtered_pages_match_a_scan_with_or_without_indexes(user_id, another_user_id, sorted_fields, order_by):
+    repo = InMemoryTaskRepository(sorted_fields=sorted_fields)
+    titles = ["Release", "Review", "Rel", "Alpha", "Relay", "Reader"]
+    tasks = [
+        Task(title=title, description="", users={user_id} | ({another_user_id} if index % 2 else set()),
+             status=TaskStatus.COMPLETED if index % 3 == 0 else TaskStatus.PENDING)
+        for index, title in enumerate(titles)
+    ]
+    for task in tasks:
+        repo.save(task)
+
+    for task_filter in (
+        TaskFilter(user_id=user_id, title_prefix="Rel"),
+        TaskFilter(user_id=user_id, title_prefix="Rel", status=TaskStatus.PENDING),
+        TaskFilter(user_id=user_id, assignee_id=another_user_id),
+        TaskFilter(user_id=user_id, status=TaskStatus.COMPLETED),
+    ):
+        expected = sorted(
+            (task for task in tasks if task_filter.matches(task)),
+            key=lambda task: (getattr(task, order_by), task.id)
+        )
+        page, total = repo.list_page(user_id, order_by, 0, 10, task_filter)
+        assert page == expected
+        assert total == len(expected)
+
+        after = (getattr(expected[0], order_by), expected[0].id)
+        page, total = repo.list_after(user_id, order_by, after, 10, task_filter)
+        assert page == expected[1:]
+        assert total == len(expected)
+
+
+def test_versions_follow_updates_and_deletes(repo, user_id, another_user_id):
+    first = Task(title="First", description="", users={user_id}, updated_at=datetime(2025, 1, 1))
+    second = Task(title="Second", description="", users={user_id, another_user_id}, updated_at=datetime(2025, 1, 2))
+    repo.save(first)
+    repo.save(second)
+
+    assert repo.get_version(first.id) == datetime(2025, 1, 1)
+    assert repo.collection_version(user_id) == (datetime(2025, 1, 2), 2)
+    assert repo.collection_version(another_user_id) == (datetime(2025, 1, 2), 1)
+
+    first.updated_at = datetime(2025, 1, 3)
+    repo.update(first)
+    assert repo.collection_version(user_id) == (datetime(2025, 1, 3), 2)
+
+    repo.delete(first.id)
+    assert repo.get_version(first.id) is None
+    assert repo.collection_version(user_id) == (datetime(2025, 1, 2), 1)
+    assert repo.collection_version(user_id, TaskFilter(user_id=user_id, title_prefix="First")) == (None, 0)
+
+
+def test_assignments_list_every_user_of_the_filtered_tasks(repo, user_id, another_user_id):
+    shared = Task(title="Shared", description="", users={user_id, another_user_id})
+    foreign = Task(title="Foreign", description="", users={another_user_id})
+    repo.save(shared)
+    repo.save(foreign)
+
+    assert sorted(repo.assignments(TaskFilter(user_id=user_id))) == sorted([
+        (shared.id, user_id), (shared.id, another_user_id),
+    ])
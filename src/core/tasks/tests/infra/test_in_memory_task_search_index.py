@@ -0,0 +1,81 @@
+import random
+import uuid
+
+import pytest
+
+from src.core.tasks.domain.tasks import Task
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
+from src.core.tasks.infra.in_memory_task_search_index import InMemoryTaskSearchIndex, tokenize
+
+
+@pytest.fixture
+def user_id():
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def repo():
+    return InMemoryTaskRepository(search_index=InMemoryTaskSearchIndex())
+
+
+def search(repo, user_id, query, offset=0, limit=10):
+    tasks, total = repo.search_index.search(user_id, query, offset, limit)
+    return [task.title for task in tasks], total
+
+
+def test_tokenize_lowercases_words():
+    assert tokenize("Fix the LOGIN-page, again!") == ["fix", "the", "login", "page", "again"]
+    assert tokenize(None) == []
+
+
+def test_every_word_must_match_and_title_ranks_above_description(repo, user_id):
+    repo.save(Task(title="Deploy", description="release notes", users={user_id}))
+    repo.save(Task(title="Release notes", description="", users={user_id}))
+    repo.save(Task(title="Release", description="", users={user_id}))
+
+    assert search(repo, user_id, "release notes") == (["Release notes", "Deploy"], 2)
+    titles, total = search(repo, user_id, "RELEASE")
+    # Both title matches score the same; their order is by id.
+    assert total == 3 and sorted(titles[:2]) == ["Release", "Release notes"] and titles[2] == "Deploy"
+    assert search(repo, user_id, "release missing") == ([], 0)
+    assert search(repo, user_id, "  ") == ([], 0)
+
+
+def test_only_the_users_tasks_are_searched(repo, user_id):
+    other_id = uuid.uuid4()
+    repo.save(Task(title="Shared report", description="", users={user_id, other_id}))
+    repo.save(Task(title="Private report", description="", users={other_id}))
+
+    assert search(repo, user_id, "report") == (["Shared report"], 1)
+    assert search(repo, other_id, "report")[1] == 2
+
+
+def test_index_follows_updates_and_deletes(repo, user_id):
+    task = Task(title="Old title", description="", users={user_id})
+    repo.save(task)
+
+    task.update_task(title="New title")
+    repo.update(task)
+    assert search(repo, user_id, "old") == ([], 0)
+    assert search(repo, user_id, "new") == (["New title"], 1)
+
+    repo.delete(task.id)
+    assert search(repo, user_id, "title") == ([], 0)
+    assert repo.search_index.postings == {}
+
+
+def test_pages_match_a_full_ranking(repo, user_id):
+    rng = random.Random(7)
+    words = ["alpha", "beta", "gamma", "delta"]
+    for _ in range(60):
+        repo.save(Task(
+            title=" ".join(rng.choices(words, k=2)),
+            description=" ".join(rng.choices(words, k=3)),
+            users={user_id},
+        ))
+
+    everything, total = repo.search_index.search(user_id, "alpha", 0, 100)
+    pages = [repo.search_index.search(user_id, "alpha", offset, 7)[0] for offset in range(0, total, 7)]
+
+    assert [task.id for page in pages for task in page] == [task.id for task in everything]
+    assert total == sum("alpha" in tokenize(f"{task.title} {task.description}") for task in repo.tasks)
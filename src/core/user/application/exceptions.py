@@ -10,3 +10,6 @@ class InvalidOrderBy(Exception):
 
 class UserNotFound(Exception):
     pass
+
+class InvalidCursor(Exception):
+    pass
@@ -0,0 +1,32 @@
+from src.core._shared.links import LinkBuilder
+
+# Links of every user in a listing.
+USER_ITEM_LINKS = LinkBuilder({
+    "self": "/api/users/{id}",
+})
+
+# Links of a single user returned by GET /api/users/{id}.
+USER_DETAIL_LINKS = LinkBuilder({
+    "self": "/api/users/{id}",
+    "list": {
+        "method": "GET",
+        "href": "/api/users",
+        "query_params": {
+            "order_by": "username or email",
+            "page": 1,
+            "size": 10
+        },
+        "description": "List all users with pagination and sorting options."
+    },
+    "create": {
+        "method": "POST",
+        "href": "/api/users",
+        "description": "Create a new user.",
+        "body": {
+            "email": "string",
+            "username": "string",
+            "password": "string",
+            "is_active": "boolean (optional, default is True)"
+        }
+    },
+})
@@ -5,9 +5,10 @@ from src.adapters.jwt.jwt_adapter import JWTAdapter
 
 from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher
 from src.adapters.hash.hash_adapter_interface import PasswordHasherInterface
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy
 
 from src.core.user.application.exceptions import InvalidUser
-from src.django_project.user_app.repository import DjangoORMUserRepository
+from src.core.user.domain.user_repository_interface import UserRepositoryInterface
 
 
 class AuthenticateUser:
@@ -24,7 +25,7 @@ class AuthenticateUser:
 
     def __init__(
             self,
-            repository: DjangoORMUserRepository,
+            repository: UserRepositoryInterface,
             jwt_adapter: JWTAdapter,
             token_exp_minutes: int = 60,
             hash_adapter: PasswordHasherInterface = BcryptPasswordHasher()
@@ -41,6 +42,37 @@ class AuthenticateUser:
         if not user or not user.check_password(request.password, self.hash_adapter):
             raise InvalidUser("Invalid username or password")
 
+        if self.hash_adapter.needs_rehash(user.password):
+            # Best effort: the password was right, so a busy hasher only postpones the upgrade.
+            try:
+                new_password = self.hash_adapter.hash(request.password)
+            except HasherBusy:
+                pass
+            else:
+                user.password = new_password
+                self.repository.save(user)
+
+        return self._issue_token(user)
+
+    async def aexecute(self, request: AuthenticateUserRequest) -> AuthenticateUserResponse:
+        """Same as `execute`; the repository is awaited and bcrypt runs off the event loop."""
+        user = await self.repository.aget_user_by_username(request.username)
+
+        if not user or not await user.acheck_password(request.password, self.hash_adapter):
+            raise InvalidUser("Invalid username or password")
+
+        if self.hash_adapter.needs_rehash(user.password):
+            try:
+                new_password = await self.hash_adapter.ahash(request.password)
+            except HasherBusy:
+                pass
+            else:
+                user.password = new_password
+                await self.repository.asave(user)
+
+        return self._issue_token(user)
+
+    def _issue_token(self, user) -> AuthenticateUserResponse:
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=self.token_exp_minutes)
         payload = {
             "user_id": str(user.id),
@@ -51,4 +83,4 @@ class AuthenticateUser:
         return self.AuthenticateUserResponse(
             token=token,
             expires_at=expires_at.replace(microsecond=0).isoformat().replace('+00:00', 'Z')
-        )
\ No newline at end of file
+        )
@@ -1,14 +1,19 @@
 from uuid import UUID
 from dataclasses import dataclass, field
-from typing import Any
+from datetime import datetime
+from typing import Any, Optional
 
+from src.core._shared.links import LINKS_FULL, LinkBuilder
 from src.core.user.application.exceptions import UserNotFound
+from src.core.user.application.links import USER_DETAIL_LINKS
 from src.core.user.domain.user_repository_interface import UserRepositoryInterface
+from src.core.user.domain.user import User
 
 class GetUser:
     @dataclass
     class GetUserRequest:
         id: UUID
+        links: str = LINKS_FULL
 
     @dataclass
     class GetUserResponse:
@@ -21,36 +26,27 @@ class GetUser:
         self.repository = repository
 
     def execute(self, request: "GetUser.GetUserRequest") -> "GetUser.GetUserResponse":
+        LinkBuilder.validate_mode(request.links)
         user = self.repository.get_user_by_id(request.id)
         if user is None:
             raise UserNotFound(f"User with id {request.id} not found.")
-        
+        return self._response(user, request.links)
+
+    def version(self, request: "GetUser.GetUserRequest") -> Optional[datetime]:
+        """Last save of the requested user, for conditional requests; None when it does not exist."""
+        return self.repository.get_version(request.id)
+
+    async def aexecute(self, request: "GetUser.GetUserRequest") -> "GetUser.GetUserResponse":
+        LinkBuilder.validate_mode(request.links)
+        user = await self.repository.aget_user_by_id(request.id)
+        if user is None:
+            raise UserNotFound(f"User with id {request.id} not found.")
+        return self._response(user, request.links)
+
+    def _response(self, user: User, links: str) -> "GetUser.GetUserResponse":
         return self.GetUserResponse(
             username=user.username,
             email=user.email,
             is_active=user.is_active,
-            links={
-                "self": f"/api/users/{user.id}",
-                "list": {
-                    "method": "GET",
-                    "href": "/api/users",
-                    "query_params": {
-                        "order_by": "username or email",
-                        "page": 1,
-                        "size": 10
-                    },
-                    "description": "List all users with pagination and sorting options."
-                },
-                "create": {
-                    "method": "POST",
-                    "href": "/api/users",
-                    "description": "Create a new user.",
-                    "body": {
-                        "email": "string",
-                        "username": "string",
-                        "password": "string",
-                        "is_active": "boolean (optional, default is True)"
-                    }
-                }
-            }
-        )
\ No newline at end of file
+            links=USER_DETAIL_LINKS.render(user.id, links)
+        )
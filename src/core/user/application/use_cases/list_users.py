@@ -1,9 +1,14 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
+from src.adapters.cursor.cursor_adapter_interface import CursorAdapterInterface
+from src.core._shared.links import LINKS_FULL, LinkBuilder
+from src.core.user.application.links import USER_ITEM_LINKS
 from src.core.user.domain.user_repository_interface import UserRepositoryInterface
-from src.core.user.application.exceptions import InvalidOrderBy
+from src.core.user.domain.user import User
+from src.core.user.application.exceptions import InvalidOrderBy, InvalidCursor
 
 @dataclass
 class UserOutput:
@@ -25,6 +30,8 @@ class ListUsers:
         order_by: str = "username"
         current_page: int = 1
         page_size: int = 10
+        cursor: Optional[str] = None
+        links: str = LINKS_FULL
 
     @dataclass
     class ListUsersResponse:
@@ -32,56 +39,153 @@ class ListUsers:
         meta: MetaOutput = field(default_factory=lambda: MetaOutput(0, 1, 10, {}))
         links: Dict[str, Any] = field(default_factory=dict)
 
-    def __init__(self, repository: UserRepositoryInterface) -> None:
+    def __init__(
+        self,
+        repository: UserRepositoryInterface,
+        cursor_adapter: Optional[CursorAdapterInterface] = None
+    ) -> None:
         self.repository = repository
+        self.cursor_adapter = cursor_adapter
 
     def execute(self, request: ListUsersRequest) -> ListUsersResponse:
-        users = self.repository.list()
+        self._validate(request)
 
+        if request.cursor is not None:
+            users, total_users = self.repository.list_after(
+                order_by=request.order_by,
+                after=self._cursor_after(request),
+                limit=request.page_size + 1
+            )
+            return self._cursor_response(request, users, total_users)
+
+        return self._offset_response(request, self.repository.list())
+
+    def version(self, request: ListUsersRequest) -> Tuple[Optional[datetime], int]:
+        """`(last change, count)` of the users, for conditional requests."""
+        self._validate(request)
+        return self.repository.collection_version()
+
+    async def aexecute(self, request: ListUsersRequest) -> ListUsersResponse:
+        """Same as `execute`, against an `AsyncUserRepositoryInterface`."""
+        self._validate(request)
+
+        if request.cursor is not None:
+            users, total_users = await self.repository.alist_after(
+                order_by=request.order_by,
+                after=self._cursor_after(request),
+                limit=request.page_size + 1
+            )
+            return self._cursor_response(request, users, total_users)
+
+        return self._offset_response(request, await self.repository.alist())
+
+    def _validate(self, request: ListUsersRequest) -> None:
         if request.order_by not in ['username', 'email', 'id']:
             raise InvalidOrderBy(f"Invalid order_by field: {request.order_by}")
 
-        sorted_users = sorted(
-            [user for user in users if hasattr(user, request.order_by)],
-            key=lambda x: getattr(x, request.order_by)
-        )
-        page_offset = (request.current_page - 1) * request.page_size
-        paginated_users = sorted_users[page_offset:page_offset + request.page_size]
+        if request.cursor is not None and self.cursor_adapter is None:
+            raise InvalidCursor("Cursor pagination is not available.")
 
+        LinkBuilder.validate_mode(request.links)
+
+    def _response(
+        self,
+        request: ListUsersRequest,
+        paginated_users: List[User],
+        total_users: int,
+        links: Dict[str, Any]
+    ) -> ListUsersResponse:
         user_outputs = [
             UserOutput(
                 id=user.id,
                 username=user.username,
                 email=user.email,
-                links={
-                    "self": f"/api/users/{user.id}",
-                }
+                links=USER_ITEM_LINKS.render(user.id, request.links)
             )
             for user in paginated_users
         ]
 
+        query_params = {
+            "order_by": request.order_by,
+            "page": request.current_page,
+            "size": request.page_size
+        }
+        if request.cursor is not None:
+            query_params["cursor"] = request.cursor
+        if request.links != LINKS_FULL:
+            query_params["links"] = request.links
+
         return self.ListUsersResponse(
             data=user_outputs,
             meta=MetaOutput(
-                total_users=len(sorted_users),
+                total_users=total_users,
                 current_page=request.current_page,
                 page_size=request.page_size,
-                query_params={
-                    "order_by": request.order_by,
-                    "page": request.current_page,
-                    "size": request.page_size
-                }
+                query_params=query_params
             ),
             links={
-                "self": f"/api/users?page={request.current_page}&size={request.page_size}&order_by={request.order_by}",
-                "next": f"/api/users?page={request.current_page + 1}&size={request.page_size}&order_by={request.order_by}" if len(sorted_users) > page_offset + request.page_size else None,
-                "prev": f"/api/users?page={max(1, request.current_page - 1)}&size={request.page_size}&order_by={request.order_by}" if request.current_page > 1 else None,
-                "first": f"/api/users?page=1&size={request.page_size}&order_by={request.order_by}",
-                "last": f"/api/users?page={((len(sorted_users) - 1) // request.page_size) + 1}&size={request.page_size}&order_by={request.order_by}",
+                **links,
                 "create": {
                     "method": "POST",
                     "href": "/api/users",
                     "description": "Create a new user with params: username, email, password and is_active (optional)"
                 }
             }
-        )
\ No newline at end of file
+        )
+
+    def _offset_response(self, request: ListUsersRequest, users: List[User]) -> ListUsersResponse:
+        sorted_users = sorted(
+            [user for user in users if hasattr(user, request.order_by)],
+            key=lambda x: getattr(x, request.order_by)
+        )
+        page_offset = (request.current_page - 1) * request.page_size
+        paginated_users = sorted_users[page_offset:page_offset + request.page_size]
+        extra = self._links_param(request)
+        links = {
+            "self": f"/api/users?page={request.current_page}&size={request.page_size}&order_by={request.order_by}{extra}",
+            "next": f"/api/users?page={request.current_page + 1}&size={request.page_size}&order_by={request.order_by}{extra}" if len(sorted_users) > page_offset + request.page_size else None,
+            "prev": f"/api/users?page={max(1, request.current_page - 1)}&size={request.page_size}&order_by={request.order_by}{extra}" if request.current_page > 1 else None,
+            "first": f"/api/users?page=1&size={request.page_size}&order_by={request.order_by}{extra}",
+            "last": f"/api/users?page={((len(sorted_users) - 1) // request.page_size) + 1}&size={request.page_size}&order_by={request.order_by}{extra}",
+        }
+        return self._response(request, paginated_users, len(sorted_users), links)
+
+    @staticmethod
+    def _links_param(request: ListUsersRequest) -> str:
+        """Keep a non default `links` mode in the pagination links."""
+        return "" if request.links == LINKS_FULL else f"&links={request.links}"
+
+    def _cursor_after(self, request: ListUsersRequest) -> Optional[Tuple[Any, UUID]]:
+        return self._decode_cursor(request.cursor, request.order_by) if request.cursor else None
+
+    def _cursor_response(
+        self, request: ListUsersRequest, users: List[User], total_users: int
+    ) -> ListUsersResponse:
+        paginated_users = users[:request.page_size]
+        next_cursor = (
+            self.cursor_adapter.encode({
+                "order_by": request.order_by,
+                "value": str(getattr(paginated_users[-1], request.order_by)),
+                "id": str(paginated_users[-1].id),
+            })
+            if len(users) > request.page_size else None
+        )
+        extra = self._links_param(request)
+        links = {
+            "self": f"/api/users?cursor={request.cursor}&size={request.page_size}&order_by={request.order_by}{extra}",
+            "next": f"/api/users?cursor={next_cursor}&size={request.page_size}&order_by={request.order_by}{extra}" if next_cursor else None,
+            "prev": None,
+            "first": f"/api/users?cursor=&size={request.page_size}&order_by={request.order_by}{extra}",
+            "last": None,
+        }
+        return self._response(request, paginated_users, total_users, links)
+
+    def _decode_cursor(self, cursor: str, order_by: str) -> Tuple[Any, UUID]:
+        try:
+            payload = self.cursor_adapter.decode(cursor)
+            if payload["order_by"] != order_by:
+                raise ValueError("Cursor was issued for another ordering.")
+            value = UUID(payload["value"]) if order_by == 'id' else payload["value"]
+            return value, UUID(payload["id"])
+        except (ValueError, KeyError, TypeError) as err:
+            raise InvalidCursor(f"Invalid cursor: {err}")
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+from src.core.user.domain.user import User
+
+class AsyncUserRepositoryInterface(ABC):
+    """Coroutine counterpart of `UserRepositoryInterface`, used by the ASGI views."""
+
+    @abstractmethod
+    async def asave(self, user) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist(self) -> List[User]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aget_user_by_id(self, user_id: str) -> Optional[User]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aget_user_by_username(self, username: str) -> Optional[User]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist_after(
+        self, order_by: str, after: Optional[Tuple[Any, UUID]], limit: int
+    ) -> Tuple[List[User], int]:
+        """See `UserRepositoryInterface.list_after`."""
+        raise NotImplementedError
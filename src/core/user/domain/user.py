@@ -7,7 +7,7 @@ from src.core._shared.entity import Entity
 from src.adapters.hash.hash_adapter_interface import PasswordHasherInterface
 
 
-@dataclass
+@dataclass(slots=True)
 class User(Entity):
     """User entity representing a user in the system."""
 
@@ -51,12 +51,16 @@ class User(Entity):
                 }
             )
 
-        if self.notification.has_errors():
+        if self.has_errors():
             raise ValueError(self.notification.messages)
     
     def check_password(self, password: str, hasher: PasswordHasherInterface) -> bool:
         """Check if the provided password matches the user's hashed password."""
         return hasher.verify(password, self.password)
+
+    async def acheck_password(self, password: str, hasher: PasswordHasherInterface) -> bool:
+        """Async `check_password`, verifying without blocking the event loop."""
+        return await hasher.averify(password, self.password)
     
 
     def activate(self) -> None:
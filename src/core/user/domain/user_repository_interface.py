@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Set, Tuple
+from uuid import UUID
 from src.core.user.domain.user import User
 
 class UserRepositoryInterface(ABC):
@@ -21,4 +23,26 @@ class UserRepositoryInterface(ABC):
 
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get a user by their username."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(
+        self, order_by: str, after: Optional[Tuple[Any, UUID]], limit: int
+    ) -> Tuple[List[User], int]:
+        """List users positioned after the `(order_by value, id)` key, plus the total count."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_missing_ids(self, user_ids: Set[UUID]) -> Set[UUID]:
+        """Return the ids, among `user_ids`, that do not belong to any user."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_version(self, user_id: UUID) -> Optional[datetime]:
+        """When a user was last saved, or None when it does not exist, without loading it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """`(last save of any user, number of users)`, identifying a version of the user listing."""
+        raise NotImplementedError
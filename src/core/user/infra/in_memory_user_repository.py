@@ -1,34 +1,109 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, ValuesView
+from uuid import UUID
+from src.core.user.application.exceptions import UserAlreadyExists
+from src.core.user.domain.async_user_repository_interface import AsyncUserRepositoryInterface
 from src.core.user.domain.user_repository_interface import UserRepositoryInterface
 from src.core.user.domain.user import User
 
-class InMemoryUserRepository(UserRepositoryInterface):
-    """In-memory implementation of the UserRepositoryInterface."""
+class InMemoryUserRepository(UserRepositoryInterface, AsyncUserRepositoryInterface):
+    """In-memory implementation of the UserRepositoryInterface.
+
+    Users are kept in a dict by id with unique email and username indexes, so
+    lookups and conflict checks do not scan. `users` and `list()` return a
+    read-only live view of the users, so neither reads nor writes copy the store.
+    """
 
     def __init__(self, users=None) -> None:
-        self.users = users or []
+        self.users_by_id: Dict[UUID, User] = {}
+        self._ids_by_email: Dict[str, UUID] = {}
+        self._ids_by_username: Dict[str, UUID] = {}
+        # Email and username each user is indexed under; users are mutable, so
+        # this is what has to be removed when it is saved again.
+        self._indexed: Dict[UUID, Tuple[str, str]] = {}
+        # When each user was last saved, for conditional requests.
+        self._saved_at: Dict[UUID, datetime] = {}
+        for user in users or []:
+            self.save(user)
+
+    @property
+    def users(self) -> ValuesView[User]:
+        return self.users_by_id.values()
 
     def save(self, user) -> None:
-        """Save a user to the in-memory repository."""
-        self.users.append(user)
+        """Save a user, replacing a user with the same id.
+
+        Raises UserAlreadyExists when another user has the same email or username.
+        """
+        email_owner = self._ids_by_email.get(user.email)
+        if email_owner is not None and email_owner != user.id:
+            raise UserAlreadyExists(f"User with email {user.email} already exists.")
+        username_owner = self._ids_by_username.get(user.username)
+        if username_owner is not None and username_owner != user.id:
+            raise UserAlreadyExists(f"User with username {user.username} already exists.")
+
+        if user.id in self._indexed:
+            email, username = self._indexed[user.id]
+            del self._ids_by_email[email]
+            del self._ids_by_username[username]
+        self.users_by_id[user.id] = user
+        self._ids_by_email[user.email] = user.id
+        self._ids_by_username[user.username] = user.id
+        self._indexed[user.id] = (user.email, user.username)
+        self._saved_at[user.id] = datetime.now()
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get a user by email."""
-        for user in self.users:
-            if user.email == email:
-                return user
-        return None
+        user_id = self._ids_by_email.get(email)
+        return None if user_id is None else self.users_by_id[user_id]
 
-    def list(self) -> List[User]:
-        return [user for user in self.users]
+    def list(self) -> ValuesView[User]:
+        return self.users
 
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get a user by their unique identifier."""
-        for user in self.users:
-            if user.id == user_id:
-                return user
-        return None
+        return self.users_by_id.get(user_id)
+
+    def find_missing_ids(self, user_ids: Set[UUID]) -> Set[UUID]:
+        """Return the ids that are not in the id index."""
+        return {user_id for user_id in user_ids if user_id not in self.users_by_id}
 
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get a user by username."""
-        return next((user for user in self.users if user.username == username), None)
\ No newline at end of file
+        user_id = self._ids_by_username.get(username)
+        return None if user_id is None else self.users_by_id[user_id]
+
+    def list_after(
+        self, order_by: str, after: Optional[Tuple[Any, UUID]], limit: int
+    ) -> Tuple[List[User], int]:
+        """List users positioned after a `(value, id)` key."""
+
+        def sort_key(user: User) -> Tuple[Any, UUID]:
+            return getattr(user, order_by), user.id
+
+        users = self.users
+        remaining = [user for user in users if after is None or sort_key(user) > after]
+        return sorted(remaining, key=sort_key)[:limit], len(users)
+
+    def get_version(self, user_id: UUID) -> Optional[datetime]:
+        return self._saved_at.get(user_id)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        return max(self._saved_at.values(), default=None), len(self.users_by_id)
+
+    async def asave(self, user) -> None:
+        self.save(user)
+
+    async def alist(self) -> ValuesView[User]:
+        return self.list()
+
+    async def aget_user_by_id(self, user_id: str) -> Optional[User]:
+        return self.get_user_by_id(user_id)
+
+    async def aget_user_by_username(self, username: str) -> Optional[User]:
+        return self.get_user_by_username(username)
+
+    async def alist_after(
+        self, order_by: str, after: Optional[Tuple[Any, UUID]], limit: int
+    ) -> Tuple[List[User], int]:
+        return self.list_after(order_by, after, limit)
@@ -1,4 +1,11 @@
 from uuid import UUID
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.adapters.cursor.signed_cursor_adapter import SignedCursorAdapter
+from src.core.user.application.exceptions import InvalidCursor
+from src.core.user.domain.user import User
 
 from src.core.user.infra.in_memory_user_repository import InMemoryUserRepository
 from src.core.user.application.use_cases.list_users import ListUsers
@@ -43,3 +50,31 @@ class TestListUsers:
         }
 
     
+
+    def test_list_users_following_cursors(self):
+        repository = InMemoryUserRepository()
+        for name in ["dave", "alice", "carol", "bob"]:
+            repository.save(User(username=name, email=f"{name}@gmail.com", password="hashed"))
+        use_case = ListUsers(
+            repository=repository,
+            cursor_adapter=SignedCursorAdapter(secret_key="secret")
+        )
+
+        first = use_case.execute(ListUsers.ListUsersRequest(page_size=3, cursor=""))
+        cursor = parse_qs(urlparse(first.links["next"]).query)["cursor"][0]
+        second = use_case.execute(ListUsers.ListUsersRequest(page_size=3, cursor=cursor))
+
+        assert [user.username for user in first.data] == ["alice", "bob", "carol"]
+        assert [user.username for user in second.data] == ["dave"]
+        assert second.links["next"] is None
+        assert second.meta.total_users == 4
+        assert second.meta.query_params["cursor"] == cursor
+
+    def test_list_users_with_invalid_cursor(self):
+        use_case = ListUsers(
+            repository=InMemoryUserRepository(),
+            cursor_adapter=SignedCursorAdapter(secret_key="secret")
+        )
+
+        with pytest.raises(InvalidCursor):
+            use_case.execute(ListUsers.ListUsersRequest(cursor="not-a-cursor"))
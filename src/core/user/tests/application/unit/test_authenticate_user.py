@@ -1,5 +1,11 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+
+from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy
+from src.core.user.domain.user import User
+from src.core.user.infra.in_memory_user_repository import InMemoryUserRepository
 
 from src.core.user.application.use_cases.authenticate_user import AuthenticateUser
 from src.core.user.application.exceptions import InvalidUser
@@ -7,6 +13,7 @@ from src.core.user.application.exceptions import InvalidUser
 class DummyUser:
     def __init__(self, id):
         self.id = id
+        self.password = "$2b$12$" + "a" * 53
 
     def check_password(self, password, hash_adapter):
         return password == "valid_password"
@@ -74,4 +81,105 @@ def test_authenticate_user_user_not_found():
     )
 
     with pytest.raises(InvalidUser):
-        use_case.execute(request)
\ No newline at end of file
+        use_case.execute(request)
+
+
+def test_authenticate_user_rehashes_outdated_password():
+    mock_repository = MagicMock()
+    mock_hash_adapter = MagicMock()
+    dummy_user = DummyUser(id=123)
+    mock_repository.get_user_by_username.return_value = dummy_user
+    mock_hash_adapter.needs_rehash.return_value = True
+    mock_hash_adapter.hash.return_value = "new_hash"
+
+    use_case = AuthenticateUser(
+        repository=mock_repository,
+        jwt_adapter=MagicMock(),
+        hash_adapter=mock_hash_adapter,
+        token_exp_minutes=60
+    )
+
+    use_case.execute(AuthenticateUser.AuthenticateUserRequest(username="john", password="valid_password"))
+
+    assert dummy_user.password == "new_hash"
+    mock_hash_adapter.hash.assert_called_once_with("valid_password")
+    mock_repository.save.assert_called_once_with(dummy_user)
+
+
+def test_authenticate_user_keeps_current_password():
+    mock_repository = MagicMock()
+    mock_hash_adapter = MagicMock()
+    mock_repository.get_user_by_username.return_value = DummyUser(id=123)
+    mock_hash_adapter.needs_rehash.return_value = False
+
+    use_case = AuthenticateUser(
+        repository=mock_repository,
+        jwt_adapter=MagicMock(),
+        hash_adapter=mock_hash_adapter,
+        token_exp_minutes=60
+    )
+
+    use_case.execute(AuthenticateUser.AuthenticateUserRequest(username="john", password="valid_password"))
+
+    mock_hash_adapter.hash.assert_not_called()
+    mock_repository.save.assert_not_called()
+
+
+def test_authenticate_user_async_rehashes_outdated_password():
+    hash_adapter = BcryptPasswordHasher(rounds=5)
+    user = User(
+        username="john",
+        email="john@gmail.com",
+        password=BcryptPasswordHasher(rounds=4).hash("valid_password")
+    )
+    repository = InMemoryUserRepository([user])
+    mock_jwt_adapter = MagicMock()
+    mock_jwt_adapter.encode.return_value = "jwt_token"
+
+    use_case = AuthenticateUser(
+        repository=repository,
+        jwt_adapter=mock_jwt_adapter,
+        hash_adapter=hash_adapter,
+        token_exp_minutes=60
+    )
+
+    response = asyncio.run(use_case.aexecute(
+        AuthenticateUser.AuthenticateUserRequest(username="john", password="valid_password")
+    ))
+
+    assert response.token == "jwt_token"
+    assert repository.get_user_by_username("john").password.startswith("$2b$05$")
+
+    with pytest.raises(InvalidUser):
+        asyncio.run(use_case.aexecute(
+            AuthenticateUser.AuthenticateUserRequest(username="john", password="wrong_password")
+        ))
+
+
+def test_authenticate_user_skips_rehash_when_hasher_is_busy():
+    mock_repository = MagicMock()
+    mock_hash_adapter = MagicMock()
+    dummy_user = DummyUser(id=123)
+    old_password = dummy_user.password
+    mock_repository.get_user_by_username.return_value = dummy_user
+    mock_hash_adapter.needs_rehash.return_value = True
+    mock_hash_adapter.hash.side_effect = HasherBusy("busy")
+    mock_hash_adapter.ahash = AsyncMock(side_effect=HasherBusy("busy"))
+    mock_repository.aget_user_by_username = AsyncMock(return_value=dummy_user)
+    dummy_user.acheck_password = AsyncMock(return_value=True)
+    mock_jwt_adapter = MagicMock()
+    mock_jwt_adapter.encode.return_value = "jwt_token"
+
+    use_case = AuthenticateUser(
+        repository=mock_repository,
+        jwt_adapter=mock_jwt_adapter,
+        hash_adapter=mock_hash_adapter,
+        token_exp_minutes=60
+    )
+    request = AuthenticateUser.AuthenticateUserRequest(username="john", password="valid_password")
+
+    assert use_case.execute(request).token == "jwt_token"
+    assert asyncio.run(use_case.aexecute(request)).token == "jwt_token"
+    assert dummy_user.password == old_password
+    mock_repository.save.assert_not_called()
+    mock_repository.asave.assert_not_called()
@@ -52,3 +52,9 @@ class TestUser:
     def test_create_user_with_valid_data(self):
         user = User(username="test", email="teste@gmail.com", password="Senha123")
         assert isinstance(user, User)
+
+    def test_valid_user_has_no_notification(self):
+        user = User(username="test", email="teste@gmail.com", password="Senha123")
+        assert user._notification is None
+        assert not user.has_errors()
+        assert not hasattr(user, "__dict__")
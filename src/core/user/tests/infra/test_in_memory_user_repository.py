@@ -1,3 +1,8 @@
+import uuid
+
+import pytest
+
+from src.core.user.application.exceptions import UserAlreadyExists
 from src.core.user.domain.user import User
 from src.core.user.infra.in_memory_user_repository import InMemoryUserRepository
 
@@ -16,8 +21,83 @@ class TestInMemoryUserRepository:
         repository.save(user)
 
         assert len(repository.users) == 1
-        assert repository.users[0] == user
+        assert list(repository.users) == [user]
+
+    def test_find_missing_ids(self):
+        """Test that only unknown ids are reported as missing."""
+        user = User(username="testuser", email="teste@gmail.com", password="Senha123")
+        repository = InMemoryUserRepository(users=[user])
+        unknown_id = uuid.uuid4()
+
+        assert repository.find_missing_ids({user.id, unknown_id}) == {unknown_id}
+        assert repository.find_missing_ids({user.id}) == set()
+
+    def test_lookups_by_email_username_and_id(self):
+        """Test that the indexes find users by every unique key."""
+        user = User(username="testuser", email="teste@gmail.com", password="Senha123")
+        repository = InMemoryUserRepository(users=[
+            User(username="other", email="other@gmail.com", password="Senha123"),
+            user,
+        ])
+
+        assert repository.get_by_email("teste@gmail.com") is user
+        assert repository.get_user_by_username("testuser") is user
+        assert repository.get_user_by_id(user.id) is user
+        assert repository.get_by_email("missing@gmail.com") is None
+        assert repository.get_user_by_username("missing") is None
+
+    @pytest.mark.parametrize("username, email", [
+        ("testuser", "new@gmail.com"),
+        ("newuser", "teste@gmail.com"),
+    ])
+    def test_save_conflicting_user_raises_user_already_exists(self, username, email):
+        """Test that email and username are unique across users."""
+        repository = InMemoryUserRepository(users=[
+            User(username="testuser", email="teste@gmail.com", password="Senha123")
+        ])
+
+        with pytest.raises(UserAlreadyExists):
+            repository.save(User(username=username, email=email, password="Senha123"))
+        assert len(repository.users) == 1
+
+    def test_save_existing_user_reindexes_changed_keys(self):
+        """Test that saving a changed user moves its email and username."""
+        user = User(username="testuser", email="teste@gmail.com", password="Senha123")
+        repository = InMemoryUserRepository(users=[user])
 
-    
+        user.email = "changed@gmail.com"
+        repository.save(user)
+
+        assert repository.get_by_email("teste@gmail.com") is None
+        assert repository.get_by_email("changed@gmail.com") is user
+        repository.save(User(username="other", email="teste@gmail.com", password="Senha123"))
+        assert len(repository.users) == 2
+
+    def test_list_returns_a_read_only_live_view(self):
+        """Test that listing does not copy the users, before or after a save."""
+        repository = InMemoryUserRepository(users=[
+            User(username="testuser", email="teste@gmail.com", password="Senha123")
+        ])
+
+        users = repository.list()
+        other = User(username="other", email="other@gmail.com", password="Senha123")
+        repository.save(other)
+
+        assert len(users) == 2
+        assert other in users
+        assert not hasattr(users, "append")
 
-    
+    def test_versions_change_on_every_save(self):
+        """Test that saving a user moves its version and the collection version."""
+        user = User(username="testuser", email="teste@gmail.com", password="Senha123")
+        repository = InMemoryUserRepository()
+        assert repository.collection_version() == (None, 0)
+        assert repository.get_version(user.id) is None
+
+        repository.save(user)
+        first_version = repository.get_version(user.id)
+        assert repository.collection_version() == (first_version, 1)
+
+        repository.save(user)
+        assert repository.get_version(user.id) >= first_version
+        assert repository.collection_version() == (repository.get_version(user.id), 1)
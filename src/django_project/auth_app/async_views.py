@@ -0,0 +1,76 @@
+import json
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import exceptions, status
+
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy
+from src.adapters.jwt.jwt_adapter import JWTAdapter
+from src.core.user.application.use_cases.authenticate_user import AuthenticateUser
+from src.django_project.auth_app.serializers import AuthenticateUserRequestSerializer, AuthenticateUserResponseSerializer
+from src.django_project.auth_app.views import JWTAuthentication
+from src.django_project.user_app.hasher import get_password_hasher
+from src.django_project.user_app.repository import DjangoORMUserRepository
+
+
+class AsyncAPIView(View):
+    """Django-native async view for the ASGI endpoints.
+
+    DRF views are synchronous, so these views authenticate with
+    `JWTAuthentication.aauthenticate` themselves and answer with `JsonResponse`.
+    Unauthenticated requests get the same 403 the DRF views return.
+    """
+    authentication_required = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        if self.authentication_required:
+            try:
+                result = await JWTAuthentication().aauthenticate(request)
+            except exceptions.AuthenticationFailed as err:
+                return JsonResponse({"detail": str(err.detail)}, status=status.HTTP_403_FORBIDDEN)
+            if result is None:
+                return JsonResponse(
+                    {"detail": "Authentication credentials were not provided."},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            request.user = result[0]
+        return await super().dispatch(request, *args, **kwargs)
+
+    @staticmethod
+    def json_body(request) -> dict:
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            raise exceptions.ParseError("Malformed JSON body.")
+        if not isinstance(data, dict):
+            raise exceptions.ParseError("Expected a JSON object.")
+        return data
+
+
+class AsyncAuthenticateUserView(AsyncAPIView):
+    authentication_required = False
+
+    async def post(self, request):
+        try:
+            serializer = AuthenticateUserRequestSerializer(data=self.json_body(request))
+        except exceptions.ParseError as err:
+            return JsonResponse({"detail": str(err.detail)}, status=status.HTTP_400_BAD_REQUEST)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = AuthenticateUser(
+            repository=DjangoORMUserRepository(),
+            jwt_adapter=JWTAdapter(secret_key=settings.SECRET_KEY),
+            hash_adapter=get_password_hasher()
+        )
+        try:
+            response = await use_case.aexecute(
+                AuthenticateUser.AuthenticateUserRequest(**serializer.validated_data)
+            )
+        except HasherBusy as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except Exception as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+
+        return JsonResponse(AuthenticateUserResponseSerializer(response).data, status=status.HTTP_200_OK)
@@ -0,0 +1,22 @@
+from django.conf import settings
+
+from src.adapters.cache.cache_adapter_interface import CacheAdapterInterface
+from src.django_project.cache import build_cache_adapter
+
+_principal_cache = None
+
+
+def get_principal_cache() -> CacheAdapterInterface:
+    """Return the process wide cache of authenticated users, built from `settings.PRINCIPAL_CACHE`."""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = build_cache_adapter(settings.PRINCIPAL_CACHE, key_prefix="principal:")
+    return _principal_cache
+
+
+def principal_cache_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def invalidate_principal(user_id) -> None:
+    get_principal_cache().delete(principal_cache_key(user_id))
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from src.django_project.auth_app.principal_cache import invalidate_principal
+from src.django_project.user_app.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_principal(sender, instance, **kwargs):
+    """Drop the cached principal whenever the user changes or is deleted."""
+    invalidate_principal(instance.id)
@@ -0,0 +1,74 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from django.conf import settings
+from rest_framework import exceptions
+from rest_framework.test import APIRequestFactory
+
+from src.django_project.auth_app.principal_cache import get_principal_cache
+from src.django_project.auth_app.views import JWTAuthentication
+from src.django_project.user_app.models import User as DjangoUserModel
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    get_principal_cache().clear()
+    yield
+    get_principal_cache().clear()
+
+
+@pytest.fixture
+def user():
+    return DjangoUserModel.objects.create(
+        id=uuid.uuid4(),
+        username="authuser",
+        email="authuser@gmail.com",
+        password="securepassword123"
+    )
+
+
+def make_request(user_id):
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    token = jwt.encode(
+        {"user_id": str(user_id), "exp": int(expires_at.timestamp())},
+        settings.SECRET_KEY,
+        algorithm="HS256"
+    )
+    return APIRequestFactory().get("/api/tasks/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+@pytest.mark.django_db
+class TestJWTAuthentication:
+    def test_warm_token_does_not_query_the_database(self, user, django_assert_num_queries):
+        authentication = JWTAuthentication()
+        request = make_request(user.id)
+
+        with django_assert_num_queries(1):
+            first_user, _ = authentication.authenticate(request)
+        with django_assert_num_queries(0):
+            second_user, _ = authentication.authenticate(request)
+
+        assert first_user.id == second_user.id == user.id
+
+    def test_deleted_user_is_evicted_from_the_cache(self, user):
+        authentication = JWTAuthentication()
+        request = make_request(user.id)
+        authentication.authenticate(request)
+
+        user.delete()
+
+        with pytest.raises(exceptions.AuthenticationFailed):
+            authentication.authenticate(request)
+
+    def test_updated_user_is_reloaded(self, user):
+        authentication = JWTAuthentication()
+        request = make_request(user.id)
+        authentication.authenticate(request)
+
+        user.username = "renamed"
+        user.save()
+        cached_user, _ = authentication.authenticate(request)
+
+        assert cached_user.username == "renamed"
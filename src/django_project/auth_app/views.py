@@ -6,12 +6,17 @@ from rest_framework.permissions import AllowAny
 from src.core.user.application.use_cases.authenticate_user import AuthenticateUser
 from src.django_project.user_app.repository import DjangoORMUserRepository
 from src.adapters.jwt.jwt_adapter import JWTAdapter
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy
+from src.django_project.user_app.hasher import get_password_hasher
 from django.conf import settings
 from rest_framework.authentication import BaseAuthentication
 from rest_framework import exceptions
 from django.conf import settings
 import jwt
+import time
 from src.django_project.user_app.models import User
+from src.django_project.auth_app.principal_cache import get_principal_cache, principal_cache_key
+from src.django_project.db_router import act_as
 
 from src.django_project.auth_app.serializers import AuthenticateUserRequestSerializer, AuthenticateUserResponseSerializer
 
@@ -25,12 +30,15 @@ class AuthenticateUserView(APIView):
 
         use_case = AuthenticateUser(
             repository=DjangoORMUserRepository(),
-            jwt_adapter=JWTAdapter(secret_key=settings.SECRET_KEY)
+            jwt_adapter=JWTAdapter(secret_key=settings.SECRET_KEY),
+            hash_adapter=get_password_hasher()
         )
         try:
             response = use_case.execute(
                 AuthenticateUser.AuthenticateUserRequest(**serializer.validated_data)
             )
+        except HasherBusy as e:
+            return Response({"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
 
@@ -39,21 +47,59 @@ class AuthenticateUserView(APIView):
     
 class JWTAuthentication(BaseAuthentication):
     def authenticate(self, request):
+        payload = self._decode(request)
+        if payload is None:
+            return None
+
+        act_as(payload['user_id'])
+        cache_key = principal_cache_key(payload['user_id'])
+        user = get_principal_cache().get(cache_key)
+        if user is None:
+            try:
+                # The principal is cached, so it is read from the primary, never a lagging replica.
+                user = User.objects.get(id=payload['user_id'])
+            except User.DoesNotExist:
+                raise exceptions.AuthenticationFailed('User not found')
+            self._remember(cache_key, user, payload)
+
+        return (user, None)
+
+    async def aauthenticate(self, request):
+        """`authenticate` for the async views, loading the user with the async ORM."""
+        payload = self._decode(request)
+        if payload is None:
+            return None
+
+        act_as(payload['user_id'])
+        cache_key = principal_cache_key(payload['user_id'])
+        user = get_principal_cache().get(cache_key)
+        if user is None:
+            try:
+                user = await User.objects.aget(id=payload['user_id'])
+            except User.DoesNotExist:
+                raise exceptions.AuthenticationFailed('User not found')
+            self._remember(cache_key, user, payload)
+
+        return (user, None)
+
+    @staticmethod
+    def _decode(request):
         auth_header = request.headers.get('Authorization')
         if not auth_header or not auth_header.startswith('Bearer '):
             return None
 
         token = auth_header.split(' ')[1]
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
+            return jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
         except jwt.ExpiredSignatureError:
             raise exceptions.AuthenticationFailed('Token expired')
         except jwt.InvalidTokenError:
             raise exceptions.AuthenticationFailed('Invalid token')
 
-        try:
-            user = User.objects.get(id=payload['user_id'])
-        except User.DoesNotExist:
-            raise exceptions.AuthenticationFailed('User not found')
-
-        return (user, None)
\ No newline at end of file
+    @staticmethod
+    def _remember(cache_key, user, payload):
+        ttl = settings.PRINCIPAL_CACHE.get('TTL', 60)
+        if 'exp' in payload:
+            ttl = min(ttl, payload['exp'] - time.time())
+        if ttl > 0:
+            get_principal_cache().set(cache_key, user, ttl=ttl)
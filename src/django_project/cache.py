@@ -0,0 +1,19 @@
+from src.adapters.cache.cache_adapter_interface import CacheAdapterInterface
+from src.adapters.cache.django_cache_adapter import DjangoCacheAdapter
+from src.adapters.cache.lru_cache_adapter import LRUCacheAdapter
+
+
+def build_cache_adapter(config: dict, key_prefix: str = "") -> CacheAdapterInterface:
+    """Build a cache adapter from a settings dict.
+
+    `BACKEND` is either "local" (per-process LRU, bounded by `MAX_SIZE`) or
+    "django" (the Django cache named by `ALIAS`, shared between processes).
+    """
+    backend = config.get("BACKEND", "local")
+    if backend == "local":
+        return LRUCacheAdapter(max_size=config.get("MAX_SIZE", 1024), ttl=config.get("TTL", 300))
+    if backend == "django":
+        return DjangoCacheAdapter(
+            alias=config.get("ALIAS", "default"), key_prefix=key_prefix, ttl=config.get("TTL", 300)
+        )
+    raise ValueError(f"Unknown cache backend: {backend}")
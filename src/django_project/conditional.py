@@ -0,0 +1,42 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+def make_etag(request, *version: Any) -> str:
+    """Strong ETag of a response from the version of its resource.
+
+    The user, the full path (page, filters, links mode) and the negotiated media type
+    are part of it, since the same version renders a different body for each of them.
+    """
+    parts = (
+        str(getattr(request.user, "id", "")),
+        request.get_full_path(),
+        getattr(request, "accepted_media_type", "") or "",
+        *(value.isoformat() if isinstance(value, datetime) else str(value) for value in version),
+    )
+    return '"%s"' % hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:32]
+
+
+def not_modified(request, etag: str, last_modified: Optional[datetime]) -> Optional[HttpResponse]:
+    """The 304 (or 412) answering `If-None-Match`/`If-Modified-Since`, or None to build the body."""
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=None if last_modified is None else int(last_modified.timestamp()),
+    )
+    return None if response is None else with_validators(response, etag, last_modified)
+
+
+def with_validators(response, etag: str, last_modified: Optional[datetime]):
+    """Add `ETag`/`Last-Modified` and make clients revalidate instead of reusing the body blindly."""
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ("Accept", "Authorization"))
+    return response
@@ -0,0 +1,62 @@
+import copy
+from typing import Mapping
+
+
+def _flag(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def build_database_settings(environ: Mapping[str, str]) -> dict:
+    """Build the `default` Postgres settings from the POSTGRES_* variables.
+
+    Connections persist for `POSTGRES_CONN_MAX_AGE` seconds ("none" keeps them
+    forever, 0 closes them after each request) and are checked before reuse.
+    `POSTGRES_POOL=true` uses psycopg's connection pool instead, which needs psycopg 3
+    with the "pool" extra; Django does not allow persistent connections with it.
+    """
+    conn_max_age = environ.get("POSTGRES_CONN_MAX_AGE", "60")
+    database = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": environ.get("POSTGRES_DB", "tasks"),
+        "USER": environ.get("POSTGRES_USER", "tasks"),
+        "PASSWORD": environ.get("POSTGRES_PASSWORD", "tasks"),
+        "HOST": environ.get("POSTGRES_HOST", "db"),
+        "PORT": environ.get("POSTGRES_PORT", "5432"),
+        "CONN_MAX_AGE": None if conn_max_age.lower() == "none" else int(conn_max_age),
+        "CONN_HEALTH_CHECKS": _flag(environ.get("POSTGRES_CONN_HEALTH_CHECKS", "true")),
+        # PgBouncer in transaction mode cannot keep the cursors of `.iterator()` open.
+        "DISABLE_SERVER_SIDE_CURSORS": _flag(environ.get("POSTGRES_DISABLE_SERVER_SIDE_CURSORS", "false")),
+    }
+    if _flag(environ.get("POSTGRES_POOL", "false")):
+        database["CONN_MAX_AGE"] = 0
+        database["OPTIONS"] = {
+            "pool": {
+                "min_size": int(environ.get("POSTGRES_POOL_MIN_SIZE", 2)),
+                "max_size": int(environ.get("POSTGRES_POOL_MAX_SIZE", 10)),
+                # Seconds a request waits for a free connection before failing.
+                "timeout": float(environ.get("POSTGRES_POOL_TIMEOUT", 10)),
+                # Seconds before a connection is replaced, so the pool follows failovers.
+                "max_lifetime": float(environ.get("POSTGRES_POOL_MAX_LIFETIME", 1800)),
+                "max_idle": float(environ.get("POSTGRES_POOL_MAX_IDLE", 300)),
+            },
+        }
+    return database
+
+
+def build_replica_settings(environ: Mapping[str, str], primary: dict) -> dict:
+    """Build one `replica_<n>` alias per entry of `POSTGRES_REPLICA_HOSTS` ("host[:port],...").
+
+    Replicas share the primary's credentials and connection handling. In tests they
+    mirror `default`, so no test database is created for them.
+    """
+    replicas = {}
+    hosts = [host.strip() for host in environ.get("POSTGRES_REPLICA_HOSTS", "").split(",") if host.strip()]
+    for number, host in enumerate(hosts, start=1):
+        host, _, port = host.partition(":")
+        replicas[f"replica_{number}"] = {
+            **copy.deepcopy(primary),
+            "HOST": host,
+            "PORT": port or primary["PORT"],
+            "TEST": {"MIRROR": "default"},
+        }
+    return replicas
@@ -0,0 +1,145 @@
+import functools
+import inspect
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+from src.adapters.cache.cache_adapter_interface import CacheAdapterInterface
+from src.django_project.cache import build_cache_adapter
+
+# Alias that answers the reads of the current `read_intent` block, if any.
+_read_alias: ContextVar[Optional[str]] = ContextVar("read_alias", default=None)
+# User the current request acts for; their writes pin their reads to the primary.
+_acting_user: ContextVar[Optional[str]] = ContextVar("acting_user", default=None)
+
+_pins = None
+
+
+def get_primary_pins() -> CacheAdapterInterface:
+    """Return the process wide cache of users pinned to the primary, built from `settings.READ_REPLICAS`."""
+    global _pins
+    if _pins is None:
+        _pins = build_cache_adapter(settings.READ_REPLICAS.get("PIN_CACHE", {}), key_prefix="primary-pin:")
+    return _pins
+
+
+@contextmanager
+def read_intent():
+    """Send the reads of the block to one replica, unless the acting user is pinned.
+
+    All of them go to the same alias, so a query and its prefetches see one snapshot.
+    """
+    token = _read_alias.set(_read_alias.get() or _replica_for_acting_user())
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Send the reads of the block, including nested `read_intent` blocks, to the primary.
+
+    For reads whose result is cached: a lagging replica would keep serving stale rows
+    from the cache long after it caught up.
+    """
+    token = _read_alias.set("default")
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def _replica_for_acting_user() -> str:
+    replicas = settings.READ_REPLICAS.get("ALIASES", [])
+    if not replicas or connections["default"].in_atomic_block:
+        # Inside a transaction the primary has rows the replicas cannot see yet.
+        return "default"
+    user_id = _acting_user.get()
+    if user_id is not None and get_primary_pins().get(user_id):
+        return "default"
+    return random.choice(replicas)
+
+
+def replica_read(method):
+    """Run a repository method, sync or async, under `read_intent`."""
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            with read_intent():
+                return await method(*args, **kwargs)
+    else:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with read_intent():
+                return method(*args, **kwargs)
+    return wrapper
+
+
+def act_as(user_id) -> None:
+    """Attribute the rest of the request's queries to `user_id`."""
+    _acting_user.set(str(user_id))
+
+
+@contextmanager
+def request_scope():
+    """Forget the acting user at the end of the request; WSGI threads are reused."""
+    token = _acting_user.set(None)
+    try:
+        yield
+    finally:
+        _acting_user.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Send writes to `default` and reads made under `read_intent` to a random replica.
+
+    Replicas are the aliases in `settings.READ_REPLICAS["ALIASES"]`. A write pins the
+    acting user to the primary for `PIN_SECONDS`, so they read their own writes while
+    the replicas catch up. Reads without intent, such as those inside a write, stay on
+    the primary.
+    """
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        return _read_alias.get() or "default"
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        user_id = _acting_user.get()
+        if user_id is not None and settings.READ_REPLICAS.get("ALIASES"):
+            get_primary_pins().set(user_id, True, ttl=settings.READ_REPLICAS.get("PIN_SECONDS", 5))
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # Every alias holds the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        # Replicas get their schema from the primary through replication.
+        return db == "default"
+
+
+class DatabaseRoutingMiddleware:
+    """Run each request, sync or async, in its own `request_scope`."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with request_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with request_scope():
+            return await self.get_response(request)
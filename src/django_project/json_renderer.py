@@ -0,0 +1,30 @@
+import json
+
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def render_json(data) -> bytes:
+    """Encode `data` to the exact bytes `rest_framework.renderers.JSONRenderer` produces (no indent)."""
+    ret = json.dumps(
+        data, cls=JSONEncoder,
+        ensure_ascii=JSONRenderer.ensure_ascii,
+        allow_nan=not JSONRenderer.strict,
+        separators=(',', ':') if JSONRenderer.compact else (', ', ': '),
+    )
+    return ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+
+
+def accepts_fast_json(request) -> bool:
+    """Whether a DRF request negotiated plain JSON, so a pre-rendered body can be sent.
+
+    Anything else (the browsable API, `application/json; indent=4`) goes through the serializers.
+    """
+    renderer = getattr(request, "accepted_renderer", None)
+    media_type = getattr(request, "accepted_media_type", "") or ""
+    return type(renderer) is JSONRenderer and "indent" not in media_type
+
+
+def json_response(content: bytes, status: int) -> HttpResponse:
+    return HttpResponse(content, status=status, content_type="application/json")
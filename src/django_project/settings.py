@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+from src.django_project.database import build_database_settings, build_replica_settings
+
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 
@@ -30,6 +32,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "elasticapm.contrib.django.middleware.TracingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "src.django_project.db_router.DatabaseRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -67,17 +70,71 @@ WSGI_APPLICATION = "django_project.wsgi.application"
 
 
 
+# Persistent connections by default; POSTGRES_POOL=true for psycopg's pool (see
+# build_database_settings). When served through ASGI, use the pool: Django advises
+# against persistent connections there.
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': os.environ.get('POSTGRES_DB', 'tasks'),
-        'USER': os.environ.get('POSTGRES_USER', 'tasks'),
-        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', 'tasks'),
-        'HOST': os.environ.get('POSTGRES_HOST', 'db'),
-        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
-    }
+    'default': build_database_settings(os.environ),
+}
+
+# Reads of the list/get use cases go to the replicas in POSTGRES_REPLICA_HOSTS, except
+# those that fill a cache (tasks, task pages, JWT principals); everything else, and every read of a user for PIN_SECONDS
+# after their last write, goes to the primary. Pins are per process with the "local"
+# PIN_CACHE backend; use "django" with a shared cache when running several processes.
+DATABASES.update(build_replica_settings(os.environ, DATABASES['default']))
+DATABASE_ROUTERS = ["src.django_project.db_router.PrimaryReplicaRouter"]
+READ_REPLICAS = {
+    "ALIASES": [alias for alias in DATABASES if alias != 'default'],
+    "PIN_SECONDS": float(os.environ.get("POSTGRES_REPLICA_PIN_SECONDS", 5)),
+    "PIN_CACHE": {
+        "BACKEND": os.environ.get("POSTGRES_REPLICA_PIN_CACHE_BACKEND", "local"),
+        "ALIAS": os.environ.get("POSTGRES_REPLICA_PIN_CACHE_ALIAS", "default"),
+        "MAX_SIZE": int(os.environ.get("POSTGRES_REPLICA_PIN_CACHE_MAX_SIZE", 100000)),
+    },
+}
+
+
+# Authenticated users resolved from JWTs are cached to skip a query per request.
+# BACKEND is "local" (per-process LRU) or "django" (the cache named by ALIAS).
+# A change to a user only drops the cached copy of the process that made it; with
+# "local" the other processes keep authenticating the old user for up to TTL
+# seconds, so use "django" with a shared cache when running several processes.
+PRINCIPAL_CACHE = {
+    "BACKEND": os.environ.get("PRINCIPAL_CACHE_BACKEND", "local"),
+    "ALIAS": os.environ.get("PRINCIPAL_CACHE_ALIAS", "default"),
+    "MAX_SIZE": int(os.environ.get("PRINCIPAL_CACHE_MAX_SIZE", 10000)),
+    "TTL": int(os.environ.get("PRINCIPAL_CACHE_TTL", 60)),
 }
 
+# Tasks read by id are cached and dropped on every write made through the API.
+# With the "local" backend each process has its own copy, so writes made by other
+# processes are only seen after TTL seconds; use "django" with a shared cache then.
+TASK_CACHE = {
+    "BACKEND": os.environ.get("TASK_CACHE_BACKEND", "local"),
+    "ALIAS": os.environ.get("TASK_CACHE_ALIAS", "default"),
+    "MAX_SIZE": int(os.environ.get("TASK_CACHE_MAX_SIZE", 10000)),
+    "TTL": int(os.environ.get("TASK_CACHE_TTL", 60)),
+}
+
+# Pages of task listings, keyed by a per-user version that every write replaces.
+# Same backends and caveat as TASK_CACHE.
+TASK_LIST_CACHE = {
+    "BACKEND": os.environ.get("TASK_LIST_CACHE_BACKEND", "local"),
+    "ALIAS": os.environ.get("TASK_LIST_CACHE_ALIAS", "default"),
+    "MAX_SIZE": int(os.environ.get("TASK_LIST_CACHE_MAX_SIZE", 10000)),
+    "TTL": int(os.environ.get("TASK_LIST_CACHE_TTL", 60)),
+}
+
+# bcrypt work factor. Hashes made with another cost are rehashed on the next login.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+
+# bcrypt runs on a bounded pool: MAX_WORKERS hashes at a time, MAX_PENDING
+# more may wait, anything beyond that is answered with 503.
+PASSWORD_HASHER_POOL = {
+    "EXECUTOR": os.environ.get("PASSWORD_HASHER_EXECUTOR", "thread"),
+    "MAX_WORKERS": int(os.environ.get("PASSWORD_HASHER_MAX_WORKERS", os.cpu_count() or 1)),
+    "MAX_PENDING": int(os.environ.get("PASSWORD_HASHER_MAX_PENDING", 32)),
+}
 
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -0,0 +1,76 @@
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from rest_framework import status
+
+from src.adapters.cursor.signed_cursor_adapter import SignedCursorAdapter
+from src.core._shared.links import LINKS_FULL, InvalidLinksMode
+from src.core.tasks.application.exceptions import InvalidTaskData, InvalidTaskBy, TaskNotFound, InvalidCursor
+from src.core.tasks.application.use_cases.delete_task import DeleteTask
+from src.core.tasks.application.use_cases.get_task import GetTask
+from src.core.tasks.application.use_cases.list_task import ListTask
+from src.django_project.auth_app.async_views import AsyncAPIView
+from src.django_project.json_renderer import json_response
+from src.django_project.task_app.renderers import render_task_list
+from src.django_project.task_app.task_cache import get_task_repository
+from src.django_project.task_app.serializers import TaskFilterSerializer, TaskOutputSerializer, DeleteTaskRequestSerializer
+
+
+class AsyncTaskListView(AsyncAPIView):
+    """ASGI-native `GET /api/async/tasks/`, same contract as `TaskViewSet.list`."""
+
+    async def get(self, request):
+        order_by = request.GET.get('order_by', 'title')
+        page = int(request.GET.get('page', 1))
+        size = int(request.GET.get('size', 10))
+        filters = TaskFilterSerializer(data=request.GET)
+        if not filters.is_valid():
+            return JsonResponse(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = ListTask(
+            repository=get_task_repository(),
+            cursor_adapter=SignedCursorAdapter(secret_key=settings.SECRET_KEY),
+        )
+        request_uc = ListTask.ListTaskRequest(
+            order_by=order_by,
+            page=page,
+            size=size,
+            user_id=str(request.user.id),
+            cursor=request.GET.get('cursor'),
+            links=request.GET.get('links', LINKS_FULL),
+            **TaskFilterSerializer.filter_fields(filters.validated_data)
+        )
+        try:
+            response = await use_case.aexecute(request=request_uc)
+        except (InvalidTaskData, InvalidTaskBy, InvalidCursor, InvalidLinksMode) as err:
+            return JsonResponse({"error": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        return json_response(render_task_list(response), status=status.HTTP_200_OK)
+
+
+class AsyncTaskDetailView(AsyncAPIView):
+    """ASGI-native `GET`/`DELETE /api/async/tasks/<pk>/`."""
+
+    async def get(self, request, pk):
+        use_case = GetTask(repository=get_task_repository())
+        try:
+            response = await use_case.aexecute(GetTask.GetTaskRequest(
+                task_id=pk, links=request.GET.get('links', LINKS_FULL)
+            ))
+        except TaskNotFound as err:
+            return JsonResponse({"error": str(err)}, status=status.HTTP_404_NOT_FOUND)
+        except InvalidLinksMode as err:
+            return JsonResponse({"error": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        data = TaskOutputSerializer(instance=response.data).data
+        data["links"] = response.data.links
+        return JsonResponse(data, status=status.HTTP_200_OK)
+
+    async def delete(self, request, pk):
+        serializer = DeleteTaskRequestSerializer(data={"id": pk})
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = DeleteTask(repository=get_task_repository())
+        try:
+            await use_case.aexecute(DeleteTask.DeleteTaskRequest(id=serializer.validated_data["id"]))
+        except TaskNotFound as err:
+            return JsonResponse({"error": str(err)}, status=status.HTTP_404_NOT_FOUND)
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
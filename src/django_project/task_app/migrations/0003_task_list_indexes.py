@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_app', '0002_task_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['title', 'id'], name='task_title_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'id'], name='task_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['updated_at', 'id'], name='task_updated_at_id_idx'),
+        ),
+        # "Tasks of user X": the auto-created through table only has single column
+        # indexes, so cover the user -> task lookup with one composite index.
+        migrations.RunSQL(
+            sql='CREATE INDEX "task_users_user_id_task_id_idx" ON "Task_users" ("user_id", "task_id");',
+            reverse_sql='DROP INDEX "task_users_user_id_task_id_idx";',
+        ),
+    ]
@@ -1,5 +1,7 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.forms import CharField
 
@@ -14,10 +16,31 @@ class Task(models.Model):
         'user_app.User', related_name='tasks'
     )
     status = models.CharField(max_length=50, default='pending')
+    # Computed by Postgres on every INSERT/UPDATE, so it can never drift from
+    # title/description. 'simple' lowercases words without stemming them.
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("title", weight="A", config="simple")
+            + SearchVector("description", weight="B", config="simple")
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "Task"
         app_label = "task_app"
+        # One `(field, id)` index per ListTask order_by, matching its ORDER BY.
+        indexes = [
+            models.Index(fields=["title", "id"], name="task_title_id_idx"),
+            models.Index(fields=["status", "id"], name="task_status_id_idx"),
+            models.Index(fields=["created_at", "id"], name="task_created_at_id_idx"),
+            models.Index(fields=["updated_at", "id"], name="task_updated_at_id_idx"),
+            # `title LIKE 'prefix%'` can only use a b-tree built with pattern ops
+            # unless the database collation is "C".
+            models.Index(fields=["title"], name="task_title_prefix_idx", opclasses=["varchar_pattern_ops"]),
+            GinIndex(fields=["search_vector"], name="task_search_vector_idx"),
+        ]
 
     def __str__(self):
         return self.name
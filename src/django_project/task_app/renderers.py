@@ -0,0 +1,116 @@
+import csv
+from typing import Iterable, Iterator
+
+from rest_framework.fields import DateTimeField
+from rest_framework.renderers import BaseRenderer
+
+from src.core.tasks.application.use_cases.list_task import ListTask, TaskOutput
+from src.django_project.json_renderer import render_json
+
+_datetime_field = DateTimeField()
+
+
+def task_output_to_primitive(task: TaskOutput) -> dict:
+    """`TaskOutputSerializer(task).data` without the per-field serializer machinery."""
+    status = task.status
+    return {
+        "id": None if task.id is None else str(task.id),
+        "title": None if task.title is None else str(task.title),
+        "description": None if task.description is None else str(task.description),
+        "users": None if task.users is None else [
+            None if user_id is None else str(user_id) for user_id in task.users
+        ],
+        "created_at": _datetime(task.created_at),
+        "updated_at": _datetime(task.updated_at),
+        "links": None if task.links is None else {
+            str(key): value for key, value in task.links.items()
+        },
+        "status": None if status is None else (status.value if hasattr(status, "value") else str(status)),
+    }
+
+
+def render_task_list(response: ListTask.ListTaskResponse) -> bytes:
+    """Render `TaskListResponseSerializer(response).data` straight to JSON bytes.
+
+    Also used for `SearchTasksResponse`, which has the same shape.
+    """
+    meta = response.meta
+    return render_json({
+        "data": [task_output_to_primitive(task) for task in response.data],
+        "meta": None if meta is None else {
+            "total_tasks": int(meta.total_tasks),
+            "current_page": int(meta.current_page),
+            "page_size": int(meta.page_size),
+            "query_params": None if meta.query_params is None else {
+                str(key): value for key, value in meta.query_params.items()
+            },
+        },
+        "links": None if response.links is None else {
+            str(key): value for key, value in response.links.items()
+        },
+    })
+
+
+EXPORT_COLUMNS = ("id", "title", "description", "status", "created_at", "updated_at", "users")
+# Rows sent per chunk of a streamed export, so the server does not write one row at a time.
+EXPORT_ROWS_PER_CHUNK = 100
+
+
+def stream_tasks_ndjson(tasks: Iterable[TaskOutput]) -> Iterator[bytes]:
+    """One JSON object per line, with the fields of `TaskOutputSerializer` minus the links."""
+    lines = []
+    for task in tasks:
+        row = task_output_to_primitive(task)
+        del row["links"]
+        lines.append(render_json(row))
+        if len(lines) == EXPORT_ROWS_PER_CHUNK:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def stream_tasks_csv(tasks: Iterable[TaskOutput]) -> Iterator[str]:
+    """A header and one row per task; the users column holds space separated ids."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    rows = []
+    for task in tasks:
+        row = task_output_to_primitive(task)
+        row["users"] = " ".join(row["users"] or ())
+        rows.append(writer.writerow([row[column] for column in EXPORT_COLUMNS]))
+        if len(rows) == EXPORT_ROWS_PER_CHUNK:
+            yield "".join(rows)
+            rows = []
+    if rows:
+        yield "".join(rows)
+
+
+class _Echo:
+    """File-like object whose `write` returns the value, so csv.writer builds lines for streaming."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Selects the NDJSON export through `?format=ndjson`; errors are rendered as JSON."""
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        return render_json(data)
+
+
+class CSVRenderer(NDJSONRenderer):
+    """Selects the CSV export through `?format=csv`; errors are rendered as JSON."""
+    media_type = "text/csv"
+    format = "csv"
+
+
+def _datetime(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value or None
+    return _datetime_field.to_representation(value)
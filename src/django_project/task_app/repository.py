@@ -1,39 +1,61 @@
+from datetime import datetime
 from uuid import UUID
+from typing import Any, Iterator, List, Optional, Set, Tuple
 
-from src.core.tasks.domain.tasks import Task
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task, TaskStatus
 from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.domain.async_task_repository_interface import AsyncTaskRepositoryInterface
 
 from django.db import transaction
+from django.utils import timezone
+from django.db.models import Count, Max, Prefetch, Q
 
+from src.django_project.db_router import replica_read
 from src.django_project.task_app.models import Task as DjangoTaskModel
 from src.django_project.user_app.models import User as DjangoUserModel
 
-class DjangoOrmTaskRepository(TaskRepositoryInterface):
-    """Django ORM implementation of the TaskRepositoryInterface."""
+
+def with_user_ids(queryset):
+    """Hydrate the users of every task with one extra query instead of one per task.
+
+    The search vector is only used by the database, so it is not loaded.
+    """
+    return queryset.defer("search_vector").prefetch_related(
+        Prefetch("users", queryset=DjangoUserModel.objects.only("id"))
+    )
+
+
+class DjangoOrmTaskRepository(TaskRepositoryInterface, AsyncTaskRepositoryInterface):
+    """Django ORM implementation of the TaskRepositoryInterface and its async counterpart."""
 
     def __init__(self, task_model: DjangoTaskModel = DjangoTaskModel) -> None:
         self.task_model = task_model
 
     def save(self, task: Task) -> Task:
+        """Insert or update a task with one `INSERT ... ON CONFLICT` plus a diff of its users."""
+        return self.upsert(task)[0]
+
+    def upsert(self, task: Task) -> Tuple[Task, Set[UUID]]:
+        """`save`, returning the users read by its own lookup of the stored task."""
         with transaction.atomic():
-            try:
-                task_orm = self.task_model.objects.get(id=task.id)
-                task_orm.title = task.title
-                task_orm.description = task.description
-                task_orm.created_at = task.created_at
-                task_orm.updated_at = task.updated_at
-                task_orm.status = task.status
-            except self.task_model.DoesNotExist:
-                task_orm = TaskModelMapper.to_model(task)
-            task_orm.save()
-            users_qs = DjangoUserModel.objects.filter(id__in=task.users)
-            task_orm.users.set(users_qs)
-            task_orm.save()
-            return TaskModelMapper.to_entity(task_orm)
+            stored = self._stored(task.id)
+            return self._write(task, stored), set() if stored is None else stored[1]
 
+    def save_many(self, tasks: List[Task]) -> None:
+        """Insert new tasks with one `bulk_create` and their users with one more."""
+        through = self.task_model.users.through
+        with transaction.atomic():
+            self.task_model.objects.bulk_create([TaskModelMapper.to_model(task) for task in tasks])
+            through.objects.bulk_create([
+                through(task_id=task.id, user_id=user_id)
+                for task in tasks for user_id in task.users
+            ])
+
+    @replica_read
     def get_by_id(self, task_id: str) -> Task | None:
         try:
-            task_model = self.task_model.objects.get(id=task_id)
+            task_model = with_user_ids(self.task_model.objects).get(id=task_id)
             return TaskModelMapper.to_entity(task_model)
         except self.task_model.DoesNotExist:
             return None
@@ -46,27 +68,203 @@ class DjangoOrmTaskRepository(TaskRepositoryInterface):
             pass
 
     def update(self, task: Task) -> Task:
-        try:
-            task_model = self.task_model.objects.get(id=task.id)
-        except self.task_model.DoesNotExist:
-            raise ValueError(f"Task with id {task.id} does not exist.")
         with transaction.atomic():
-            task_model.title = task.title
-            task_model.description = task.description
-            task_model.updated_at = task.updated_at
-            task_model.status = task.status
-            task_model.save()
-            users_qs = DjangoUserModel.objects.filter(id__in=task.users)
-            task_model.users.set(users_qs)
-            task_model.save()
-            return TaskModelMapper.to_entity(task_model)
+            stored = self._stored(task.id)
+            if stored is None:
+                raise ValueError(f"Task with id {task.id} does not exist.")
+            return self._write(task, stored)
+
+    def update_status_many(self, task_filter: TaskFilter, status: TaskStatus) -> int:
+        """One `UPDATE ... WHERE id IN (<filtered tasks of the user>)`."""
+        return self._filtered(task_filter).update(status=status, updated_at=timezone.now())
+
+    def delete_many(self, task_filter: TaskFilter) -> int:
+        """Set-based delete of the filtered tasks of the user and of their through rows."""
+        _, deleted = self._filtered(task_filter).delete()
+        return deleted.get(self.task_model._meta.label, 0)
 
-    def list(self, user_id: UUID = None):
-        queryset = self.task_model.objects.all()
-        if user_id is not None:
+    def list(self, user_id: UUID = None, task_filter: Optional[TaskFilter] = None):
+        queryset = with_user_ids(self.task_model.objects.all())
+        if task_filter is not None:
+            queryset = self._filtered(task_filter, queryset)
+        elif user_id is not None:
             queryset = queryset.filter(users__id=user_id)
         return [TaskModelMapper.to_entity(task_model) for task_model in queryset]
 
+    def assignments(self, task_filter: TaskFilter) -> List[Tuple[UUID, UUID]]:
+        """One query on `Task_users` for the tasks `_filtered` selects.
+
+        Selecting `users__id` from `_filtered` itself would reuse its ownership join and
+        only return the filtering user, hence the subquery.
+        """
+        through = self.task_model.users.through
+        selected = self._filtered(task_filter).values("id")
+        return list(through.objects.filter(task_id__in=selected).values_list("task_id", "user_id"))
+
+    @replica_read
+    def get_version(self, task_id: UUID) -> Optional[datetime]:
+        """`SELECT updated_at ... WHERE id = %s`, by primary key."""
+        return self.task_model.objects.filter(id=task_id).values_list("updated_at", flat=True).first()
+
+    @replica_read
+    def collection_version(
+        self, user_id: UUID, task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """One aggregate query over the user's `Task_users` rows; no task is hydrated."""
+        version = self._owned(user_id, task_filter).aggregate(last_modified=Max("updated_at"), count=Count("id"))
+        return version["last_modified"], version["count"]
+
+    def iterate(self, user_id: UUID, chunk_size: int) -> Iterator[Task]:
+        """Stream a user's tasks from a server-side cursor, hydrating users once per chunk."""
+        queryset = with_user_ids(self.task_model.objects.filter(users__id=user_id)).order_by("id")
+        for task_model in queryset.iterator(chunk_size=chunk_size):
+            yield TaskModelMapper.to_entity(task_model)
+
+    @replica_read
+    def list_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        queryset = self._owned(user_id, task_filter)
+        total = queryset.count()
+        page = with_user_ids(queryset).order_by(order_by, "id")[offset:offset + limit]
+        return [TaskModelMapper.to_entity(task_model) for task_model in page], total
+
+    @replica_read
+    def list_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        queryset = self._owned(user_id, task_filter)
+        total = queryset.count()
+        if after is not None:
+            queryset = self._seek(queryset, order_by, after)
+        page = with_user_ids(queryset).order_by(order_by, "id")[:limit]
+        return [TaskModelMapper.to_entity(task_model) for task_model in page], total
+
+    @replica_read
+    async def aget_by_id(self, task_id: str) -> Task | None:
+        try:
+            task_model = await with_user_ids(self.task_model.objects).aget(id=task_id)
+            return TaskModelMapper.to_entity(task_model)
+        except self.task_model.DoesNotExist:
+            return None
+
+    async def adelete(self, task_id: str) -> None:
+        await self.task_model.objects.filter(id=task_id).adelete()
+
+    @replica_read
+    async def alist_page(
+        self,
+        user_id: UUID,
+        order_by: str,
+        offset: int,
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        queryset = self._owned(user_id, task_filter)
+        total = await queryset.acount()
+        page = with_user_ids(queryset).order_by(order_by, "id")[offset:offset + limit]
+        return [TaskModelMapper.to_entity(task_model) async for task_model in page], total
+
+    @replica_read
+    async def alist_after(
+        self,
+        user_id: UUID,
+        order_by: str,
+        after: Optional[Tuple[Any, UUID]],
+        limit: int,
+        task_filter: Optional[TaskFilter] = None
+    ) -> Tuple[List[Task], int]:
+        queryset = self._owned(user_id, task_filter)
+        total = await queryset.acount()
+        if after is not None:
+            queryset = self._seek(queryset, order_by, after)
+        page = with_user_ids(queryset).order_by(order_by, "id")[:limit]
+        return [TaskModelMapper.to_entity(task_model) async for task_model in page], total
+
+    def _owned(self, user_id: UUID, task_filter: Optional[TaskFilter]):
+        if task_filter is None:
+            return self.task_model.objects.filter(users__id=user_id)
+        return self._filtered(task_filter)
+
+    def _filtered(self, task_filter: TaskFilter, queryset=None):
+        """Tasks of `task_filter.user_id` matching the filter; ownership is part of the query.
+
+        Each criterion is a plain column comparison, so it can use the indexes of the
+        table: `(status, id)`, `(created_at, id)`, `(updated_at, id)`, the
+        `varchar_pattern_ops` index on title for the prefix and `Task_users` for users.
+        """
+        if queryset is None:
+            queryset = self.task_model.objects.all()
+        queryset = queryset.filter(users__id=task_filter.user_id)
+        if task_filter.assignee_id is not None:
+            # A second filter() call joins Task_users again: tasks shared with that user.
+            queryset = queryset.filter(users__id=task_filter.assignee_id)
+        lookups = {
+            "id__in": task_filter.ids,
+            "status": task_filter.status,
+            "created_at__gte": task_filter.created_after,
+            "created_at__lt": task_filter.created_before,
+            "updated_at__gte": task_filter.updated_after,
+            "updated_at__lt": task_filter.updated_before,
+            "title__startswith": task_filter.title_prefix,
+        }
+        return queryset.filter(**{lookup: value for lookup, value in lookups.items() if value is not None})
+
+    def _stored(self, task_id: UUID) -> Optional[Tuple[Any, Set[UUID]]]:
+        """`(created_at, user ids)` of a stored task, or None, in one query."""
+        rows = list(self.task_model.objects.filter(id=task_id).values_list("created_at", "users__id"))
+        if not rows:
+            return None
+        return rows[0][0], {user_id for _, user_id in rows if user_id is not None}
+
+    def _write(self, task: Task, stored: Optional[Tuple[Any, Set[UUID]]]) -> Task:
+        """Upsert the task row and insert/delete only the through rows that changed.
+
+        The user ids must exist; use cases check them before saving.
+        """
+        task_orm = TaskModelMapper.to_model(task)
+        self.task_model.objects.bulk_create(
+            [task_orm],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["title", "description", "updated_at", "status"],
+        )
+        stored_user_ids = set()
+        if stored is not None:
+            # created_at is only written on insert; keep the stored one.
+            task_orm.created_at, stored_user_ids = stored
+
+        user_ids = {UUID(str(user_id)) for user_id in task.users}
+        through = self.task_model.users.through
+        removed = stored_user_ids - user_ids
+        if removed:
+            through.objects.filter(task_id=task.id, user_id__in=removed).delete()
+        added = user_ids - stored_user_ids
+        if added:
+            through.objects.bulk_create(
+                [through(task_id=task.id, user_id=user_id) for user_id in added],
+                ignore_conflicts=True,
+            )
+        return TaskModelMapper.to_entity(task_orm, user_ids=user_ids)
+
+    @staticmethod
+    def _seek(queryset, order_by: str, after: Tuple[Any, UUID]):
+        """Apply `WHERE (order_by, id) > (value, last_id)` in an index friendly form."""
+        value, last_id = after
+        return queryset.filter(**{f"{order_by}__gte": value}).filter(
+            Q(**{f"{order_by}__gt": value}) | Q(id__gt=last_id)
+        )
+
 
 class TaskModelMapper:
     @staticmethod
@@ -81,14 +279,16 @@ class TaskModelMapper:
         )
 
     @staticmethod
-    def to_entity(task_model: DjangoTaskModel) -> Task:
+    def to_entity(task_model: DjangoTaskModel, user_ids: set[UUID] | None = None) -> Task:
         from src.core.tasks.domain.tasks import TaskStatus
+        if user_ids is None:
+            user_ids = {user.id for user in task_model.users.all()}
         return Task(
             id=task_model.id,
             title=task_model.title,
             description=task_model.description,
             created_at=task_model.created_at,
             updated_at=task_model.updated_at,
-            users={user.id for user in task_model.users.all()},
+            users=user_ids,
             status=TaskStatus(task_model.status) if not isinstance(task_model.status, TaskStatus) else task_model.status,
         )
\ No newline at end of file
@@ -0,0 +1,34 @@
+from uuid import UUID
+from typing import List, Tuple
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+
+from src.core.tasks.domain.task_search_index_interface import TaskSearchIndexInterface
+from src.core.tasks.domain.tasks import Task
+from src.django_project.task_app.models import Task as DjangoTaskModel
+from src.django_project.task_app.repository import TaskModelMapper, with_user_ids
+
+
+class PostgresTaskSearchIndex(TaskSearchIndexInterface):
+    """Search the generated `search_vector` column of the tasks table.
+
+    The column is computed by Postgres from title and description on every write,
+    and covered by a GIN index, so there is nothing to sync here: the repository's
+    saves, updates and deletes are the index updates.
+    """
+
+    def __init__(self, task_model: DjangoTaskModel = DjangoTaskModel) -> None:
+        self.task_model = task_model
+
+    def search(self, user_id: UUID, query: str, offset: int, limit: int) -> Tuple[List[Task], int]:
+        """`search_vector @@ plainto_tsquery('simple', query)`, ordered by `ts_rank`."""
+        search_query = SearchQuery(query, config="simple")
+        queryset = self.task_model.objects.filter(users__id=user_id, search_vector=search_query)
+        total = queryset.count()
+        page = (
+            with_user_ids(queryset)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank", "id")[offset:offset + limit]
+        )
+        return [TaskModelMapper.to_entity(task_model) for task_model in page], total
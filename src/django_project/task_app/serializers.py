@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from src.core.tasks.application.use_cases.bulk_create_task import MAX_BULK_TASKS
 from src.core.tasks.domain.tasks import TaskStatus
 
 class MetaOutputSerializer(serializers.Serializer):
@@ -38,6 +39,54 @@ class CreateTaskResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     links = serializers.DictField(child=serializers.JSONField(), required=False)
 
+class BulkCreateTaskRequestSerializer(serializers.Serializer):
+    # Checked before any item is validated, so oversized payloads are rejected cheaply.
+    tasks = CreateTaskRequestSerializer(many=True, allow_empty=False, max_length=MAX_BULK_TASKS)
+
+class BulkCreateTaskResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    id = serializers.UUIDField(allow_null=True)
+    error = serializers.CharField(allow_null=True)
+    links = serializers.DictField(child=serializers.JSONField(), required=False)
+
+class BulkCreateTaskResponseSerializer(serializers.Serializer):
+    results = BulkCreateTaskResultSerializer(many=True)
+    created = serializers.IntegerField()
+    failed = serializers.IntegerField()
+
+class TaskFilterSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=[s.value for s in TaskStatus], required=False)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    updated_after = serializers.DateTimeField(required=False)
+    updated_before = serializers.DateTimeField(required=False)
+    assignee = serializers.UUIDField(required=False)
+    title_prefix = serializers.CharField(max_length=255, required=False)
+
+    @staticmethod
+    def filter_fields(validated_data) -> dict:
+        """The validated criteria as `TaskFilter` / `ListTaskRequest` keyword arguments."""
+        fields = {
+            "status": TaskStatus(validated_data["status"]) if "status" in validated_data else None,
+            "assignee_id": validated_data.get("assignee"),
+        }
+        for name in ("created_after", "created_before", "updated_after", "updated_before", "title_prefix"):
+            fields[name] = validated_data.get(name)
+        return fields
+
+class BulkTaskSelectionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False)
+    filter = TaskFilterSerializer(required=False)
+
+class BulkUpdateTaskStatusRequestSerializer(BulkTaskSelectionSerializer):
+    status = serializers.ChoiceField(choices=[s.value for s in TaskStatus])
+
+class SearchTasksRequestSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    page = serializers.IntegerField(min_value=1, default=1)
+    size = serializers.IntegerField(min_value=1, max_value=100, default=10)
+    links = serializers.CharField(required=False)
+
 class TaskListResponseSerializer(serializers.Serializer):
     data = TaskOutputSerializer(many=True)
     meta = MetaOutputSerializer(required=False)
@@ -0,0 +1,27 @@
+from django.conf import settings
+
+from src.core.tasks.domain.task_repository_interface import TaskRepositoryInterface
+from src.core.tasks.infra.cached_task_repository import CachedTaskRepository
+from src.django_project.cache import build_cache_adapter
+from src.django_project.db_router import primary_reads
+from src.django_project.task_app.repository import DjangoOrmTaskRepository
+
+_task_repository = None
+
+
+def get_task_repository() -> TaskRepositoryInterface:
+    """Return the process wide task repository, cached as configured by
+    `settings.TASK_CACHE` and `settings.TASK_LIST_CACHE`.
+
+    Every write that should invalidate the cache has to go through it.
+    """
+    global _task_repository
+    if _task_repository is None:
+        _task_repository = CachedTaskRepository(
+            DjangoOrmTaskRepository(),
+            build_cache_adapter(settings.TASK_CACHE, key_prefix="tasks:"),
+            list_cache=build_cache_adapter(settings.TASK_LIST_CACHE, key_prefix="task-lists:"),
+            # Cached copies outlive replica lag, so they are only read from the primary.
+            fill_scope=primary_reads,
+        )
+    return _task_repository
@@ -0,0 +1,123 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.test import AsyncClient
+from rest_framework import status
+
+from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher
+from src.django_project.auth_app.principal_cache import get_principal_cache
+from src.django_project.task_app.models import Task as DjangoTaskModel
+from src.django_project.user_app.models import User as DjangoUserModel
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    get_principal_cache().clear()
+    yield
+    get_principal_cache().clear()
+
+
+@pytest.fixture
+def user():
+    return DjangoUserModel.objects.create(
+        id=uuid.uuid4(),
+        username="asyncuser",
+        email="asyncuser@gmail.com",
+        password=BcryptPasswordHasher(rounds=4).hash("securepassword123")
+    )
+
+
+@pytest.fixture
+def auth_headers(user):
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    token = jwt.encode(
+        {"user_id": str(user.id), "exp": int(expires_at.timestamp())},
+        settings.SECRET_KEY,
+        algorithm="HS256"
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def make_task(user, title):
+    task = DjangoTaskModel.objects.create(title=title, description="", status="pending")
+    task.users.add(user)
+    return task
+
+
+@pytest.mark.django_db
+class TestAsyncTaskViews:
+    def test_list_tasks(self, auth_headers, user):
+        make_task(user, "b")
+        make_task(user, "a")
+
+        response = async_to_sync(AsyncClient().get)("/api/async/tasks/", {"size": 1}, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert [task["title"] for task in body["data"]] == ["a"]
+        assert body["meta"]["total_tasks"] == 2
+        assert body["links"]["next"] is not None
+
+    def test_list_tasks_with_invalid_order_by(self, auth_headers):
+        response = async_to_sync(AsyncClient().get)(
+            "/api/async/tasks/", {"order_by": "nope"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_retrieve_and_delete_task(self, auth_headers, user):
+        task = make_task(user, "a")
+        client = AsyncClient()
+
+        response = async_to_sync(client.get)(f"/api/async/tasks/{task.id}/", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == str(task.id)
+        assert response.json()["users"] == [str(user.id)]
+
+        response = async_to_sync(client.delete)(f"/api/async/tasks/{task.id}/", headers=auth_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not DjangoTaskModel.objects.filter(id=task.id).exists()
+
+        response = async_to_sync(client.get)(f"/api/async/tasks/{task.id}/", headers=auth_headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_requires_authentication(self):
+        response = async_to_sync(AsyncClient().get)("/api/async/tasks/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json()["detail"] == "Authentication credentials were not provided."
+
+    def test_login_then_list_users(self, user):
+        client = AsyncClient()
+        response = async_to_sync(client.post)(
+            "/api/async/auth/login/",
+            {"username": "asyncuser", "password": "securepassword123"},
+            content_type="application/json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        token = response.json()["token"]
+
+        response = async_to_sync(client.get)(
+            "/api/async/users/", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["username"] for item in response.json()["data"]] == ["asyncuser"]
+
+        response = async_to_sync(client.get)(
+            f"/api/async/users/{user.id}/", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == "asyncuser@gmail.com"
+
+    def test_login_with_wrong_password(self, user):
+        response = async_to_sync(AsyncClient().post)(
+            "/api/async/auth/login/",
+            {"username": "asyncuser", "password": "wrong-password"},
+            content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,143 @@
+import csv
+import io
+import json
+import uuid
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from src.core.tasks.application.use_cases.list_task import ListTask, MetaOutput, TaskOutput
+from src.core.tasks.domain.tasks import Task, TaskStatus
+from src.core.tasks.infra.in_memory_task_repository import InMemoryTaskRepository
+from src.django_project.auth_app.views import JWTAuthentication
+from src.django_project.task_app.models import Task as DjangoTaskModel
+from src.django_project.task_app.renderers import (
+    EXPORT_COLUMNS, EXPORT_ROWS_PER_CHUNK, render_task_list, stream_tasks_csv, stream_tasks_ndjson
+)
+from src.django_project.task_app.serializers import TaskListResponseSerializer, TaskOutputSerializer
+from src.django_project.user_app.models import User as DjangoUserModel
+
+
+def drf_bytes(response) -> bytes:
+    return JSONRenderer().render(TaskListResponseSerializer(instance=response).data)
+
+
+def list_response(links="full", **task_fields):
+    user_id = uuid.uuid4()
+    tasks = [
+        Task(title="Ação \u2028 <script>", description="émoji 🚀", users={user_id, uuid.uuid4()}, **task_fields),
+        Task(title="second", description="", users={user_id}),
+    ]
+    return ListTask(InMemoryTaskRepository(tasks)).execute(
+        ListTask.ListTaskRequest(user_id=user_id, size=1, links=links)
+    )
+
+
+class TestRenderTaskList:
+    @pytest.mark.parametrize("links", ["full", "minimal", "none"])
+    def test_bytes_match_the_serializer(self, links):
+        response = list_response(links=links)
+
+        assert render_task_list(response) == drf_bytes(response)
+
+    def test_bytes_match_the_serializer_for_completed_tasks(self):
+        response = list_response(status=TaskStatus.COMPLETED)
+
+        assert render_task_list(response) == drf_bytes(response)
+
+    def test_bytes_match_the_serializer_for_empty_and_null_fields(self):
+        response = ListTask.ListTaskResponse(
+            data=[
+                TaskOutput(
+                    id=uuid.uuid4(), title="t", description=None, status=None,
+                    created_at="2024-01-01T00:00:00+00:00", updated_at="",
+                    users=set(), links={"next": None}
+                )
+            ],
+            meta=MetaOutput(total_tasks=1, current_page=1, page_size=10, query_params={}),
+            links={"prev": None}
+        )
+
+        assert render_task_list(response) == drf_bytes(response)
+
+    def test_golden_output(self):
+        task_id = uuid.UUID("7b0b3f1e-7f45-4c3b-9d55-0d0f8a4b6c11")
+        user_id = uuid.UUID("5c3e0a52-2b6f-4c8e-8a55-3f8b0d6c1e22")
+        response = ListTask.ListTaskResponse(
+            data=[
+                TaskOutput(
+                    id=task_id, title="Tarefa", description="Descrição", status=TaskStatus.PENDING,
+                    created_at="2024-05-01T12:00:00+00:00", updated_at="2024-05-02T08:30:00+00:00",
+                    users={user_id}, links={"self": f"/api/tasks/{task_id}"}
+                )
+            ],
+            meta=MetaOutput(total_tasks=1, current_page=1, page_size=10, query_params={"order_by": "title", "page": 1, "size": 10}),
+            links={"next": None, "first": "/api/tasks?page=1&size=10&order_by=title"}
+        )
+
+        assert render_task_list(response) == (
+            '{"data":[{"id":"7b0b3f1e-7f45-4c3b-9d55-0d0f8a4b6c11","title":"Tarefa","description":"Descrição",'
+            '"users":["5c3e0a52-2b6f-4c8e-8a55-3f8b0d6c1e22"],"created_at":"2024-05-01T12:00:00+00:00",'
+            '"updated_at":"2024-05-02T08:30:00+00:00","links":{"self":"/api/tasks/7b0b3f1e-7f45-4c3b-9d55-0d0f8a4b6c11"},'
+            '"status":"pending"}],"meta":{"total_tasks":1,"current_page":1,"page_size":10,'
+            '"query_params":{"order_by":"title","page":1,"size":10}},'
+            '"links":{"next":null,"first":"/api/tasks?page=1&size=10&order_by=title"}}'
+        ).encode()
+
+
+@pytest.mark.django_db
+class TestTaskListEndpointRendering:
+    def test_fast_path_matches_the_serializer_path(self, monkeypatch):
+        user = DjangoUserModel.objects.create(username="render", email="render@gmail.com", password="x")
+        for title in ["b", "a \u2029", "c"]:
+            task = DjangoTaskModel.objects.create(title=title, description="ç")
+            task.users.add(user)
+        monkeypatch.setattr(JWTAuthentication, "authenticate", lambda self, request: (user, None))
+        client = APIClient()
+
+        fast = client.get("/api/tasks/?size=2")
+        # An `indent` parameter opts out of the fast path; indent=0 still renders compact JSON.
+        serialized = client.get("/api/tasks/?size=2", HTTP_ACCEPT="application/json; indent=0")
+
+        assert fast.status_code == serialized.status_code == 200
+        assert fast["Content-Type"] == "application/json"
+        assert fast.content == serialized.content
+
+
+def export_outputs(count):
+    user_id = uuid.uuid4()
+    tasks = [Task(title=f"Ação, \"{index}\"", description="linha\nnova", users={user_id}) for index in range(count)]
+    return ListTask(InMemoryTaskRepository(tasks)).execute(
+        ListTask.ListTaskRequest(user_id=user_id, size=count, links="none")
+    ).data
+
+
+class TestStreamExport:
+    def test_ndjson_lines_are_the_serializer_fields_without_links(self):
+        outputs = export_outputs(3)
+
+        lines = b"".join(stream_tasks_ndjson(outputs)).splitlines()
+
+        assert len(lines) == 3
+        for line, output in zip(lines, outputs):
+            expected = dict(TaskOutputSerializer(instance=output).data)
+            del expected["links"]
+            assert json.loads(line) == expected
+
+    def test_csv_round_trips_through_the_csv_module(self):
+        outputs = export_outputs(3)
+
+        rows = list(csv.DictReader(io.StringIO("".join(stream_tasks_csv(outputs)))))
+
+        assert tuple(rows[0]) == EXPORT_COLUMNS
+        assert [row["title"] for row in rows] == [output.title for output in outputs]
+        assert rows[0]["description"] == "linha\nnova"
+        assert rows[0]["users"] == " ".join(str(user_id) for user_id in outputs[0].users)
+
+    # CSV sends its header as a chunk of its own first.
+    @pytest.mark.parametrize("stream, header_chunks", [(stream_tasks_ndjson, 0), (stream_tasks_csv, 1)])
+    def test_rows_are_sent_in_chunks(self, stream, header_chunks):
+        chunks = list(stream(export_outputs(EXPORT_ROWS_PER_CHUNK + 1)))
+
+        assert len(chunks) == header_chunks + 2
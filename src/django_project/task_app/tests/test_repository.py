@@ -1,8 +1,10 @@
 import uuid
 import pytest
-from django.db import transaction
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 
-from src.core.tasks.domain.tasks import Task
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task, TaskStatus
 from src.django_project.task_app.repository import DjangoOrmTaskRepository
 from src.django_project.task_app.models import Task as DjangoTaskModel
 from src.django_project.user_app.models import User as DjangoUserModel
@@ -31,6 +33,175 @@ class TestSave:
         assert task_model.description == "A test task"
         assert user in task_model.users.all()
 
+    def test_save_existing_task_upserts_it(self):
+        user = DjangoUserModel.objects.create(
+            id=uuid.uuid4(),
+            username="upsert",
+            email="upsert@email.com",
+            password="securepassword123"
+        )
+        repo = DjangoOrmTaskRepository()
+        task = Task(title="Old", description="", users={user.id})
+        created_at = repo.save(task).created_at
+
+        task.title = "New"
+        saved = repo.save(task)
+
+        assert DjangoTaskModel.objects.count() == 1
+        assert DjangoTaskModel.objects.get().title == "New"
+        assert saved.created_at == created_at == DjangoTaskModel.objects.get().created_at
+        assert saved.users == {user.id}
+
+
+@pytest.mark.django_db
+class TestSaveQueryCount:
+    @pytest.fixture
+    def users(self):
+        return [
+            DjangoUserModel.objects.create(
+                id=uuid.uuid4(),
+                username=f"writer{i}",
+                email=f"writer{i}@email.com",
+                password="securepassword123"
+            )
+            for i in range(3)
+        ]
+
+    # Besides the statements below, the transaction adds a SAVEPOINT and a RELEASE.
+    def test_insert_reads_once_upserts_once_and_links_users_once(self, users, django_assert_num_queries):
+        task = Task(title="Task", description="", users={u.id for u in users})
+
+        with django_assert_num_queries(2 + 3):
+            saved = DjangoOrmTaskRepository().save(task)
+
+        assert saved.users == {u.id for u in users}
+        assert {u.id for u in DjangoTaskModel.objects.get().users.all()} == saved.users
+
+    def test_unchanged_users_are_not_touched(self, users, django_assert_num_queries):
+        repo = DjangoOrmTaskRepository()
+        task = Task(title="Task", description="", users={u.id for u in users})
+        repo.save(task)
+        task.title = "Renamed"
+
+        with django_assert_num_queries(2 + 2):
+            repo.save(task)
+
+        assert DjangoTaskModel.objects.get().title == "Renamed"
+
+    def test_changed_users_cost_one_delete_and_one_insert(self, users, django_assert_num_queries):
+        repo = DjangoOrmTaskRepository()
+        task = Task(title="Task", description="", users={users[0].id, users[1].id})
+        repo.save(task)
+        task.users = {users[1].id, users[2].id}
+
+        with django_assert_num_queries(2 + 4):
+            saved = repo.update(task)
+
+        assert saved.users == {users[1].id, users[2].id}
+        assert {u.id for u in DjangoTaskModel.objects.get().users.all()} == saved.users
+
+    def test_upsert_returns_the_users_its_own_read_found(self, users, django_assert_num_queries):
+        repo = DjangoOrmTaskRepository()
+        task = Task(title="Task", description="", users={users[0].id})
+        assert repo.upsert(task)[1] == set()
+        task.users = {users[1].id}
+
+        with django_assert_num_queries(2 + 4):
+            saved, previous_users = repo.upsert(task)
+
+        assert (saved.users, previous_users) == ({users[1].id}, {users[0].id})
+
+    def test_update_of_a_missing_task_raises(self):
+        with pytest.raises(ValueError):
+            DjangoOrmTaskRepository().update(Task(title="Missing", description=""))
+
+@pytest.mark.django_db
+class TestSaveMany:
+    @pytest.mark.parametrize("task_count", [1, 20])
+    def test_save_many_costs_two_inserts(self, task_count, django_assert_num_queries):
+        users = [
+            DjangoUserModel.objects.create(
+                id=uuid.uuid4(),
+                username=f"bulk{i}",
+                email=f"bulk{i}@email.com",
+                password="securepassword123"
+            )
+            for i in range(2)
+        ]
+        tasks = [
+            Task(title=f"Task {i}", description="", users={u.id for u in users})
+            for i in range(task_count)
+        ]
+
+        # Two INSERTs, plus the SAVEPOINT and RELEASE of the transaction.
+        with django_assert_num_queries(2 + 2):
+            DjangoOrmTaskRepository().save_many(tasks)
+
+        assert DjangoTaskModel.objects.count() == task_count
+        assert DjangoTaskModel.users.through.objects.count() == task_count * 2
+
+
+@pytest.mark.django_db
+class TestBulkStatusAndDelete:
+    @pytest.fixture
+    def owner_and_other(self):
+        return [
+            DjangoUserModel.objects.create(
+                id=uuid.uuid4(),
+                username=f"bulkowner{i}",
+                email=f"bulkowner{i}@email.com",
+                password="securepassword123"
+            )
+            for i in range(2)
+        ]
+
+    def test_update_status_many_is_one_statement_scoped_to_the_owner(self, owner_and_other, django_assert_num_queries):
+        owner, other = owner_and_other
+        repo = DjangoOrmTaskRepository()
+        own = [repo.save(Task(title=f"Own {i}", description="", users={owner.id})) for i in range(3)]
+        foreign = repo.save(Task(title="Foreign", description="", users={other.id}))
+
+        with django_assert_num_queries(1):
+            updated = repo.update_status_many(
+                TaskFilter(user_id=owner.id, ids=frozenset({own[0].id, own[1].id, foreign.id})),
+                TaskStatus.COMPLETED,
+            )
+
+        assert updated == 2
+        statuses = dict(DjangoTaskModel.objects.values_list("title", "status"))
+        assert statuses == {"Own 0": "completed", "Own 1": "completed", "Own 2": "pending", "Foreign": "pending"}
+
+    def test_delete_many_is_set_based_and_scoped_to_the_owner(self, owner_and_other, django_assert_max_num_queries):
+        owner, other = owner_and_other
+        repo = DjangoOrmTaskRepository()
+        for i in range(20):
+            repo.save(Task(title=f"Own {i}", description="", users={owner.id}))
+        repo.save(Task(title="Foreign", description="", users={other.id}))
+
+        # Selecting the tasks, deleting their through rows and deleting them,
+        # plus the SAVEPOINT and RELEASE of the transaction.
+        with django_assert_max_num_queries(3 + 2):
+            deleted = repo.delete_many(TaskFilter(user_id=owner.id, status=TaskStatus.PENDING))
+
+        assert deleted == 20
+        assert list(DjangoTaskModel.objects.values_list("title", flat=True)) == ["Foreign"]
+        assert DjangoTaskModel.users.through.objects.count() == 1
+
+    def test_assignments_are_one_query_and_include_every_user_of_the_selected_tasks(
+        self, owner_and_other, django_assert_num_queries
+    ):
+        owner, other = owner_and_other
+        repo = DjangoOrmTaskRepository()
+        shared = repo.save(Task(title="Shared", description="", users={owner.id, other.id}))
+        own = repo.save(Task(title="Own", description="", users={owner.id}))
+        repo.save(Task(title="Foreign", description="", users={other.id}))
+
+        with django_assert_num_queries(1):
+            assignments = repo.assignments(TaskFilter(user_id=owner.id))
+
+        assert sorted(assignments) == sorted([(shared.id, owner.id), (shared.id, other.id), (own.id, owner.id)])
+
+
 @pytest.mark.django_db
 class TestGetById:
     def test_get_by_id_when_task_exists(self):
@@ -150,4 +321,306 @@ class TestList:
         assert len(tasks) == 2
         titles = {t.title for t in tasks}
         assert "Task 1" in titles
-        assert "Task 2" in titles
\ No newline at end of file
+        assert "Task 2" in titles
+
+@pytest.mark.django_db
+class TestListPage:
+    def test_list_page_orders_and_slices_in_database(self):
+        user = DjangoUserModel.objects.create(
+            id=uuid.uuid4(),
+            username="user8",
+            email="user8@email.com",
+            password="securepassword123"
+        )
+        other = DjangoUserModel.objects.create(
+            id=uuid.uuid4(),
+            username="user9",
+            email="user9@email.com",
+            password="securepassword123"
+        )
+        repo = DjangoOrmTaskRepository()
+        for title in ["C", "A", "D", "B"]:
+            repo.save(Task(title=title, description="", users={user.id}))
+        repo.save(Task(title="0", description="", users={other.id}))
+
+        tasks, total = repo.list_page(user.id, order_by="title", offset=1, limit=2)
+
+        assert [t.title for t in tasks] == ["B", "C"]
+        assert total == 4
+
+
+@pytest.mark.django_db
+class TestQueryCount:
+    @pytest.fixture
+    def users(self):
+        return [
+            DjangoUserModel.objects.create(
+                id=uuid.uuid4(),
+                username=f"count{i}",
+                email=f"count{i}@email.com",
+                password="securepassword123"
+            )
+            for i in range(2)
+        ]
+
+    @pytest.mark.parametrize("task_count", [1, 5, 20])
+    def test_list_costs_a_fixed_number_of_queries(self, users, task_count, django_assert_num_queries):
+        repo = DjangoOrmTaskRepository()
+        for i in range(task_count):
+            repo.save(Task(title=f"Task {i}", description="", users={u.id for u in users}))
+
+        with django_assert_num_queries(2):
+            tasks = repo.list(users[0].id)
+
+        assert len(tasks) == task_count
+        assert all(task.users == {u.id for u in users} for task in tasks)
+
+    @pytest.mark.parametrize("task_count", [1, 5, 20])
+    def test_list_page_costs_a_fixed_number_of_queries(self, users, task_count, django_assert_num_queries):
+        repo = DjangoOrmTaskRepository()
+        for i in range(task_count):
+            repo.save(Task(title=f"Task {i}", description="", users={u.id for u in users}))
+
+        with django_assert_num_queries(3):
+            tasks, total = repo.list_page(users[0].id, order_by="title", offset=0, limit=10)
+
+        assert total == task_count
+        assert all(task.users == {u.id for u in users} for task in tasks)
+
+
+@pytest.mark.django_db
+class TestIterate:
+    def test_iterate_streams_in_chunks_with_batched_users(self, django_assert_num_queries):
+        users = [
+            DjangoUserModel.objects.create(
+                id=uuid.uuid4(),
+                username=f"export{i}",
+                email=f"export{i}@email.com",
+                password="securepassword123"
+            )
+            for i in range(2)
+        ]
+        repo = DjangoOrmTaskRepository()
+        saved = [repo.save(Task(title=f"Task {i}", description="", users={u.id for u in users})) for i in range(5)]
+        repo.save(Task(title="Other", description="", users={users[1].id}))
+
+        # The task query, then one users query per chunk of 2 tasks.
+        with django_assert_num_queries(1 + 3):
+            tasks = list(repo.iterate(users[0].id, chunk_size=2))
+
+        assert [task.id for task in tasks] == sorted(task.id for task in saved)
+        assert all(task.users == {u.id for u in users} for task in tasks)
+
+
+@pytest.mark.django_db
+class TestListAfter:
+    def test_list_after_seeks_past_the_given_position(self):
+        user = DjangoUserModel.objects.create(
+            id=uuid.uuid4(),
+            username="user10",
+            email="user10@email.com",
+            password="securepassword123"
+        )
+        repo = DjangoOrmTaskRepository()
+        for title in ["C", "A", "B", "B"]:
+            repo.save(Task(title=title, description="", users={user.id}))
+        first_page, total = repo.list_after(user.id, order_by="title", after=None, limit=2)
+        last = first_page[-1]
+
+        second_page, _ = repo.list_after(
+            user.id, order_by="title", after=(last.title, last.id), limit=10
+        )
+
+        assert total == 4
+        assert [t.title for t in first_page] == ["A", "B"]
+        assert [t.title for t in second_page] == ["B", "C"]
+        assert {t.id for t in first_page}.isdisjoint({t.id for t in second_page})
+
+
+def explain(queries):
+    """EXPLAIN captured queries with sequential scans and sorts disabled, keyed by SQL.
+
+    The planner then falls back to a scan or sort only when no index can serve it.
+    """
+    plans = {}
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute("SET LOCAL enable_sort = off")
+        for query in queries:
+            cursor.execute(f"EXPLAIN {query['sql']}")
+            plans[query["sql"]] = "\n".join(row[0] for row in cursor.fetchall())
+    return plans
+
+
+def assert_served_by_indexes(queries, order_by):
+    plans = explain(queries)
+    assert all("Seq Scan" not in plan for plan in plans.values())
+    [page_plan] = [plan for sql, plan in plans.items() if "ORDER BY" in sql]
+    assert f"task_{order_by}_id_idx" in page_plan
+    assert "Index Cond: (user_id = " in page_plan
+    assert "Sort" not in page_plan
+
+
+@pytest.mark.django_db
+class TestListingQueriesUseIndexes:
+    @pytest.fixture
+    def user(self):
+        user = DjangoUserModel.objects.create(
+            id=uuid.uuid4(),
+            username="indexed",
+            email="indexed@email.com",
+            password="securepassword123"
+        )
+        repo = DjangoOrmTaskRepository()
+        for i in range(3):
+            repo.save(Task(title=f"Task {i}", description="", users={user.id}))
+        return user
+
+    @pytest.mark.parametrize("order_by", ["title", "status", "created_at", "updated_at"])
+    def test_list_page_uses_indexes(self, user, order_by):
+        with CaptureQueriesContext(connection) as context:
+            DjangoOrmTaskRepository().list_page(user.id, order_by=order_by, offset=0, limit=2)
+
+        assert_served_by_indexes(context.captured_queries, order_by)
+
+    @pytest.mark.parametrize("order_by", ["title", "status", "created_at", "updated_at"])
+    def test_list_after_uses_indexes(self, user, order_by):
+        repo = DjangoOrmTaskRepository()
+        first_page, _ = repo.list_after(user.id, order_by=order_by, after=None, limit=2)
+        last = first_page[-1]
+
+        with CaptureQueriesContext(connection) as context:
+            repo.list_after(user.id, order_by=order_by, after=(getattr(last, order_by), last.id), limit=2)
+
+        assert_served_by_indexes(context.captured_queries, order_by)
+
+
+@pytest.mark.django_db
+class TestFilteredListing:
+    @pytest.fixture
+    def users(self):
+        return [
+            DjangoUserModel.objects.create(
+                id=uuid.uuid4(),
+                username=f"filter{i}",
+                email=f"filter{i}@email.com",
+                password="securepassword123"
+            )
+            for i in range(2)
+        ]
+
+    @pytest.fixture
+    def tasks(self, users):
+        owner, other = users
+        repo = DjangoOrmTaskRepository()
+        saved = {
+            title: repo.save(Task(title=title, description="", users=assignees))
+            for title, assignees in [
+                ("Release 1", {owner.id}),
+                ("Release 2", {owner.id, other.id}),
+                ("Review 100%", {owner.id, other.id}),
+                ("Release 3", {other.id}),
+            ]
+        }
+        DjangoTaskModel.objects.filter(title="Release 1").update(status="completed")
+        return saved
+
+    @pytest.mark.parametrize("criteria, expected", [
+        ({"status": TaskStatus.COMPLETED}, ["Release 1"]),
+        ({"title_prefix": "Rel"}, ["Release 1", "Release 2"]),
+        ({"title_prefix": "Review 100%"}, ["Review 100%"]),
+        ({"title_prefix": "Re%"}, []),
+        ({"assignee": True}, ["Release 2", "Review 100%"]),
+        ({"assignee": True, "title_prefix": "Rev"}, ["Review 100%"]),
+    ])
+    def test_filters_are_applied_in_sql(self, users, tasks, criteria, expected):
+        owner, other = users
+        if criteria.pop("assignee", False):
+            criteria["assignee_id"] = other.id
+        task_filter = TaskFilter(user_id=owner.id, **criteria)
+        repo = DjangoOrmTaskRepository()
+
+        page, total = repo.list_page(owner.id, "title", 0, 10, task_filter)
+        after_page, after_total = repo.list_after(owner.id, "title", None, 10, task_filter)
+
+        assert [task.title for task in page] == expected == [task.title for task in after_page]
+        assert total == after_total == len(expected)
+
+    def test_date_ranges_are_half_open(self, users, tasks):
+        owner, _ = users
+        created_at = tasks["Release 2"].created_at
+        repo = DjangoOrmTaskRepository()
+
+        page, _ = repo.list_page(owner.id, "created_at", 0, 10, TaskFilter(
+            user_id=owner.id, created_after=created_at, created_before=tasks["Review 100%"].created_at
+        ))
+
+        assert [task.title for task in page] == ["Release 2"]
+
+    @pytest.mark.parametrize("criteria", [
+        {"status": TaskStatus.PENDING},
+        {"title_prefix": "Rel"},
+        {"updated_after": "2025-01-01T00:00:00Z"},
+        {"created_before": "2030-01-01T00:00:00Z"},
+    ])
+    def test_filtered_listing_uses_indexes(self, users, tasks, criteria):
+        owner, _ = users
+        with CaptureQueriesContext(connection) as context:
+            DjangoOrmTaskRepository().list_page(owner.id, "title", 0, 2, TaskFilter(user_id=owner.id, **criteria))
+
+        assert all("Seq Scan" not in plan for plan in explain(context.captured_queries).values())
+
+    def test_title_prefix_can_use_the_pattern_ops_index(self, users, tasks):
+        owner, _ = users
+        queryset = DjangoOrmTaskRepository()._filtered(TaskFilter(user_id=owner.id, title_prefix="Rel"))
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_indexscan = off")
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN {sql}", params)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        assert "task_title_prefix_idx" in plan
+
+
+@pytest.mark.django_db
+class TestVersions:
+    @pytest.fixture
+    def user(self):
+        return DjangoUserModel.objects.create(
+            id=uuid.uuid4(),
+            username="versioned",
+            email="versioned@email.com",
+            password="securepassword123"
+        )
+
+    def test_probes_take_one_query_and_follow_writes(self, user, django_assert_num_queries):
+        repo = DjangoOrmTaskRepository()
+        first = repo.save(Task(title="First", description="", users={user.id}))
+        second = repo.save(Task(title="Second", description="", users={user.id}))
+
+        with django_assert_num_queries(1):
+            assert repo.get_version(first.id) == first.updated_at
+        with django_assert_num_queries(1):
+            assert repo.collection_version(user.id) == (second.updated_at, 2)
+
+        first.update_task(title="First again")
+        repo.update(first)
+        assert repo.collection_version(user.id) == (repo.get_version(first.id), 2)
+        assert repo.collection_version(user.id, TaskFilter(user_id=user.id, title_prefix="Sec")) == (
+            second.updated_at, 1
+        )
+
+        repo.delete(first.id)
+        assert repo.get_version(first.id) is None
+        assert repo.collection_version(user.id) == (second.updated_at, 1)
+        assert repo.collection_version(uuid.uuid4()) == (None, 0)
+
+    def test_collection_probe_uses_indexes(self, user):
+        DjangoOrmTaskRepository().save(Task(title="Task", description="", users={user.id}))
+
+        with CaptureQueriesContext(connection) as context:
+            DjangoOrmTaskRepository().collection_version(user.id)
+
+        assert all("Seq Scan" not in plan for plan in explain(context.captured_queries).values())
@@ -0,0 +1,81 @@
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.core.tasks.domain.task_filter import TaskFilter
+from src.core.tasks.domain.tasks import Task, TaskStatus
+from src.django_project.task_app.repository import DjangoOrmTaskRepository
+from src.django_project.task_app.search_index import PostgresTaskSearchIndex
+from src.django_project.user_app.models import User as DjangoUserModel
+
+
+@pytest.mark.django_db
+class TestPostgresTaskSearchIndex:
+    @pytest.fixture
+    def users(self):
+        return [
+            DjangoUserModel.objects.create(
+                id=uuid.uuid4(),
+                username=f"searcher{i}",
+                email=f"searcher{i}@email.com",
+                password="securepassword123"
+            )
+            for i in range(2)
+        ]
+
+    def search(self, user_id, query, offset=0, limit=10):
+        tasks, total = PostgresTaskSearchIndex().search(user_id, query, offset, limit)
+        return [task.title for task in tasks], total
+
+    def test_every_word_must_match_and_title_ranks_above_description(self, users):
+        owner, _ = users
+        repo = DjangoOrmTaskRepository()
+        repo.save(Task(title="Deploy", description="release notes", users={owner.id}))
+        repo.save(Task(title="Release notes", description="", users={owner.id}))
+        repo.save(Task(title="Release", description="", users={owner.id}))
+
+        assert self.search(owner.id, "Release Notes") == (["Release notes", "Deploy"], 2)
+        assert self.search(owner.id, "release missing") == ([], 0)
+        titles, total = self.search(owner.id, "release", offset=1, limit=1)
+        assert total == 3 and len(titles) == 1
+
+    def test_only_the_users_tasks_are_searched(self, users):
+        owner, other = users
+        repo = DjangoOrmTaskRepository()
+        repo.save(Task(title="Shared report", description="", users={owner.id, other.id}))
+        repo.save(Task(title="Private report", description="", users={other.id}))
+
+        assert self.search(owner.id, "report") == (["Shared report"], 1)
+        assert self.search(other.id, "report")[1] == 2
+
+    def test_saves_updates_and_deletes_are_searchable_immediately(self, users):
+        owner, _ = users
+        repo = DjangoOrmTaskRepository()
+        task = Task(title="Old title", description="", users={owner.id})
+        repo.save(task)
+        repo.save_many([Task(title="Bulk title", description="", users={owner.id})])
+
+        task.update_task(title="New title")
+        repo.update(task)
+        repo.update_status_many(TaskFilter(user_id=owner.id, ids=frozenset({task.id})), TaskStatus.COMPLETED)
+        assert self.search(owner.id, "old") == ([], 0)
+        assert self.search(owner.id, "new") == (["New title"], 1)
+        assert self.search(owner.id, "bulk") == (["Bulk title"], 1)
+
+        repo.delete(task.id)
+        assert self.search(owner.id, "title") == (["Bulk title"], 1)
+
+    def test_matches_are_found_through_the_gin_index(self, users):
+        owner, _ = users
+        DjangoOrmTaskRepository().save(Task(title="Indexed", description="", users={owner.id}))
+
+        with CaptureQueriesContext(connection) as context:
+            PostgresTaskSearchIndex().search(owner.id, "indexed", 0, 10)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {context.captured_queries[0]['sql']}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        assert "task_search_vector_idx" in plan
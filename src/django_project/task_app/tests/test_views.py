@@ -1,7 +1,16 @@
+import csv
+import io
+import json
+from datetime import timedelta
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from src.core.tasks.application.use_cases.bulk_create_task import MAX_BULK_TASKS
 from src.django_project.user_app.models import User as DjangoUserModel
 from src.django_project.task_app.models import Task as DjangoTaskModel
 
@@ -144,7 +153,7 @@ class TestTaskAPIFlow(APITestCase):
         # Lista tasks
         list_response = self.client.get('/api/tasks/?order_by=title&page=1&size=10')
         assert list_response.status_code == status.HTTP_200_OK
-        data = list_response.data
+        data = list_response.json()
         assert "data" in data
         assert isinstance(data["data"], list)
         assert len(data["data"]) >= 3  # Deve ter pelo menos as 3 criadas
@@ -369,4 +378,403 @@ class TestTaskAPIDelete(APITestCase):
         import uuid
         fake_id = str(uuid.uuid4())
         delete_response = self.client.delete(f'/api/tasks/{fake_id}/')
-        assert delete_response.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+        assert delete_response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+class TestAPITaskBulkCreate(APITestCase):
+    def setUp(self):
+        user_data = {
+            "username": "teste",
+            "password": "securepassword123",
+            "email": "teste@gmail.com"
+        }
+        create_response = self.client.post('/api/users/', user_data, format='json')
+        assert create_response.status_code == status.HTTP_201_CREATED
+
+        login_response = self.client.post(
+            '/auth/login/',
+            {"username": "teste", "password": "securepassword123"},
+            format='json'
+        )
+        assert login_response.status_code == status.HTTP_200_OK
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {login_response.data["token"]}')
+
+    def test_bulk_create_all_valid(self):
+        response = self.client.post(
+            '/api/tasks/bulk/',
+            {"tasks": [{"title": f"Task {i}", "description": f"Description {i}"} for i in range(5)]},
+            format='json'
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 5
+        assert response.data["failed"] == 0
+        assert [result["index"] for result in response.data["results"]] == list(range(5))
+        user = DjangoUserModel.objects.get(username="teste")
+        assert set(DjangoTaskModel.objects.filter(users=user).values_list("title", flat=True)) == {
+            f"Task {i}" for i in range(5)
+        }
+
+    def test_bulk_create_partial_failure(self):
+        response = self.client.post(
+            '/api/tasks/bulk/',
+            {"tasks": [{"title": "Valid"}, {"title": "x" * 31}]},
+            format='json'
+        )
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        valid, invalid = response.data["results"]
+        assert valid["id"] is not None and valid["error"] is None
+        assert invalid["id"] is None and "Title cannot exceed 30 characters." in invalid["error"]
+        assert DjangoTaskModel.objects.count() == 1
+
+    def test_bulk_create_all_invalid(self):
+        response = self.client.post(
+            '/api/tasks/bulk/',
+            {"tasks": [{"title": "Valid", "users": ["8b7f7a3c-6a0e-4f5e-9f2a-2f6a3b1c0d9e"]}]},
+            format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["failed"] == 1
+        assert DjangoTaskModel.objects.count() == 0
+
+    def test_bulk_create_rejects_empty_payload(self):
+        response = self.client.post('/api/tasks/bulk/', {"tasks": []}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_create_rejects_oversized_payload_before_validating_items(self):
+        tasks = [{"description": "no title"}] * (MAX_BULK_TASKS + 1)
+        response = self.client.post('/api/tasks/bulk/', {"tasks": tasks}, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "title" not in str(response.data)
+        assert DjangoTaskModel.objects.count() == 0
+
+    def test_bulk_create_unauthenticated(self):
+        self.client.credentials()
+        response = self.client.post('/api/tasks/bulk/', {"tasks": [{"title": "Task"}]}, format='json')
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+
+@pytest.mark.django_db
+class TestAPITaskBulkUpdateAndDelete(APITestCase):
+    def setUp(self):
+        for username in ("teste", "outro"):
+            create_response = self.client.post(
+                '/api/users/',
+                {"username": username, "password": "securepassword123", "email": f"{username}@gmail.com"},
+                format='json'
+            )
+            assert create_response.status_code == status.HTTP_201_CREATED
+        self.tokens = {}
+        for username in ("teste", "outro"):
+            login_response = self.client.post(
+                '/auth/login/',
+                {"username": username, "password": "securepassword123"},
+                format='json'
+            )
+            self.tokens[username] = login_response.data["token"]
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.tokens["outro"]}')
+        response = self.client.post('/api/tasks/bulk/', {"tasks": [{"title": "Foreign"}]}, format='json')
+        self.foreign_id = response.data["results"][0]["id"]
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.tokens["teste"]}')
+        response = self.client.post(
+            '/api/tasks/bulk/', {"tasks": [{"title": f"Task {i}"} for i in range(3)]}, format='json'
+        )
+        self.task_ids = [result["id"] for result in response.data["results"]]
+
+    def test_bulk_complete_by_ids_ignores_other_users_tasks(self):
+        response = self.client.patch(
+            '/api/tasks/bulk/',
+            {"ids": self.task_ids[:2] + [self.foreign_id], "status": "completed"},
+            format='json'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"updated": 2}
+        assert set(DjangoTaskModel.objects.filter(status="completed").values_list("title", flat=True)) == {
+            "Task 0", "Task 1"
+        }
+
+    def test_bulk_delete_by_filter(self):
+        self.client.patch('/api/tasks/bulk/', {"ids": self.task_ids[:1], "status": "completed"}, format='json')
+
+        response = self.client.delete(
+            '/api/tasks/bulk/', {"filter": {"status": "completed"}}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"deleted": 1}
+        assert set(DjangoTaskModel.objects.values_list("title", flat=True)) == {"Task 1", "Task 2", "Foreign"}
+
+    def test_bulk_delete_by_created_before(self):
+        response = self.client.delete(
+            '/api/tasks/bulk/', {"filter": {"created_before": "2000-01-01T00:00:00Z"}}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"deleted": 0}
+
+    def test_bulk_operations_require_a_selection(self):
+        assert self.client.delete('/api/tasks/bulk/', {}, format='json').status_code == status.HTTP_400_BAD_REQUEST
+        response = self.client.patch('/api/tasks/bulk/', {"status": "completed"}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert DjangoTaskModel.objects.filter(status="completed").count() == 0
+
+
+@pytest.mark.django_db
+class TestAPITaskExport(APITestCase):
+    def setUp(self):
+        self.client.post(
+            '/api/users/',
+            {"username": "teste", "password": "securepassword123", "email": "teste@gmail.com"},
+            format='json'
+        )
+        login_response = self.client.post(
+            '/auth/login/',
+            {"username": "teste", "password": "securepassword123"},
+            format='json'
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {login_response.data["token"]}')
+        self.client.post('/api/tasks/bulk/', {"tasks": [{"title": f"Task {i}"} for i in range(3)]}, format='json')
+
+    def test_export_ndjson_by_default(self):
+        response = self.client.get('/api/tasks/export/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).splitlines()
+        assert sorted(json.loads(line)["title"] for line in lines) == ["Task 0", "Task 1", "Task 2"]
+
+    def test_export_csv(self):
+        response = self.client.get('/api/tasks/export/?format=csv')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/csv")
+        assert 'filename="tasks.csv"' in response["Content-Disposition"]
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        assert sorted(row["title"] for row in rows) == ["Task 0", "Task 1", "Task 2"]
+
+    def test_export_unauthenticated(self):
+        self.client.credentials()
+        response = self.client.get('/api/tasks/export/')
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+
+@pytest.mark.django_db
+class TestAPITaskListFilters(APITestCase):
+    def setUp(self):
+        for username in ("teste", "outro"):
+            self.client.post(
+                '/api/users/',
+                {"username": username, "password": "securepassword123", "email": f"{username}@gmail.com"},
+                format='json'
+            )
+        self.other = DjangoUserModel.objects.get(username="outro")
+        login_response = self.client.post(
+            '/auth/login/',
+            {"username": "teste", "password": "securepassword123"},
+            format='json'
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {login_response.data["token"]}')
+        response = self.client.post('/api/tasks/bulk/', {"tasks": [
+            {"title": "Release 1"},
+            {"title": "Release 2", "users": [str(self.other.id)]},
+            {"title": "Review"},
+        ]}, format='json')
+        self.client.patch(
+            '/api/tasks/bulk/', {"ids": [response.data["results"][0]["id"]], "status": "completed"}, format='json'
+        )
+
+    def titles(self, response):
+        return [task["title"] for task in response.json()["data"]]
+
+    def test_list_by_status_and_title_prefix(self):
+        response = self.client.get('/api/tasks/?status=pending&title_prefix=Rel')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.titles(response) == ["Release 2"]
+        assert response.json()["meta"]["total_tasks"] == 1
+        assert response.json()["meta"]["query_params"]["title_prefix"] == "Rel"
+
+    def test_list_by_assignee(self):
+        response = self.client.get(f'/api/tasks/?assignee={self.other.id}')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.titles(response) == ["Release 2"]
+
+    def test_list_by_created_range(self):
+        response = self.client.get('/api/tasks/?created_after=2000-01-01T00:00:00Z&created_before=2000-01-02T00:00:00Z')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.titles(response) == []
+
+    def test_list_rejects_invalid_filters(self):
+        for query in ("status=unknown", "created_after=yesterday", "assignee=not-a-uuid"):
+            response = self.client.get(f'/api/tasks/?{query}')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST, query
+        response = self.client.get(
+            '/api/tasks/?updated_after=2001-01-01T00:00:00Z&updated_before=2000-01-01T00:00:00Z'
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestAPITaskSearch(APITestCase):
+    def setUp(self):
+        self.client.post(
+            '/api/users/',
+            {"username": "teste", "password": "securepassword123", "email": "teste@gmail.com"},
+            format='json'
+        )
+        login_response = self.client.post(
+            '/auth/login/',
+            {"username": "teste", "password": "securepassword123"},
+            format='json'
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {login_response.data["token"]}')
+        self.client.post('/api/tasks/bulk/', {"tasks": [
+            {"title": "Weekly report", "description": "send to finance"},
+            {"title": "Finance meeting", "description": ""},
+            {"title": "Groceries", "description": "milk"},
+        ]}, format='json')
+
+    def test_search_ranks_title_matches_first(self):
+        response = self.client.get('/api/tasks/search/?q=finance')
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert [task["title"] for task in body["data"]] == ["Finance meeting", "Weekly report"]
+        assert body["meta"]["total_tasks"] == 2
+        assert body["links"]["next"] is None
+
+    def test_search_is_paginated(self):
+        response = self.client.get('/api/tasks/search/?q=finance&size=1')
+
+        body = response.json()
+        assert [task["title"] for task in body["data"]] == ["Finance meeting"]
+        assert body["links"]["next"] == "/api/tasks/search?q=finance&page=2&size=1"
+
+    def test_search_requires_a_query(self):
+        for query in ("", "?q=", "?q=%20%20", "?q=finance&size=0"):
+            response = self.client.get(f'/api/tasks/search/{query}')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST, query
+
+    def test_search_unauthenticated(self):
+        self.client.credentials()
+        response = self.client.get('/api/tasks/search/?q=finance')
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+
+@pytest.mark.django_db
+class TestAPITaskConditionalGet(APITestCase):
+    def setUp(self):
+        self.client.post(
+            '/api/users/',
+            {"username": "teste", "password": "securepassword123", "email": "teste@gmail.com"},
+            format='json'
+        )
+        login_response = self.client.post(
+            '/auth/login/',
+            {"username": "teste", "password": "securepassword123"},
+            format='json'
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {login_response.data["token"]}')
+        response = self.client.post('/api/tasks/bulk/', {"tasks": [{"title": f"Task {i}"} for i in range(3)]}, format='json')
+        self.task_id = response.data["results"][0]["id"]
+
+    def test_unchanged_task_is_not_modified_until_it_is_updated(self):
+        url = f'/api/tasks/{self.task_id}/'
+        response = self.client.get(url)
+        etag = response["ETag"]
+        assert response["Last-Modified"]
+        assert "no-cache" in response["Cache-Control"]
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+        assert self.client.get(url + "?links=none", HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+        self.client.patch(url, {"status": "completed"}, format='json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_unchanged_list_does_not_query_tasks(self):
+        response = self.client.get('/api/tasks/?size=2')
+        etag = response["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            not_modified = self.client.get('/api/tasks/?size=2', HTTP_IF_NONE_MATCH=etag)
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        # The version probe is answered by the list cache filled by the first request.
+        assert [query for query in context.captured_queries if '"Task"' in query["sql"]] == []
+
+    def test_repeated_list_is_served_from_the_cache_until_a_write(self):
+        total = self.client.get('/api/tasks/?size=2').json()["meta"]["total_tasks"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/tasks/?size=2')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [query for query in context.captured_queries if '"Task' in query["sql"]] == []
+
+        self.client.post('/api/tasks/', {"title": "Aaa first"}, format='json')
+        body = self.client.get('/api/tasks/?size=2').json()
+        assert body["meta"]["total_tasks"] == total + 1
+        assert body["data"][0]["title"] == "Aaa first"
+
+    def test_list_changes_on_create_and_delete(self):
+        etag = self.client.get('/api/tasks/')["ETag"]
+
+        self.client.post('/api/tasks/', {"title": "Another"}, format='json')
+        response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response["ETag"]
+
+        self.client.delete(f'/api/tasks/{self.task_id}/')
+        assert self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_list_is_validated_by_etag_only(self):
+        response = self.client.get('/api/tasks/')
+        assert "Last-Modified" not in response
+
+        # Deleting a task other than the newest leaves max(updated_at) where it was.
+        self.client.delete(f'/api/tasks/{self.task_id}/')
+        since = self.client.get('/api/tasks/', HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+        assert since.status_code == status.HTTP_200_OK
+        assert len(since.json()["data"]) == 2
+
+    def test_stale_cached_body_is_not_validated_by_the_new_version(self):
+        url = f'/api/tasks/{self.task_id}/'
+        etag = self.client.get(url)["ETag"]
+        # Another process updates the task; this process still caches the old copy.
+        DjangoTaskModel.objects.filter(id=self.task_id).update(
+            title="Changed elsewhere", updated_at=timezone.now() + timedelta(seconds=5)
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] != "Changed elsewhere"
+
+        again = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert again.status_code == status.HTTP_200_OK
+
+    def test_repeated_retrieve_reads_the_task_from_the_cache(self):
+        url = f'/api/tasks/{self.task_id}/'
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        # Only the version probe; the task and its users come from the cache.
+        assert len([query for query in context.captured_queries if '"Task' in query["sql"]]) == 1
+
+        self.client.patch(url, {"title": "Renamed"}, format='json')
+        assert self.client.get(url).data["title"] == "Renamed"
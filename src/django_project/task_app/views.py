@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from django.shortcuts import render
 
 from rest_framework import viewsets
@@ -10,22 +12,45 @@ from rest_framework.authentication import SessionAuthentication, BasicAuthentica
 
 
 from src.core.tasks.application.use_cases.create_task import CreateTask
-from src.core.tasks.application.exceptions import InvalidTaskData, RelatedUserNotFound, InvalidTaskBy, TaskNotFound
-from src.django_project.task_app.serializers import CreateTaskRequestSerializer, CreateTaskResponseSerializer, TaskListResponseSerializer, TaskRetrieveResponseSerializer, TaskOutputSerializer, UpdateTaskRequestSerializer, DeleteTaskRequestSerializer
+from src.core.tasks.application.use_cases.bulk_create_task import BulkCreateTask
+from src.core.tasks.application.use_cases.bulk_update_task_status import BulkUpdateTaskStatus
+from src.core.tasks.application.use_cases.bulk_delete_task import BulkDeleteTask
+from src.core.tasks.application.use_cases.export_tasks import ExportTasks
+from src.core.tasks.application.use_cases.search_tasks import SearchTasks
+from src.core.tasks.application.exceptions import InvalidTaskData, RelatedUserNotFound, InvalidTaskBy, TaskNotFound, InvalidCursor
+from src.django_project.task_app.serializers import BulkCreateTaskRequestSerializer, BulkCreateTaskResponseSerializer, BulkTaskSelectionSerializer, BulkUpdateTaskStatusRequestSerializer, SearchTasksRequestSerializer, TaskFilterSerializer, CreateTaskRequestSerializer, CreateTaskResponseSerializer, TaskListResponseSerializer, TaskRetrieveResponseSerializer, TaskOutputSerializer, UpdateTaskRequestSerializer, DeleteTaskRequestSerializer
 from src.core.tasks.application.use_cases.update_task import UpdateTask
 from src.core.tasks.application.use_cases.get_task import GetTask
 from src.core.tasks.application.use_cases.delete_task import DeleteTask
 from src.core.tasks.application.use_cases.get_task import TaskOutput
 
 
+from src.core.tasks.domain.task_filter import TaskFilter
 from src.core.tasks.domain.tasks import TaskStatus
+from src.core._shared.links import LINKS_FULL, InvalidLinksMode
 
 from src.core.tasks.application.use_cases.list_task import ListTask
 
-from src.django_project.task_app.repository import DjangoOrmTaskRepository
+from src.django_project.task_app.task_cache import get_task_repository
+from src.django_project.task_app.search_index import PostgresTaskSearchIndex
+from src.django_project.task_app.renderers import CSVRenderer, NDJSONRenderer, render_task_list, stream_tasks_csv, stream_tasks_ndjson
+from src.django_project.json_renderer import accepts_fast_json, json_response
+from src.django_project.conditional import make_etag, not_modified, with_validators
 from src.django_project.user_app.repository import DjangoORMUserRepository
 from src.django_project.auth_app.views import JWTAuthentication
+from src.adapters.cursor.signed_cursor_adapter import SignedCursorAdapter
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+
 
+def _task_filter(request, data) -> TaskFilter:
+    """Build the TaskFilter of a bulk request; the authenticated user is always the owner."""
+    return TaskFilter(
+        user_id=request.user.id,
+        ids=frozenset(data["ids"]) if "ids" in data else None,
+        **TaskFilterSerializer.filter_fields(data.get("filter", {})),
+    )
 
 
 class TaskViewSet(viewsets.ViewSet):
@@ -40,25 +65,43 @@ class TaskViewSet(viewsets.ViewSet):
         order_by = request.query_params.get('order_by', 'title')
         page = int(request.query_params.get('page', 1))
         size = int(request.query_params.get('size', 10))
+        filters = TaskFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
 
         use_case = ListTask(
-            repository=DjangoOrmTaskRepository(),
+            repository=get_task_repository(),
+            cursor_adapter=SignedCursorAdapter(secret_key=settings.SECRET_KEY),
         )
         request_uc = ListTask.ListTaskRequest(
             order_by=order_by,
             page=page,
             size=size,
-            user_id=str(request.user.id)
+            user_id=str(request.user.id),
+            cursor=request.query_params.get('cursor'),
+            links=request.query_params.get('links', LINKS_FULL),
+            **TaskFilterSerializer.filter_fields(filters.validated_data)
         )
         try:
+            # Cheap `(max updated_at, count)` probe first; unchanged polls stop here with a 304.
+            last_modified, count = use_case.version(request_uc)
+            etag = make_etag(request, last_modified, count)
+            # ETag only: a delete can lower the count without moving the newest timestamp,
+            # so `Last-Modified` alone would answer `If-Modified-Since` with a stale 304.
+            unchanged = not_modified(request, etag, None)
+            if unchanged is not None:
+                return unchanged
             response = use_case.execute(request=request_uc)
-        except (InvalidTaskData, RelatedUserNotFound) as err:
+        except (InvalidTaskData, InvalidTaskBy, InvalidCursor, InvalidLinksMode) as err:
             return Response(
                 {"error": str(err)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        if accepts_fast_json(request):
+            return with_validators(
+                json_response(render_task_list(response), status=status.HTTP_200_OK), etag, None
+            )
         serializer = TaskListResponseSerializer(instance=response)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return with_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, None)
         
 
     def create(self, request: Request) -> Response:
@@ -72,7 +115,7 @@ class TaskViewSet(viewsets.ViewSet):
         data.pop('users', None)
 
         use_case = CreateTask(
-            repository=DjangoOrmTaskRepository(),
+            repository=get_task_repository(),
             user_repository=DjangoORMUserRepository()
         )
         try:
@@ -89,19 +132,134 @@ class TaskViewSet(viewsets.ViewSet):
             status=status.HTTP_201_CREATED
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request: Request) -> Response:
+        """
+        Create many tasks at once; 201 when all are created, 207 when only some are.
+        """
+        serializer = BulkCreateTaskRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        use_case = BulkCreateTask(
+            repository=get_task_repository(),
+            user_repository=DjangoORMUserRepository()
+        )
+        try:
+            response = use_case.execute(BulkCreateTask.BulkCreateTaskRequest(tasks=[
+                CreateTask.CreateTaskRequest(
+                    title=item["title"],
+                    description=item.get("description", ""),
+                    user_ids={*item.get("users", []), request.user.id},
+                )
+                for item in serializer.validated_data["tasks"]
+            ]))
+        except InvalidTaskData as err:
+            return Response({"error": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not response.failed:
+            response_status = status.HTTP_201_CREATED
+        elif response.created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(BulkCreateTaskResponseSerializer(response).data, status=response_status)
+
+    @bulk.mapping.patch
+    def bulk_update_status(self, request: Request) -> Response:
+        """
+        Set the status of the selected tasks (`ids` and/or `filter`).
+        """
+        serializer = BulkUpdateTaskStatusRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        use_case = BulkUpdateTaskStatus(repository=get_task_repository())
+        try:
+            response = use_case.execute(BulkUpdateTaskStatus.BulkUpdateTaskStatusRequest(
+                task_filter=_task_filter(request, serializer.validated_data),
+                status=TaskStatus(serializer.validated_data["status"]),
+            ))
+        except InvalidTaskData as err:
+            return Response({"error": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"updated": response.updated}, status=status.HTTP_200_OK)
+
+    @bulk.mapping.delete
+    def bulk_delete(self, request: Request) -> Response:
+        """
+        Delete the selected tasks (`ids` and/or `filter`).
+        """
+        serializer = BulkTaskSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        use_case = BulkDeleteTask(repository=get_task_repository())
+        try:
+            response = use_case.execute(BulkDeleteTask.BulkDeleteTaskRequest(
+                task_filter=_task_filter(request, serializer.validated_data),
+            ))
+        except InvalidTaskData as err:
+            return Response({"error": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"deleted": response.deleted}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="export", renderer_classes=[NDJSONRenderer, CSVRenderer])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """
+        Stream every task of the user as NDJSON (default) or CSV (`?format=csv`).
+        """
+        use_case = ExportTasks(repository=get_task_repository())
+        response = use_case.execute(ExportTasks.ExportTasksRequest(user_id=request.user.id))
+        export_format = request.accepted_renderer.format
+        stream = stream_tasks_csv if export_format == CSVRenderer.format else stream_tasks_ndjson
+        streaming_response = StreamingHttpResponse(
+            stream(response.tasks), content_type=request.accepted_renderer.media_type
+        )
+        streaming_response["Content-Disposition"] = f'attachment; filename="tasks.{export_format}"'
+        return streaming_response
+
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request: Request) -> Response:
+        """
+        Full-text search of the user's tasks by title and description (`?q=`), best matches first.
+        """
+        serializer = SearchTasksRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        use_case = SearchTasks(search_index=PostgresTaskSearchIndex())
+        try:
+            response = use_case.execute(SearchTasks.SearchTasksRequest(
+                user_id=request.user.id,
+                query=serializer.validated_data["q"],
+                page=serializer.validated_data["page"],
+                size=serializer.validated_data["size"],
+                links=serializer.validated_data.get("links", LINKS_FULL),
+            ))
+        except (InvalidTaskData, InvalidLinksMode) as err:
+            return Response({"error": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        if accepts_fast_json(request):
+            return json_response(render_task_list(response), status=status.HTTP_200_OK)
+        return Response(TaskListResponseSerializer(instance=response).data, status=status.HTTP_200_OK)
+
     def retrieve(self, request, pk=None):
         """
         Retrieve a specific task by its ID.
         """
-        use_case = GetTask(repository=DjangoOrmTaskRepository())
+        use_case = GetTask(repository=get_task_repository())
+        request_uc = GetTask.GetTaskRequest(task_id=pk, links=request.query_params.get('links', LINKS_FULL))
+        last_modified = use_case.version(request_uc)
+        etag = make_etag(request, pk, last_modified)
+        if last_modified is not None:
+            unchanged = not_modified(request, etag, last_modified)
+            if unchanged is not None:
+                return unchanged
         try:
-            response = use_case.execute(GetTask.GetTaskRequest(task_id=pk))
+            response = use_case.execute(request_uc)
         except (TaskNotFound) as err:
             return Response({"error": str(err)}, status=status.HTTP_404_NOT_FOUND)
+        except InvalidLinksMode as err:
+            return Response({"error": str(err)}, status=status.HTTP_400_BAD_REQUEST)
         serializer = TaskOutputSerializer(instance=response.data)
         data = serializer.data
         data["links"] = response.data.links
-        return Response(data, status=status.HTTP_200_OK)
+        # The body may come from a process-local cache that is behind the database, so
+        # the validators must describe the task actually sent, not the probed version.
+        last_modified = datetime.fromisoformat(response.data.updated_at)
+        etag = make_etag(request, pk, last_modified)
+        return with_validators(Response(data, status=status.HTTP_200_OK), etag, last_modified)
         
 
     def update(self, request, pk=None):
@@ -116,7 +274,7 @@ class TaskViewSet(viewsets.ViewSet):
         data = serializer.validated_data
         if "status" in data and isinstance(data["status"], str):
             data["status"] = TaskStatus(data["status"])
-        use_case = UpdateTask(repository=DjangoOrmTaskRepository())
+        use_case = UpdateTask(repository=get_task_repository())
         try:
             use_case.execute(
                 UpdateTask.UpdateTaskRequest(**data)
@@ -136,7 +294,7 @@ class TaskViewSet(viewsets.ViewSet):
         data = serializer.validated_data
         if "status" in data and isinstance(data["status"], str):
             data["status"] = TaskStatus(data["status"])
-        use_case = UpdateTask(repository=DjangoOrmTaskRepository())
+        use_case = UpdateTask(repository=get_task_repository())
         try:
             use_case.execute(
                 UpdateTask.UpdateTaskRequest(**data)
@@ -154,7 +312,7 @@ class TaskViewSet(viewsets.ViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        use_case = DeleteTask(repository=DjangoOrmTaskRepository())
+        use_case = DeleteTask(repository=get_task_repository())
         try:
             use_case.execute(
                 DeleteTask.DeleteTaskRequest(id=serializer.validated_data["id"])
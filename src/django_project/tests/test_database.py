@@ -0,0 +1,52 @@
+import pytest
+
+from src.django_project.database import build_database_settings, build_replica_settings
+
+
+def test_connections_persist_with_health_checks_by_default():
+    database = build_database_settings({"POSTGRES_HOST": "db.internal"})
+
+    assert database["HOST"] == "db.internal"
+    assert database["CONN_MAX_AGE"] == 60
+    assert database["CONN_HEALTH_CHECKS"] is True
+    assert database["DISABLE_SERVER_SIDE_CURSORS"] is False
+    assert "OPTIONS" not in database
+
+
+@pytest.mark.parametrize("value, expected", [("0", 0), ("600", 600), ("none", None), ("None", None)])
+def test_conn_max_age(value, expected):
+    assert build_database_settings({"POSTGRES_CONN_MAX_AGE": value})["CONN_MAX_AGE"] == expected
+
+
+def test_pool_is_tuned_from_the_environment_and_replaces_persistent_connections():
+    database = build_database_settings({
+        "POSTGRES_CONN_MAX_AGE": "600",
+        "POSTGRES_POOL": "true",
+        "POSTGRES_POOL_MIN_SIZE": "4",
+        "POSTGRES_POOL_MAX_SIZE": "20",
+        "POSTGRES_POOL_TIMEOUT": "2.5",
+        "POSTGRES_POOL_MAX_LIFETIME": "600",
+    })
+
+    assert database["CONN_MAX_AGE"] == 0
+    pool = database["OPTIONS"]["pool"]
+    assert (pool["min_size"], pool["max_size"], pool["timeout"], pool["max_lifetime"]) == (4, 20, 2.5, 600)
+
+
+def test_server_side_cursors_can_be_disabled_for_pgbouncer():
+    database = build_database_settings({"POSTGRES_DISABLE_SERVER_SIDE_CURSORS": "1", "POSTGRES_CONN_HEALTH_CHECKS": "off"})
+
+    assert database["DISABLE_SERVER_SIDE_CURSORS"] is True
+    assert database["CONN_HEALTH_CHECKS"] is False
+
+
+def test_one_alias_per_replica_host_mirroring_default_in_tests():
+    primary = build_database_settings({"POSTGRES_POOL": "true"})
+    replicas = build_replica_settings({"POSTGRES_REPLICA_HOSTS": "replica-a, replica-b:6543"}, primary)
+
+    assert list(replicas) == ["replica_1", "replica_2"]
+    assert [(replica["HOST"], replica["PORT"]) for replica in replicas.values()] == [("replica-a", "5432"), ("replica-b", "6543")]
+    assert replicas["replica_1"]["TEST"] == {"MIRROR": "default"}
+    assert replicas["replica_1"]["OPTIONS"] == primary["OPTIONS"]
+    assert replicas["replica_1"]["OPTIONS"] is not primary["OPTIONS"]
+    assert build_replica_settings({}, primary) == {}
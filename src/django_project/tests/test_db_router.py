@@ -0,0 +1,145 @@
+import uuid
+
+import pytest
+from django.db import connections, router, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.django_project.auth_app.principal_cache import get_principal_cache
+from src.django_project.db_router import act_as, get_primary_pins, primary_reads, read_intent, request_scope
+from src.django_project.task_app.models import Task as DjangoTaskModel
+from src.django_project.task_app.repository import DjangoOrmTaskRepository
+from src.django_project.task_app.task_cache import get_task_repository
+from src.django_project.user_app.models import User as DjangoUserModel
+from src.django_project.user_app.repository import DjangoORMUserRepository
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.READ_REPLICAS = {**settings.READ_REPLICAS, "ALIASES": ["replica"]}
+    get_primary_pins().clear()
+    yield
+    get_primary_pins().clear()
+
+
+def read_alias():
+    return DjangoUserModel.objects.all().db
+
+
+def test_reads_without_intent_or_replicas_use_the_primary(settings, replicas):
+    assert read_alias() == "default"
+
+    settings.READ_REPLICAS = {**settings.READ_REPLICAS, "ALIASES": []}
+    with read_intent():
+        assert read_alias() == "default"
+
+
+def test_reads_with_intent_use_a_replica_and_writes_the_primary(replicas):
+    with read_intent():
+        assert read_alias() == "replica"
+        assert DjangoUserModel.objects.all().select_for_update().db == "default"
+
+
+def test_a_write_pins_the_acting_user_to_the_primary(replicas):
+    with request_scope():
+        act_as(uuid.uuid4())
+        assert router.db_for_write(DjangoUserModel) == "default"
+
+        with read_intent():
+            assert read_alias() == "default"
+
+    with request_scope():
+        act_as(uuid.uuid4())
+        with read_intent():
+            assert read_alias() == "replica"
+
+
+@pytest.mark.django_db
+def test_reads_inside_a_transaction_use_the_primary(replicas):
+    with transaction.atomic(), read_intent():
+        assert read_alias() == "default"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def replica_alias(django_db_setup, django_db_blocker):
+    """A second alias to the test database, standing in for a streaming replica.
+
+    Module scoped, so it exists before the tests that list it in `databases` start.
+    """
+    connections.settings["replica"] = {**connections["default"].settings_dict, "TEST": {"MIRROR": "default"}}
+    yield connections["replica"]
+    with django_db_blocker.unblock():
+        connections["replica"].close()
+    del connections.settings["replica"]
+    del connections["replica"]
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+def test_requests_read_from_the_replica_until_the_user_writes(replica_alias, replicas, settings):
+    # Django's TestCase keeps the whole test in a transaction the replica cannot see.
+    settings.READ_REPLICAS = {**settings.READ_REPLICAS, "PIN_SECONDS": 60}
+    client = APIClient()
+    client.post('/api/users/', {"username": "replica", "email": "replica@gmail.com", "password": "securepassword123"}, format='json')
+    token = client.post('/auth/login/', {"username": "replica", "password": "securepassword123"}, format='json').data["token"]
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    user_id = DjangoUserModel.objects.get(username="replica").id
+    get_principal_cache().clear()
+
+    with CaptureQueriesContext(replica_alias) as on_replica:
+        assert client.get(f'/api/users/{user_id}/').status_code == status.HTTP_200_OK
+    # The version probe and the user itself; the JWT user is cached, so it comes from the primary.
+    assert [query["sql"].split(" WHERE ")[0].endswith('FROM "user"') for query in on_replica.captured_queries] == [True] * 2
+
+    assert client.post('/api/tasks/', {"title": "Pin me"}, format='json').status_code == status.HTTP_201_CREATED
+
+    with CaptureQueriesContext(replica_alias) as on_replica:
+        assert client.get(f'/api/users/{user_id}/').status_code == status.HTTP_200_OK
+    assert on_replica.captured_queries == []
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+def test_repository_reads_use_the_replica(replica_alias, replicas):
+    DjangoUserModel.objects.create(username="seen", email="seen@gmail.com", password="x")
+
+    with request_scope(), CaptureQueriesContext(replica_alias) as on_replica:
+        users = DjangoORMUserRepository().list()
+
+    assert [user.username for user in users] == ["seen"]
+    assert len(on_replica.captured_queries) == 1
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+def test_cached_task_reads_are_filled_from_the_primary(replica_alias, replicas):
+    user = DjangoUserModel.objects.create(username="filled", email="filled@gmail.com", password="x")
+    task = DjangoTaskModel.objects.create(title="Filled", description="")
+    task.users.add(user)
+    repository = get_task_repository()
+    repository.cache.clear()
+    repository.list_cache.clear()
+
+    with request_scope(), CaptureQueriesContext(replica_alias) as on_replica:
+        assert repository.get_by_id(task.id).title == "Filled"
+        assert repository.list_page(user.id, "title", 0, 10)[1] == 1
+        assert repository.collection_version(user.id)[1] == 1
+        # Without the cache in front, the same reads go to the replica.
+        DjangoOrmTaskRepository().get_by_id(task.id)
+
+    assert len(on_replica.captured_queries) == 2
+    repository.cache.clear()
+    repository.list_cache.clear()
+
+
+def test_primary_reads_override_read_intent(replicas):
+    with primary_reads(), read_intent():
+        assert read_alias() == "default"
+
+
+def test_pins_expire(replicas, settings):
+    settings.READ_REPLICAS = {**settings.READ_REPLICAS, "PIN_SECONDS": 0}
+    with request_scope():
+        act_as(uuid.uuid4())
+        router.db_for_write(DjangoUserModel)
+
+        with read_intent():
+            assert read_alias() == "replica"
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
 
 
 from rest_framework.routers import DefaultRouter
@@ -13,6 +14,9 @@ from drf_yasg import openapi
 from src.django_project.user_app.views import UserViewSet
 from src.django_project.task_app.views import TaskViewSet
 from src.django_project.auth_app.views import AuthenticateUserView
+from src.django_project.auth_app.async_views import AsyncAuthenticateUserView
+from src.django_project.task_app.async_views import AsyncTaskListView, AsyncTaskDetailView
+from src.django_project.user_app.async_views import AsyncUserListView, AsyncUserDetailView
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -33,4 +37,11 @@ urlpatterns = [
     path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
     path("admin/", admin.site.urls),
     path('auth/login/', AuthenticateUserView.as_view(), name='auth-login'),
+    # Async (ASGI-native) variants of the read endpoints and login; serve with
+    # an ASGI server (`django_project.asgi:application`) to run them on the event loop.
+    path('api/async/auth/login/', csrf_exempt(AsyncAuthenticateUserView.as_view()), name='async-auth-login'),
+    path('api/async/tasks/', AsyncTaskListView.as_view(), name='async-tasks-list'),
+    path('api/async/tasks/<str:pk>/', csrf_exempt(AsyncTaskDetailView.as_view()), name='async-tasks-detail'),
+    path('api/async/users/', AsyncUserListView.as_view(), name='async-users-list'),
+    path('api/async/users/<str:pk>/', AsyncUserDetailView.as_view(), name='async-users-detail'),
 ] + router.urls
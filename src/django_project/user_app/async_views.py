@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.http import JsonResponse
+from rest_framework import status
+
+from src.adapters.cursor.signed_cursor_adapter import SignedCursorAdapter
+from src.core._shared.links import LINKS_FULL, InvalidLinksMode
+from src.core.user.application.exceptions import InvalidUser, UserNotFound, InvalidCursor
+from src.core.user.application.use_cases.get_user import GetUser
+from src.core.user.application.use_cases.list_users import ListUsers, InvalidOrderBy
+from src.django_project.auth_app.async_views import AsyncAPIView
+from src.django_project.json_renderer import json_response
+from src.django_project.user_app.renderers import render_user_list
+from src.django_project.user_app.repository import DjangoORMUserRepository
+from src.django_project.user_app.serializers import (
+    RetrieveUserRequestSerializer,
+    RetrieveUserResponseSerializer,
+)
+
+
+class AsyncUserListView(AsyncAPIView):
+    """ASGI-native `GET /api/async/users/`, same contract as `UserViewSet.list`."""
+
+    async def get(self, request):
+        use_case = ListUsers(
+            repository=DjangoORMUserRepository(),
+            cursor_adapter=SignedCursorAdapter(secret_key=settings.SECRET_KEY),
+        )
+        request_data = {
+            "order_by": request.GET.get("order_by", "username"),
+            "current_page": int(request.GET.get("page", 1)),
+            "page_size": int(request.GET.get("size", 10)),
+            "cursor": request.GET.get("cursor"),
+            "links": request.GET.get("links", LINKS_FULL),
+        }
+
+        try:
+            response = await use_case.aexecute(ListUsers.ListUsersRequest(**request_data))
+        except (InvalidOrderBy, InvalidCursor, InvalidLinksMode) as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return json_response(render_user_list(response), status=status.HTTP_200_OK)
+
+
+class AsyncUserDetailView(AsyncAPIView):
+    """ASGI-native `GET /api/async/users/<pk>/`."""
+
+    async def get(self, request, pk):
+        serializer = RetrieveUserRequestSerializer(data={"id": pk})
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = GetUser(repository=DjangoORMUserRepository())
+        try:
+            response = await use_case.aexecute(
+                request=GetUser.GetUserRequest(
+                    id=serializer.validated_data["id"],
+                    links=request.GET.get("links", LINKS_FULL),
+                )
+            )
+        except (UserNotFound, InvalidUser) as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except InvalidLinksMode as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return JsonResponse(RetrieveUserResponseSerializer(response).data, status=status.HTTP_200_OK)
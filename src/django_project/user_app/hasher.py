@@ -0,0 +1,21 @@
+from django.conf import settings
+
+from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher
+from src.adapters.hash.hash_adapter_interface import PasswordHasherInterface
+from src.adapters.hash.pooled_hasher_adapter import PooledPasswordHasher
+
+_password_hasher = None
+
+
+def get_password_hasher() -> PasswordHasherInterface:
+    """Return the process wide password hasher, configured by `settings.PASSWORD_HASHER_POOL`."""
+    global _password_hasher
+    if _password_hasher is None:
+        config = settings.PASSWORD_HASHER_POOL
+        _password_hasher = PooledPasswordHasher(
+            BcryptPasswordHasher(rounds=settings.BCRYPT_ROUNDS),
+            max_workers=config["MAX_WORKERS"],
+            max_pending=config["MAX_PENDING"],
+            use_processes=config["EXECUTOR"] == "process",
+        )
+    return _password_hasher
@@ -4,9 +4,11 @@ from django.db import models
 
 class User(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    username = models.CharField(max_length=150)
-    email = models.EmailField(max_length=254)
+    username = models.CharField(max_length=150, unique=True)
+    email = models.EmailField(max_length=254, unique=True)
     password = models.CharField(max_length=128)
+    # Bumped by every save; the version of the user for conditional requests.
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.username
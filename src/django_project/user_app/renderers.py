@@ -0,0 +1,29 @@
+from src.core.user.application.use_cases.list_users import ListUsers, UserOutput
+from src.django_project.json_renderer import render_json
+
+
+def user_output_to_primitive(user: UserOutput) -> dict:
+    """`UserResponseSerializer(user).data` without the per-field serializer machinery."""
+    return {
+        "id": None if user.id is None else str(user.id),
+        "username": None if user.username is None else str(user.username),
+        "email": None if user.email is None else str(user.email),
+        "is_active": bool(getattr(user, "is_active", True)),
+        "links": None if user.links is None else {
+            str(key): None if value is None else str(value) for key, value in user.links.items()
+        },
+    }
+
+
+def render_user_list(response: ListUsers.ListUsersResponse) -> bytes:
+    """Render the body of `GET /api/users/` straight to JSON bytes."""
+    return render_json({
+        "data": [user_output_to_primitive(user) for user in response.data],
+        "meta": {
+            "total_users": response.meta.total_users,
+            "current_page": response.meta.current_page,
+            "page_size": response.meta.page_size,
+            "query_params": response.meta.query_params,
+        },
+        "links": response.links,
+    })
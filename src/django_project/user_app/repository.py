@@ -1,21 +1,43 @@
+from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Any, List, Optional, Set, Tuple
 
+from django.db import IntegrityError
+from django.db.models import Count, Max, Q
+
+from src.core.user.application.exceptions import UserAlreadyExists
 from src.core.user.domain.user import User
 from src.core.user.domain.user_repository_interface import UserRepositoryInterface
+from src.core.user.domain.async_user_repository_interface import AsyncUserRepositoryInterface
 
+from src.django_project.db_router import replica_read
 from src.django_project.user_app.models import User as DjangoUserModel
 
-class DjangoORMUserRepository(UserRepositoryInterface):
-    """Django ORM implementation of the UserRepositoryInterface."""
+class DjangoORMUserRepository(UserRepositoryInterface, AsyncUserRepositoryInterface):
+    """Django ORM implementation of the UserRepositoryInterface and its async counterpart."""
 
     def __init__(self, user_model: DjangoUserModel = DjangoUserModel) -> None:
         self.user_model = user_model
 
     def save(self, user: User) -> User:
-        """Save a user entity to the database."""
-        user_orm = UserModelMapper.to_model(user)
-        user_orm.save()
+        """Insert a user entity, or update it when a user with its id already exists.
+
+        Raises UserAlreadyExists when another user has the same email or username.
+        """
+        try:
+            self.user_model.objects.update_or_create(
+                id=user.id,
+                defaults={
+                    "username": user.username,
+                    "email": user.email,
+                    "password": user.password,
+                },
+            )
+        except IntegrityError as err:
+            raise UserAlreadyExists(
+                f"User with email {user.email} or username {user.username} already exists."
+            ) from err
+        return user
 
     def get_by_email(self, email: str) -> User | None:
         """Get a user by email."""
@@ -33,6 +55,7 @@ class DjangoORMUserRepository(UserRepositoryInterface):
             return None
 
         
+    @replica_read
     def list(self, user_id: UUID = None) -> list[User]:
         queryset = self.user_model.objects.all()
         if user_id is not None:
@@ -40,6 +63,7 @@ class DjangoORMUserRepository(UserRepositoryInterface):
         return [UserModelMapper.to_entity(user_model) for user_model in queryset]
 
     
+    @replica_read
     def get_user_by_id(self, user_id: UUID) -> User | None:
         """Get a user by their unique identifier."""
         try:
@@ -48,6 +72,88 @@ class DjangoORMUserRepository(UserRepositoryInterface):
         except self.user_model.DoesNotExist:
             return None
         
+    @replica_read
+    def list_after(
+        self, order_by: str, after: Optional[Tuple[Any, UUID]], limit: int
+    ) -> Tuple[List[User], int]:
+        """List users after a `(value, id)` key with a `WHERE (col, id) > (...)` seek."""
+        queryset = self.user_model.objects.all()
+        total = queryset.count()
+        if after is not None:
+            value, last_id = after
+            queryset = queryset.filter(**{f"{order_by}__gte": value}).filter(
+                Q(**{f"{order_by}__gt": value}) | Q(id__gt=last_id)
+            )
+        page = queryset.order_by(order_by, "id")[:limit]
+        return [UserModelMapper.to_entity(user_model) for user_model in page], total
+
+    def find_missing_ids(self, user_ids: Set[UUID]) -> Set[UUID]:
+        """Return the ids that do not exist, using a single `id IN (...)` query."""
+        if not user_ids:
+            return set()
+        found = set(
+            self.user_model.objects.filter(id__in=user_ids).values_list("id", flat=True)
+        )
+        return {user_id for user_id in user_ids if UUID(str(user_id)) not in found}
+
+    @replica_read
+    def get_version(self, user_id: UUID) -> Optional[datetime]:
+        """`SELECT updated_at ... WHERE id = %s`, by primary key."""
+        return self.user_model.objects.filter(id=user_id).values_list("updated_at", flat=True).first()
+
+    @replica_read
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """`max(updated_at)` and `count(*)` in one aggregate query."""
+        version = self.user_model.objects.aggregate(last_modified=Max("updated_at"), count=Count("id"))
+        return version["last_modified"], version["count"]
+
+    async def asave(self, user: User) -> User:
+        try:
+            await self.user_model.objects.aupdate_or_create(
+                id=user.id,
+                defaults={
+                    "username": user.username,
+                    "email": user.email,
+                    "password": user.password,
+                },
+            )
+        except IntegrityError as err:
+            raise UserAlreadyExists(
+                f"User with email {user.email} or username {user.username} already exists."
+            ) from err
+        return user
+
+    @replica_read
+    async def alist(self) -> List[User]:
+        return [UserModelMapper.to_entity(user_model) async for user_model in self.user_model.objects.all()]
+
+    @replica_read
+    async def aget_user_by_id(self, user_id: UUID) -> User | None:
+        try:
+            return UserModelMapper.to_entity(await self.user_model.objects.aget(id=user_id))
+        except self.user_model.DoesNotExist:
+            return None
+
+    async def aget_user_by_username(self, username: str) -> Optional[User]:
+        try:
+            return UserModelMapper.to_entity(await self.user_model.objects.aget(username=username))
+        except self.user_model.DoesNotExist:
+            return None
+
+    @replica_read
+    async def alist_after(
+        self, order_by: str, after: Optional[Tuple[Any, UUID]], limit: int
+    ) -> Tuple[List[User], int]:
+        queryset = self.user_model.objects.all()
+        total = await queryset.acount()
+        if after is not None:
+            value, last_id = after
+            queryset = queryset.filter(**{f"{order_by}__gte": value}).filter(
+                Q(**{f"{order_by}__gt": value}) | Q(id__gt=last_id)
+            )
+        page = queryset.order_by(order_by, "id")[:limit]
+        return [UserModelMapper.to_entity(user_model) async for user_model in page], total
+
 class UserModelMapper:
     @staticmethod
     def to_model(user: User) -> DjangoUserModel:
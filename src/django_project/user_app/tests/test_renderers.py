@@ -0,0 +1,54 @@
+import uuid
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from src.core.user.application.use_cases.list_users import ListUsers
+from src.core.user.domain.user import User
+from src.core.user.infra.in_memory_user_repository import InMemoryUserRepository
+from src.django_project.user_app.renderers import render_user_list
+from src.django_project.user_app.serializers import UserResponseSerializer
+
+
+def drf_bytes(response) -> bytes:
+    """The body `UserViewSet.list` builds through the serializers."""
+    return JSONRenderer().render({
+        "data": UserResponseSerializer(response.data, many=True).data,
+        "meta": {
+            "total_users": response.meta.total_users,
+            "current_page": response.meta.current_page,
+            "page_size": response.meta.page_size,
+            "query_params": response.meta.query_params,
+        },
+        "links": response.links,
+    })
+
+
+class TestRenderUserList:
+    @pytest.mark.parametrize("links", ["full", "minimal", "none"])
+    def test_bytes_match_the_serializer(self, links):
+        repository = InMemoryUserRepository([
+            User(username="joão ", email="joao@gmail.com", password="securepassword123"),
+            User(username="ana", email="ana@gmail.com", password="securepassword123"),
+        ])
+        response = ListUsers(repository).execute(ListUsers.ListUsersRequest(page_size=1, links=links))
+
+        assert render_user_list(response) == drf_bytes(response)
+
+    def test_golden_output(self):
+        user_id = uuid.UUID("5c3e0a52-2b6f-4c8e-8a55-3f8b0d6c1e22")
+        repository = InMemoryUserRepository([
+            User(id=user_id, username="ana", email="ana@gmail.com", password="securepassword123"),
+        ])
+        response = ListUsers(repository).execute(ListUsers.ListUsersRequest(links="minimal"))
+
+        assert render_user_list(response) == (
+            '{"data":[{"id":"5c3e0a52-2b6f-4c8e-8a55-3f8b0d6c1e22","username":"ana","email":"ana@gmail.com",'
+            '"is_active":true,"links":{"self":"/api/users/5c3e0a52-2b6f-4c8e-8a55-3f8b0d6c1e22"}}],'
+            '"meta":{"total_users":1,"current_page":1,"page_size":10,'
+            '"query_params":{"order_by":"username","page":1,"size":10,"links":"minimal"}},'
+            '"links":{"self":"/api/users?page=1&size=10&order_by=username&links=minimal","next":null,"prev":null,'
+            '"first":"/api/users?page=1&size=10&order_by=username&links=minimal",'
+            '"last":"/api/users?page=1&size=10&order_by=username&links=minimal",'
+            '"create":{"method":"POST","href":"/api/users","description":"Create a new user with params: username, email, password and is_active (optional)"}}}'
+        ).encode()
@@ -1,4 +1,9 @@
+import uuid
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.core.user.application.exceptions import UserAlreadyExists
 
 from src.core.user.domain.user import User
 
@@ -24,4 +29,70 @@ class TestSave:
         assert user_db.username == user.username
         assert user_db.email == user.email
         assert user_db.password == user.password
- 
\ No newline at end of file
+
+    def test_save_existing_user_updates_it(self):
+        user = User(
+            username="testuser",
+            email="testuser@gmail.com",
+            password="securepassword123"
+        )
+        repository = DjangoORMUserRepository()
+        repository.save(user)
+
+        user.password = "rehashed"
+        repository.save(user)
+
+        assert DjangoUserModel.objects.count() == 1
+        assert DjangoUserModel.objects.get().password == "rehashed"
+ 
+
+@pytest.mark.django_db
+class TestFindMissingIds:
+    def test_find_missing_ids_with_a_single_query(self, django_assert_num_queries):
+        user = User(
+            username="testuser",
+            email="testuser@gmail.com",
+            password="securepassword123"
+        )
+        repository = DjangoORMUserRepository()
+        repository.save(user)
+        unknown_id = uuid.uuid4()
+
+        with django_assert_num_queries(1):
+            missing = repository.find_missing_ids({user.id, unknown_id})
+
+        assert missing == {unknown_id}
+
+
+@pytest.mark.django_db
+class TestUniqueEmailAndUsername:
+    @pytest.mark.parametrize("username, email", [
+        ("testuser", "other@gmail.com"),
+        ("other", "testuser@gmail.com"),
+    ])
+    def test_save_raises_on_duplicate_email_or_username(self, username, email):
+        repository = DjangoORMUserRepository()
+        repository.save(User(username="testuser", email="testuser@gmail.com", password="securepassword123"))
+
+        with pytest.raises(UserAlreadyExists):
+            repository.save(User(username=username, email=email, password="securepassword123"))
+
+        assert DjangoUserModel.objects.count() == 1
+
+    @pytest.mark.parametrize("lookup", [
+        lambda repository: repository.get_by_email("testuser@gmail.com"),
+        lambda repository: repository.get_user_by_username("testuser"),
+    ])
+    def test_lookups_use_the_unique_indexes(self, lookup):
+        repository = DjangoORMUserRepository()
+        repository.save(User(username="testuser", email="testuser@gmail.com", password="securepassword123"))
+
+        with CaptureQueriesContext(connection) as context:
+            assert lookup(repository) is not None
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {context.captured_queries[0]['sql']}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        assert "Index Scan" in plan
+        assert "Seq Scan" not in plan
@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy
 from src.django_project.user_app.models import User as DjangoUserModel
 
 @pytest.mark.django_db
@@ -34,7 +37,7 @@ class TestUserEndpoint(APITestCase):
         response = self.client.get('/api/users/')
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.data
+        data = response.json()
         if isinstance(data, dict) and "data" in data:
             data = data["data"]
         assert len(data) == 1
@@ -95,4 +98,62 @@ class TestUserEndpoint(APITestCase):
             },
             format='json'
         )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
\ No newline at end of file
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_user_when_password_hasher_is_busy(self):
+        with patch("src.django_project.user_app.views.get_password_hasher") as get_hasher:
+            get_hasher.return_value.hash.side_effect = HasherBusy("busy")
+            response = self.client.post(
+                '/api/users/',
+                {
+                    "username": "busyuser",
+                    "email": "busyuser@gmail.com",
+                    "password": "securepassword123"
+                },
+                format='json'
+            )
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+@pytest.mark.django_db
+class TestUserConditionalGet(APITestCase):
+    def setUp(self):
+        self.client.post(
+            '/api/users/',
+            {"username": "testuser", "email": "teste@gmail.com", "password": "securepassword123"},
+            format='json'
+        )
+        login_response = self.client.post(
+            '/auth/login/',
+            {"username": "testuser", "password": "securepassword123"},
+            format='json'
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {login_response.data["token"]}')
+        self.user = DjangoUserModel.objects.get(username="testuser")
+
+    def test_unchanged_list_is_not_modified_until_a_user_is_created(self):
+        response = self.client.get('/api/users/')
+        etag = response["ETag"]
+        assert "Last-Modified" not in response
+
+        assert self.client.get('/api/users/', HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        assert self.client.get('/api/users/?size=5', HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+        self.client.post(
+            '/api/users/',
+            {"username": "other", "email": "other@gmail.com", "password": "securepassword123"},
+            format='json'
+        )
+        response = self.client.get('/api/users/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_unchanged_user_is_not_modified(self):
+        url = f'/api/users/{self.user.id}/'
+        response = self.client.get(url)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified["ETag"] == response["ETag"]
+        since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        assert since.status_code == status.HTTP_304_NOT_MODIFIED
@@ -6,16 +6,24 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.decorators import action, permission_classes
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 
-from src.adapters.hash.bcrypt_adapter import BcryptPasswordHasher
+from django.conf import settings
 
-from src.core.user.application.exceptions import UserAlreadyExists, InvalidUser, UserNotFound
+from src.adapters.cursor.signed_cursor_adapter import SignedCursorAdapter
+from src.adapters.hash.pooled_hasher_adapter import HasherBusy
+from src.core._shared.links import LINKS_FULL, InvalidLinksMode
+
+from src.core.user.application.exceptions import UserAlreadyExists, InvalidUser, UserNotFound, InvalidCursor
 from src.core.user.application.use_cases.create_user import CreateUser
 from src.core.user.application.use_cases.list_users import ListUsers, InvalidOrderBy
 from src.core.user.application.use_cases.get_user import GetUser
 
 from src.django_project.auth_app.views import JWTAuthentication
 
+from src.django_project.user_app.hasher import get_password_hasher
 from src.django_project.user_app.repository import DjangoORMUserRepository
+from src.django_project.user_app.renderers import render_user_list
+from src.django_project.json_renderer import accepts_fast_json, json_response
+from src.django_project.conditional import make_etag, not_modified, with_validators
 from src.django_project.user_app.serializers import (
     CreateUserRequestSerializer,
     CreateUserResponseSerializer,
@@ -43,7 +51,7 @@ class UserViewSet(viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
         use_case = CreateUser(
             repository=DjangoORMUserRepository(),
-            password_hasher=BcryptPasswordHasher(),
+            password_hasher=get_password_hasher(),
         )
         try:
             response = use_case.execute(
@@ -56,6 +64,11 @@ class UserViewSet(viewsets.ViewSet):
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        except HasherBusy as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
 
         response_serializer = CreateUserResponseSerializer(response)
         return Response(
@@ -65,21 +78,39 @@ class UserViewSet(viewsets.ViewSet):
     
     @staticmethod
     def list(request: Request) -> Response:
-        use_case = ListUsers(repository=DjangoORMUserRepository())
+        use_case = ListUsers(
+            repository=DjangoORMUserRepository(),
+            cursor_adapter=SignedCursorAdapter(secret_key=settings.SECRET_KEY),
+        )
         request_data = {
             "order_by": request.query_params.get("order_by", "username"),
             "current_page": int(request.query_params.get("page", 1)),
             "page_size": int(request.query_params.get("size", 10)),
+            "cursor": request.query_params.get("cursor"),
+            "links": request.query_params.get("links", LINKS_FULL),
         }
 
         try:
-            response = use_case.execute(ListUsers.ListUsersRequest(**request_data))
-        except InvalidOrderBy as e:
+            request_uc = ListUsers.ListUsersRequest(**request_data)
+            last_modified, count = use_case.version(request_uc)
+            etag = make_etag(request, last_modified, count)
+            # ETag only: a delete can lower the count without moving the newest timestamp,
+            # so `Last-Modified` alone would answer `If-Modified-Since` with a stale 304.
+            unchanged = not_modified(request, etag, None)
+            if unchanged is not None:
+                return unchanged
+            response = use_case.execute(request_uc)
+        except (InvalidOrderBy, InvalidCursor, InvalidLinksMode) as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if accepts_fast_json(request):
+            return with_validators(
+                json_response(render_user_list(response), status=status.HTTP_200_OK), etag, None
+            )
+
         users_serializer = UserResponseSerializer(response.data, many=True)
         
         meta = {
@@ -88,14 +119,14 @@ class UserViewSet(viewsets.ViewSet):
             "page_size": response.meta.page_size,
             "query_params": response.meta.query_params,
         }
-        return Response(
+        return with_validators(Response(
             {
                 "data": users_serializer.data,
                 "meta": meta,
                 "links": response.links,
             },
             status=status.HTTP_200_OK,
-        )
+        ), etag, None)
     
     @staticmethod
     def retrieve(request: Request, pk=None) -> Response:
@@ -105,20 +136,31 @@ class UserViewSet(viewsets.ViewSet):
         use_case = GetUser(
             repository=DjangoORMUserRepository(),
         )
+        request_uc = GetUser.GetUserRequest(
+            id=serializer.validated_data["id"],
+            links=request.query_params.get("links", LINKS_FULL),
+        )
+        last_modified = use_case.version(request_uc)
+        etag = make_etag(request, request_uc.id, last_modified)
+        if last_modified is not None:
+            unchanged = not_modified(request, etag, last_modified)
+            if unchanged is not None:
+                return unchanged
         try:
-            response = use_case.execute(
-                request=GetUser.GetUserRequest(
-                    id=serializer.validated_data["id"]
-                )
-            )
+            response = use_case.execute(request=request_uc)
         except (UserNotFound,InvalidUser) as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        except InvalidLinksMode as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         response_serializer = RetrieveUserResponseSerializer(response)
 
-        return Response(
+        return with_validators(Response(
             response_serializer.data,
             status=status.HTTP_200_OK,
-        )
+        ), etag, last_modified)